@@ -0,0 +1,429 @@
+# 智播农链销售平台数据接口
+#
+# 独立的 asyncio HTTP/1.1 服务，直接调用 data.py 的数据访问函数（与 Streamlit 界面共用数据层），
+# 供小程序、物流对接和直播叠加层等以 JSON / NDJSON 读取产品、订单、直播间和问答数据：
+# - 长连接（HTTP/1.1 默认 keep-alive，支持流水线请求），空闲超过 keepalive_timeout 秒后关闭
+# - 响应按 (接口, 数据版本, 请求地址) 缓存编码好的字节，ETag 由同样的键计算，
+#   If-None-Match 命中时直接返回 304，不查询数据也不读取缓存
+# - 列表接口分页（offset/limit 或订单游标），*.ndjson 接口以 chunked 编码逐页流式输出
+# 已缓存的响应在事件循环内直接返回；未命中时在线程池中查询和编码，不阻塞其他连接。
+#
+# 用法：python api.py [--host 127.0.0.1] [--port 8600]
+
+import argparse
+import asyncio
+import hashlib
+import json
+import re
+import time
+from datetime import date, datetime
+from http import HTTPStatus
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import numpy as np
+
+import data
+from cache import LRUCache
+from config import API, FAQ_SEARCH, PLATFORM_INFO, TRANSFER
+
+MAX_HEADER_BYTES = 64 * 1024
+
+_responses = LRUCache(API["cache_size"])
+
+
+class HTTPError(Exception):
+    """以指定状态码结束请求"""
+
+    def __init__(self, status, message=None):
+        super().__init__(message or HTTPStatus(status).phrase)
+        self.status = status
+
+
+class Request:
+    """一个 HTTP 请求（只解析接口用到的部分）"""
+
+    def __init__(self, method, target, version, headers):
+        self.method = method
+        self.version = version
+        self.headers = headers
+        url = urlsplit(target)
+        self.target = target
+        self.path = unquote(url.path)
+        self.query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+    @property
+    def keep_alive(self):
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+    def int_arg(self, name, default=0, minimum=0, maximum=None):
+        value = self.query.get(name)
+        if value is None:
+            return default
+        try:
+            value = int(value)
+        except ValueError:
+            raise HTTPError(400, f"参数 {name} 应为整数") from None
+        value = max(minimum, value)
+        return value if maximum is None else min(maximum, value)
+
+    def page_args(self):
+        """offset/limit 分页参数（limit 不超过 max_page_size）"""
+        return (
+            self.int_arg("offset"),
+            self.int_arg("limit", API["page_size"], minimum=1, maximum=API["max_page_size"]),
+        )
+
+
+class Response:
+    """响应：body 为完整字节，或 chunks 为逐块产出字节的迭代器（流式输出）"""
+
+    def __init__(self, status=200, body=b"", content_type="application/json; charset=utf-8",
+                 etag=None, chunks=None):
+        self.status = status
+        self.body = body
+        self.content_type = content_type
+        self.etag = etag
+        self.chunks = chunks
+
+
+def _default(value):
+    """JSON 编码 numpy 数值、日期和元组"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"无法编码为 JSON: {type(value).__name__}")
+
+
+def encode_json(payload):
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=_default).encode()
+
+
+def etag_for(key):
+    """由 (接口, 数据版本, 请求地址) 计算 ETag，不需要先生成响应"""
+    return '"' + hashlib.blake2b(repr(key).encode(), digest_size=12).hexdigest() + '"'
+
+
+def not_modified(request, etag):
+    match = request.headers.get("if-none-match")
+    return match is not None and (match == "*" or etag in (tag.strip() for tag in match.split(",")))
+
+
+async def cached_json(request, name, version, build):
+    """按 (接口, 数据版本, 请求地址) 缓存的 JSON 响应；build 为无参函数，返回可编码为 JSON 的对象"""
+    key = (name, version, request.target)
+    etag = etag_for(key)
+    if not_modified(request, etag):
+        return Response(304, etag=etag)
+    item = _responses.get(key, time.time())
+    if item is None:
+        body = await asyncio.get_running_loop().run_in_executor(None, lambda: encode_json(build()))
+        _responses.put(key, body, float("inf"))
+    else:
+        body = item[1]
+    return Response(body=body, etag=etag)
+
+
+def ndjson(pages):
+    """逐页产出 NDJSON 字节：pages 产出若干行（每行一个对象）的列表"""
+    for rows in pages:
+        if rows:
+            yield b"".join(encode_json(row) + b"\n" for row in rows)
+
+
+# ---- 接口 ----
+
+ROUTES = []
+
+
+def route(pattern):
+    """注册 GET 接口，pattern 中的命名分组作为关键字参数传给处理函数"""
+    def register(handler):
+        ROUTES.append((re.compile(f"^{pattern}$"), handler))
+        return handler
+    return register
+
+
+@route("/healthz")
+async def healthz(request):
+    return Response(body=encode_json({"status": "ok", "version": PLATFORM_INFO["version"]}))
+
+
+@route("/api/products")
+async def list_products(request):
+    offset, limit = request.page_args()
+    sort_by = request.query.get("sort")
+    descending = request.query.get("order", "desc") != "asc"
+
+    def build():
+        try:
+            products, total = data.search_products(
+                request.query.get("q"), request.query.get("category"), sort_by, descending, offset, limit
+            )
+        except ValueError as exc:
+            raise HTTPError(400, str(exc)) from None
+        return {"items": [p.to_dict() for p in products], "total": total, "offset": offset, "limit": limit}
+
+    return await cached_json(request, "products", data.data_version("products"), build)
+
+
+@route("/api/products/(?P<product_id>[^/]+)")
+async def get_product(request, product_id):
+    def build():
+        product = data.get_product_catalog().get(product_id)
+        if product is None:
+            raise HTTPError(404, f"产品不存在: {product_id}")
+        return product.to_dict()
+
+    return await cached_json(request, "product", data.data_version("products"), build)
+
+
+def _order_filters(request):
+    """订单筛选参数：status（可逗号分隔多个）、start/end（YYYY-MM-DD）、prefix（订单号前缀）"""
+    filters = {}
+    if "status" in request.query:
+        filters["statuses"] = request.query["status"].split(",")
+    for name in ("start", "end"):
+        if name in request.query:
+            try:
+                filters[name] = date.fromisoformat(request.query[name])
+            except ValueError:
+                raise HTTPError(400, f"参数 {name} 应为 YYYY-MM-DD") from None
+    if "prefix" in request.query:
+        filters["id_prefix"] = request.query["prefix"]
+    return filters
+
+
+@route("/api/orders")
+async def list_orders(request):
+    filters = _order_filters(request)
+    limit = request.int_arg("limit", API["page_size"], minimum=1, maximum=API["max_page_size"])
+    cursor = request.query.get("cursor")
+
+    def build():
+        try:
+            page = data.get_order_index().query(cursor=cursor, limit=limit, **filters)
+        except (KeyError, ValueError) as exc:
+            raise HTTPError(400, str(exc)) from None
+        return {
+            "items": data.get_order_store().records(page.rows),
+            "total": page.total,
+            "next_cursor": page.next_cursor,
+        }
+
+    return await cached_json(request, "orders", data.data_version("orders"), build)
+
+
+@route("/api/orders.ndjson")
+async def stream_orders(request):
+    filters = _order_filters(request)
+    etag = etag_for(("orders.ndjson", data.data_version("orders"), request.target))
+    if not_modified(request, etag):
+        return Response(304, etag=etag)
+    index, store = data.get_order_index(), data.get_order_store()
+    # 第一页在发送响应头之前查询，筛选参数有误时返回 400 而不是中断的 200
+    try:
+        first = index.query(limit=TRANSFER["chunk_size"], **filters)
+    except (KeyError, ValueError) as exc:
+        raise HTTPError(400, str(exc)) from None
+
+    def pages():
+        page = first
+        while True:
+            yield store.records(page.rows)
+            if page.next_cursor is None:
+                break
+            page = index.query(cursor=page.next_cursor, limit=TRANSFER["chunk_size"], **filters)
+
+    return Response(content_type="application/x-ndjson; charset=utf-8", etag=etag, chunks=ndjson(pages()))
+
+
+@route("/api/live/rooms")
+async def list_live_rooms(request):
+    # 观众数和销售额实时变化，以各直播间当前的数值作为版本
+    rooms = data.get_live_rooms()
+    version = tuple((room["id"], room["viewers"], room["sales"]) for room in rooms)
+    return await cached_json(request, "live/rooms", version, lambda: {"items": rooms})
+
+
+@route("/api/live/rooms/(?P<room_id>[^/]+)/metrics(?P<suffix>\\.ndjson)?")
+async def live_room_metrics(request, room_id, suffix):
+    """直播间最近 seconds 秒的逐秒数据：JSON 为按列的数组，.ndjson 为每秒一行"""
+    if room_id not in {room["id"] for room in data.get_live_data()["live_rooms"]}:
+        raise HTTPError(404, f"直播间不存在: {room_id}")
+    series = data.get_live_metrics().room(room_id)
+    seconds = request.int_arg("seconds", 60, minimum=1, maximum=series.capacity)
+    version = (series.last_time, series.total_orders)
+    if not suffix:
+        def build():
+            from live_metrics import METRICS
+
+            times, window = series.recent(seconds, copy=True)
+            return {"time": times, **{name: window[i] for i, name in enumerate(METRICS)}}
+
+        return await cached_json(request, "live/metrics", version, build)
+
+    etag = etag_for(("live/metrics.ndjson", version, request.target))
+    if not_modified(request, etag):
+        return Response(304, etag=etag)
+    from live_metrics import METRICS
+
+    times, window = series.recent(seconds, copy=True)
+    rows = [dict(zip(("time", *METRICS), values)) for values in zip(times.tolist(), *window.tolist())]
+    chunk = API["page_size"]
+    return Response(
+        content_type="application/x-ndjson; charset=utf-8", etag=etag,
+        chunks=ndjson(rows[i:i + chunk] for i in range(0, len(rows), chunk)),
+    )
+
+
+@route("/api/faq")
+async def list_faq(request):
+    offset, limit = request.page_args()
+    text = request.query.get("q", "").strip()
+
+    def build():
+        if text:
+            matches = data.get_faq_index().search(text, top_k=offset + limit, min_score=FAQ_SEARCH["min_score"])
+            items = [
+                {"question": m.question, "answer": m.answer, "category": m.category, "score": m.score}
+                for m in matches[offset:]
+            ]
+            return {"items": items, "total": len(matches), "offset": offset, "limit": limit}
+        faqs = data.get_faq_data()
+        category = request.query.get("category")
+        if category:
+            faqs = [faq for faq in faqs if faq["category"] == category]
+        return {
+            "items": [faq.to_dict() for faq in faqs[offset:offset + limit]],
+            "total": len(faqs), "offset": offset, "limit": limit,
+        }
+
+    return await cached_json(request, "faq", data.data_version("faq"), build)
+
+
+async def dispatch(request):
+    if request.method not in ("GET", "HEAD"):
+        raise HTTPError(405)
+    for pattern, handler in ROUTES:
+        match = pattern.match(request.path)
+        if match:
+            return await handler(request, **match.groupdict())
+    raise HTTPError(404, f"接口不存在: {request.path}")
+
+
+# ---- HTTP 连接 ----
+
+def _head(status, headers):
+    lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+    lines.extend(f"{name}: {value}" for name, value in headers)
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def write_response(writer, request, response, keep_alive):
+    headers = [("Connection", "keep-alive" if keep_alive else "close")]
+    if response.etag:
+        headers.append(("ETag", response.etag))
+    if response.status == 304:
+        writer.write(_head(304, headers))
+        return
+    headers.append(("Content-Type", response.content_type))
+    if response.chunks is None:
+        headers.append(("Content-Length", str(len(response.body))))
+        writer.write(_head(response.status, headers))
+        if request is None or request.method != "HEAD":
+            writer.write(response.body)
+        return
+
+    headers.append(("Transfer-Encoding", "chunked"))
+    writer.write(_head(response.status, headers))
+    if request.method == "HEAD":
+        # HEAD 响应没有正文，也不发送结束块
+        return
+    loop = asyncio.get_running_loop()
+    chunks = iter(response.chunks)
+    while True:
+        # 每块在线程池中生成，写入后等待发送缓冲区排空，慢客户端不会让服务端积压整份数据
+        chunk = await loop.run_in_executor(None, next, chunks, None)
+        if chunk is None:
+            break
+        writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        await writer.drain()
+    writer.write(b"0\r\n\r\n")
+
+
+async def read_request(reader):
+    """读取一个请求头，连接关闭时返回 None"""
+    try:
+        head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), API["keepalive_timeout"])
+    except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+        return None
+    except asyncio.LimitOverrunError:
+        raise HTTPError(431) from None
+    # 部分客户端在地址中直接发送 UTF-8 字节（未做百分号编码）
+    lines = head.decode("utf-8", "replace").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ", 2)
+    except ValueError:
+        raise HTTPError(400, "请求行格式错误") from None
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length") or 0)
+    if length:
+        await reader.readexactly(length)
+    return Request(method, target, version, headers)
+
+
+async def handle_connection(reader, writer):
+    try:
+        while True:
+            request = None
+            try:
+                request = await read_request(reader)
+                if request is None:
+                    break
+                response = await dispatch(request)
+            except HTTPError as exc:
+                response = Response(exc.status, encode_json({"error": str(exc)}))
+            except Exception as exc:  # noqa: BLE001 - 接口异常返回 500，连接继续服务
+                response = Response(500, encode_json({"error": f"{type(exc).__name__}: {exc}"}))
+            keep_alive = request is not None and request.keep_alive
+            await write_response(writer, request, response, keep_alive)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host, port):
+    server = await asyncio.start_server(handle_connection, host, port, limit=MAX_HEADER_BYTES)
+    addresses = ", ".join(f"http://{s.getsockname()[0]}:{s.getsockname()[1]}" for s in server.sockets)
+    print(f"数据接口已启动: {addresses}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="智播农链数据接口")
+    parser.add_argument("--host", default=API["host"])
+    parser.add_argument("--port", type=int, default=API["port"])
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,305 @@
+# 智播农链销售平台页面渲染基准测试
+#
+# 用 streamlit 替身模块（st_stub）无界面地调用每个页面（main.py 的侧边栏和页面底部、views 中的页面模块）的渲染函数，
+# 数据集由 data.py 的生成函数按 10²/10⁴/10⁶ 个产品和订单合成。
+# 每个页面记录墙钟时间、CPU 时间、内存分配、图表构建和序列化开销，结果保存为 JSON（每个规模测完即写入）。
+# 某个页面内存不足（MemoryError）时记为失败，继续测试其余页面和规模。
+#
+# 用法：
+#   python benchmarks/bench_pages.py
+#   python benchmarks/bench_pages.py --sizes 100,10000 --repeat 5 --output result.json
+#   python benchmarks/bench_pages.py --compare benchmarks/results/旧结果.json
+
+import argparse
+import functools
+import importlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import st_stub  # noqa: E402
+
+sys.modules["streamlit"] = st_stub.build_module()
+
+import cache  # noqa: E402
+import charts  # noqa: E402
+import data  # noqa: E402
+import fragments  # noqa: E402
+import main  # noqa: E402
+import views  # noqa: E402
+import plotly.express as px  # noqa: E402
+import plotly.graph_objects as go  # noqa: E402
+from catalog import ProductCatalog  # noqa: E402
+from order_store import OrderStore  # noqa: E402
+from records import ProductTable  # noqa: E402
+
+DEFAULT_SIZES = (100, 10_000, 1_000_000)
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+# 页面名 -> (模块, 渲染函数)
+PAGES = {
+    "侧边栏": ("main", "render_sidebar"),
+    **views.PAGE_MODULES,
+    "页面底部": ("main", "render_footer"),
+}
+
+
+class FigureTimer:
+    """统计 plotly 图表构建耗时（px.* 构造函数和 update_layout）"""
+
+    PX_FUNCTIONS = ("line", "bar", "pie", "scatter", "histogram", "area")
+
+    def __init__(self):
+        self.seconds = 0.0
+        self._depth = 0
+        self._originals = []
+
+    def _wrap(self, owner, name):
+        original = getattr(owner, name)
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            # px.* 内部会调用 update_layout/add_trace，只统计最外层调用
+            if self._depth:
+                return original(*args, **kwargs)
+            self._depth += 1
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.seconds += time.perf_counter() - start
+                self._depth -= 1
+
+        self._originals.append((owner, name, original))
+        setattr(owner, name, timed)
+
+    def install(self):
+        for name in self.PX_FUNCTIONS:
+            self._wrap(px, name)
+        self._wrap(go.Figure, "update_layout")
+        self._wrap(go.Figure, "add_trace")
+
+    def uninstall(self):
+        for owner, name, original in reversed(self._originals):
+            setattr(owner, name, original)
+        self._originals = []
+
+
+def synthetic_products(count):
+    """以演示产品为模板按列合成 count 个产品（不创建产品记录对象）"""
+    templates = data.PRODUCTS_DATA
+    table = ProductTable()
+    i = np.arange(count)
+    base = i % len(templates)
+    names = np.array([p["name"] for p in templates])[base]
+    columns = {
+        "id": np.char.add("P", np.char.zfill((i + 1).astype(str), 7)),
+        "name": np.where(
+            i < len(templates), names, np.char.add(names, np.char.add((i // len(templates) + 1).astype(str), "号"))
+        ),
+        "stock": np.array([p["stock"] for p in templates])[base] * (i + 7) % 400,
+        "sales": np.array([p["sales"] for p in templates])[base] * (i + 3) % 1000,
+    }
+    for name in ("original_price_cents", "current_price_cents", "rating"):
+        columns[name] = np.array([getattr(p, name) for p in templates])[base]
+    for name in ProductTable.DICTIONARY_COLUMNS:
+        columns[name] = np.array([table.encode(name, p[name]) for p in templates], dtype=np.int32)[base]
+    table.append_columns(columns)
+    return table
+
+
+def release_caches():
+    """清空数据、图表和片段缓存"""
+    cache.invalidate()
+    charts.clear_figures()
+    fragments.clear_fragments()
+
+
+def use_dataset(size, workdir):
+    """把数据层切换到 size 个产品和订单的合成数据集"""
+    table = synthetic_products(size)
+    store = OrderStore(os.path.join(workdir, f"orders-{size}"))
+    if len(store) == 0:
+        for name in dict.fromkeys(p["name"] for p in data.PRODUCTS_DATA):
+            store.encode("product", name, create=True)
+        store.append_columns(data.generate_order_columns(size, seed=data.DATA_SEED))
+
+    data.LIVE_METRICS = dict(data.LIVE_METRICS, simulate=False)
+    data._order_store = store
+    data._order_index = None
+    data._order_rollups = None
+    data._product_catalog = ProductCatalog(table=table)
+    data._inventory = None
+    data._forecast_engine = None
+    data._snapshot_reader = None
+    data.PRODUCT_STORE_PATH = os.path.join(workdir, f"products-{size}.jsonl")
+    release_caches()
+    data.get_quick_stats.clear()
+
+
+def measure(func, repeat, trace_allocations):
+    """运行 func repeat 次，返回耗时统计；trace_allocations 时额外运行一次统计内存分配"""
+    walls, cpus = [], []
+    figure_timer = FigureTimer()
+    figure_timer.install()
+    try:
+        for _ in range(repeat):
+            st_stub.recorder.reset()
+            figure_timer.seconds = 0.0
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            try:
+                func()
+            except st_stub.RerunException:
+                pass
+            walls.append(time.perf_counter() - wall_start)
+            cpus.append(time.process_time() - cpu_start)
+    finally:
+        figure_timer.uninstall()
+
+    result = {
+        "wall_ms": statistics.median(walls) * 1000,
+        "wall_min_ms": min(walls) * 1000,
+        "cpu_ms": statistics.median(cpus) * 1000,
+        "figure_build_ms": figure_timer.seconds * 1000,
+        "figure_serialize_ms": st_stub.recorder.figure_serialize_seconds * 1000,
+        "figures": st_stub.recorder.figures,
+        "elements": st_stub.recorder.elements,
+        "payload_kb": st_stub.recorder.payload_bytes / 1024,
+    }
+
+    if trace_allocations:
+        tracemalloc.start()
+        try:
+            try:
+                func()
+            except st_stub.RerunException:
+                pass
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        stats = snapshot.statistics("filename")
+        result["alloc_peak_kb"] = peak / 1024
+        result["alloc_retained_kb"] = current / 1024
+        result["alloc_blocks"] = sum(stat.count for stat in stats)
+    return result
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save(report, output):
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def run(sizes, repeat, pages, trace_allocations, output):
+    """依次测试各规模，每个规模测完后把当前结果写入 output"""
+    report = {
+        "platform_version": main.PLATFORM_INFO["version"],
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "repeat": repeat,
+        "results": [],
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            start = time.perf_counter()
+            try:
+                use_dataset(size, workdir)
+            except MemoryError:
+                release_caches()
+                print(f"== 数据集 {size:,} 个产品/订单：内存不足，跳过")
+                report["results"].append({"size": size, "error": "MemoryError"})
+                save(report, output)
+                continue
+            setup_ms = (time.perf_counter() - start) * 1000
+            print(f"== 数据集 {size:,} 个产品/订单（准备 {setup_ms:.0f} ms）")
+            for page in pages:
+                module_name, func_name = PAGES[page]
+                func = getattr(importlib.import_module(module_name), func_name)
+                try:
+                    result = measure(func, repeat, trace_allocations)
+                except MemoryError:
+                    # 释放页面缓存后继续测试其余页面
+                    release_caches()
+                    result = {"error": "MemoryError"}
+                    print(f"  {page:<8} 内存不足")
+                else:
+                    print(
+                        f"  {page:<8} {result['wall_ms']:>10.1f} ms  cpu {result['cpu_ms']:>9.1f} ms  "
+                        f"图表 {result['figure_build_ms'] + result['figure_serialize_ms']:>8.1f} ms  "
+                        f"元素 {result['elements']:>8}  "
+                        + (f"峰值内存 {result['alloc_peak_kb']:>10.0f} KB" if "alloc_peak_kb" in result else "")
+                    )
+                result.update(page=page, function=f"{module_name}.{func_name}", size=size)
+                report["results"].append(result)
+            save(report, output)
+    return report
+
+
+def compare(report, baseline_path):
+    """与旧结果对比墙钟时间"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    previous = {(r.get("page"), r["size"]): r for r in baseline["results"]}
+    print(f"\n== 对比 {baseline_path}（{baseline.get('git_revision')} -> {report.get('git_revision')}）")
+    for result in report["results"]:
+        old = previous.get((result.get("page"), result["size"]))
+        if old is None or "error" in old or "error" in result:
+            continue
+        ratio = result["wall_ms"] / old["wall_ms"] if old["wall_ms"] else float("inf")
+        print(f"  {result['page']:<8} {result['size']:>9,}  {old['wall_ms']:>10.1f} -> {result['wall_ms']:>10.1f} ms  x{ratio:.2f}")
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="页面渲染基准测试")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="数据集规模，逗号分隔")
+    parser.add_argument("--repeat", type=int, default=3, help="每个页面重复次数")
+    parser.add_argument("--pages", default=",".join(PAGES), help="要测试的页面，逗号分隔")
+    parser.add_argument("--no-alloc", action="store_true", help="不统计内存分配（更快）")
+    parser.add_argument("--output", help="结果 JSON 路径（默认 benchmarks/results/pages-<版本>.json）")
+    parser.add_argument("--compare", help="与之前保存的结果 JSON 对比")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    pages = [p for p in args.pages.split(",") if p]
+    unknown = [p for p in pages if p not in PAGES]
+    if unknown:
+        parser.error(f"未知页面: {', '.join(unknown)}")
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        name = git_revision() or datetime.now().strftime("%Y%m%d%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"pages-{name}.json")
+    report = run(sizes, args.repeat, pages, not args.no_alloc, output)
+    print(f"\n结果已保存到 {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main_cli()
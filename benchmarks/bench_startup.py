@@ -0,0 +1,142 @@
+# 智播农链销售平台冷启动基准测试
+#
+# 每次测量启动一个新的 Python 进程（替身 streamlit，见 st_stub），记录：
+# - 导入 main.py 的耗时（页面框架、配置和数据层）
+# - 首次运行 main() 的耗时（侧边栏 + 默认页面 + 页面底部，即首屏）
+# - 首屏之后仍未加载的重量级模块
+# - 之后首次打开其他各页面的耗时（含页面模块导入）
+# 多次测量取中位数，结果保存为 JSON。
+#
+# 用法：
+#   python benchmarks/bench_startup.py
+#   python benchmarks/bench_startup.py --repeat 10 --output result.json
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HERE = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+# 首屏不需要、应按需加载的模块
+HEAVY_MODULES = (
+    "pandas",
+    "plotly.express",
+    "plotly.graph_objects",
+    "customer_analytics",
+    "transfer",
+    "script_engine",
+    "list_view",
+)
+
+# 在子进程中执行的测量脚本
+PROBE = r"""
+import json, os, sys, time
+sys.path.insert(0, {root!r})
+sys.path.insert(0, {here!r})
+os.chdir({root!r})
+import st_stub
+sys.modules["streamlit"] = st_stub.build_module()
+
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+data = sys.modules["data"]
+data.LIVE_METRICS = dict(data.LIVE_METRICS, simulate=False)
+try:
+    main.main()
+except st_stub.RerunException:
+    pass
+first_run = time.perf_counter()
+loaded = [name for name in {heavy!r} if name in sys.modules]
+
+import views
+pages = {{}}
+for page in views.PAGE_MODULES:
+    if page in views.import_times or views.PAGE_MODULES[page][0] in sys.modules:
+        continue
+    page_start = time.perf_counter()
+    try:
+        views.page_renderer(page)()
+    except st_stub.RerunException:
+        pass
+    pages[page] = {{
+        "first_open": time.perf_counter() - page_start,
+        "import": views.import_times.get(page, 0.0),
+    }}
+print(json.dumps({{
+    "import_main": imported - start,
+    "first_run": first_run - imported,
+    "loaded_after_first_run": loaded,
+    "pages": pages,
+}}))
+"""
+
+
+def probe():
+    """在新进程中测量一次冷启动"""
+    code = PROBE.format(root=ROOT, here=HERE, heavy=HEAVY_MODULES)
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=ROOT, stderr=subprocess.DEVNULL)
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(repeat):
+    runs = [probe() for _ in range(repeat)]
+    pages = {}
+    for page in runs[0]["pages"]:
+        pages[page] = {
+            "first_open_ms": statistics.median(r["pages"][page]["first_open"] for r in runs) * 1000,
+            "import_ms": statistics.median(r["pages"][page]["import"] for r in runs) * 1000,
+        }
+    return {
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "repeat": repeat,
+        "import_main_ms": statistics.median(r["import_main"] for r in runs) * 1000,
+        "first_run_ms": statistics.median(r["first_run"] for r in runs) * 1000,
+        "loaded_after_first_run": runs[0]["loaded_after_first_run"],
+        "pages": pages,
+    }
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="冷启动基准测试")
+    parser.add_argument("--repeat", type=int, default=5, help="测量次数（每次一个新进程）")
+    parser.add_argument("--output", help="结果 JSON 路径（默认 benchmarks/results/startup-<版本>.json）")
+    args = parser.parse_args()
+
+    report = run(args.repeat)
+    print(f"导入 main.py      {report['import_main_ms']:>8.1f} ms")
+    print(f"首屏（默认页面）  {report['first_run_ms']:>8.1f} ms")
+    print(f"首屏后已加载的重量级模块: {', '.join(report['loaded_after_first_run']) or '无'}")
+    for page, result in report["pages"].items():
+        print(f"  首次打开 {page:<8} {result['first_open_ms']:>8.1f} ms（其中导入 {result['import_ms']:.1f} ms）")
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        name = report["git_revision"] or datetime.now().strftime("%Y%m%d%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"startup-{name}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n结果已保存到 {output}")
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,212 @@
+# 智播农链销售平台数据接口压力测试
+#
+# 用 asyncio 建立若干条长连接，每条连接依次循环请求一组接口地址，持续指定秒数，
+# 统计吞吐量（请求/秒）、延迟分位数和各状态码数量。--etag 时带上次响应的 ETag
+# 发送条件请求（模拟客户端缓存，命中时服务端返回 304）。
+# 默认在子进程中启动 api.py（单进程、单线程事件循环），也可用 --url 测试已运行的服务。
+# 地址中的中文等非 ASCII 字符在发送前按 UTF-8 百分号编码。
+#
+# 用法：
+#   python benchmarks/load_test.py
+#   python benchmarks/load_test.py --connections 50 --seconds 20 --etag
+#   python benchmarks/load_test.py --url http://127.0.0.1:8600 --paths /api/products,/api/live/rooms
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from urllib.parse import quote, urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+DEFAULT_PATHS = (
+    "/api/products?limit=20",
+    "/api/products?category=特色干果&sort=current_price&order=asc",
+    "/api/products/P001",
+    "/api/orders?limit=20",
+    "/api/orders?status=pending&limit=50",
+    "/api/live/rooms",
+    "/api/faq?q=保质期",
+)
+
+
+def encode_path(path):
+    """接口地址 -> 百分号编码的请求目标（保留已有的 % 编码和 URL 分隔符）"""
+    return quote(path, safe="/?&=%,:+")
+
+
+async def read_response(reader):
+    """读取一个响应，返回 (状态码, 头部字典, 正文字节数)"""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    if headers.get("transfer-encoding") == "chunked":
+        size = 0
+        while True:
+            length = int((await reader.readline()).strip(), 16)
+            await reader.readexactly(length + 2)
+            size += length
+            if length == 0:
+                return status, headers, size
+    length = int(headers.get("content-length") or 0)
+    await reader.readexactly(length)
+    return status, headers, length
+
+
+async def client(host, port, paths, deadline, use_etag, stats):
+    """一条长连接：循环请求 paths 直到 deadline"""
+    reader, writer = await asyncio.open_connection(host, port)
+    etags = {}
+    i = 0
+    try:
+        while time.perf_counter() < deadline:
+            path = paths[i % len(paths)]
+            i += 1
+            request = f"GET {path} HTTP/1.1\r\nHost: {host}\r\n"
+            if use_etag and path in etags:
+                request += f"If-None-Match: {etags[path]}\r\n"
+            start = time.perf_counter()
+            writer.write((request + "\r\n").encode())
+            status, headers, size = await read_response(reader)
+            stats["latencies"].append(time.perf_counter() - start)
+            stats["status"][status] += 1
+            stats["bytes"] += size
+            if "etag" in headers:
+                etags[path] = headers["etag"]
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, paths, connections, seconds, use_etag):
+    # 预热：每个地址请求一次，首次查询和编码不计入结果
+    warm = Counter()
+    reader, writer = await asyncio.open_connection(host, port)
+    for path in paths:
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+        warm[(await read_response(reader))[0]] += 1
+    writer.close()
+
+    stats = {"latencies": [], "status": Counter(), "bytes": 0}
+    start = time.perf_counter()
+    deadline = start + seconds
+    await asyncio.gather(*(client(host, port, paths, deadline, use_etag, stats) for _ in range(connections)))
+    elapsed = time.perf_counter() - start
+    latencies = sorted(stats["latencies"])
+
+    def percentile(q):
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000 if latencies else 0.0
+
+    return {
+        "requests": len(latencies),
+        "seconds": elapsed,
+        "requests_per_second": len(latencies) / elapsed,
+        "latency_mean_ms": statistics.mean(latencies) * 1000 if latencies else 0.0,
+        "latency_p50_ms": percentile(0.5),
+        "latency_p99_ms": percentile(0.99),
+        "latency_max_ms": latencies[-1] * 1000 if latencies else 0.0,
+        "status": {str(code): count for code, count in sorted(stats["status"].items())},
+        "warmup_status": {str(code): count for code, count in sorted(warm.items())},
+        "megabytes": stats["bytes"] / 1e6,
+    }
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port):
+    """在子进程中启动 api.py，等待端口可连接"""
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "api.py"), "--host", "127.0.0.1", "--port", str(port)],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("api.py 启动失败")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("等待 api.py 启动超时")
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="数据接口压力测试")
+    parser.add_argument("--url", help="已运行的服务地址（默认在子进程中启动 api.py）")
+    parser.add_argument("--paths", default=",".join(DEFAULT_PATHS), help="请求的接口地址，逗号分隔")
+    parser.add_argument("--connections", type=int, default=20, help="并发长连接数")
+    parser.add_argument("--seconds", type=float, default=10, help="持续时间（秒）")
+    parser.add_argument("--etag", action="store_true", help="发送 If-None-Match 条件请求")
+    parser.add_argument("--output", help="结果 JSON 路径（默认 benchmarks/results/load-<版本>.json）")
+    args = parser.parse_args()
+
+    paths = [encode_path(p) for p in args.paths.split(",") if p]
+    process = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        host, port = "127.0.0.1", free_port()
+        process = start_server(port)
+    try:
+        result = asyncio.run(run_load(host, port, paths, args.connections, args.seconds, args.etag))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    report = {
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "connections": args.connections,
+        "etag": args.etag,
+        "paths": paths,
+        **result,
+    }
+    print(f"{report['requests']:,} 个请求 / {report['seconds']:.1f} 秒 = {report['requests_per_second']:,.0f} 请求/秒")
+    print(f"延迟 平均 {report['latency_mean_ms']:.2f} ms · p50 {report['latency_p50_ms']:.2f} ms · "
+          f"p99 {report['latency_p99_ms']:.2f} ms · 最大 {report['latency_max_ms']:.2f} ms")
+    print(f"状态码: {report['status']}（预热: {report['warmup_status']}）· 正文 {report['megabytes']:.1f} MB")
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        name = report["git_revision"] or datetime.now().strftime("%Y%m%d%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"load-{name}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n结果已保存到 {output}")
+
+
+if __name__ == "__main__":
+    main_cli()
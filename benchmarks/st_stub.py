@@ -0,0 +1,170 @@
+# 基准测试用的 streamlit 替身模块
+#
+# 只实现 main.py 用到的接口：输入控件返回默认值，按钮返回 False，
+# 布局容器支持 with 语句，输出元素只计数。plotly_chart 会把图表序列化为 JSON，
+# 以计入与 Streamlit 相同的图表传输开销。
+
+import time
+import types
+
+
+class Recorder:
+    """统计输出元素数量和图表开销"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.elements = 0
+        self.figures = 0
+        self.figure_serialize_seconds = 0.0
+        self.payload_bytes = 0
+
+
+recorder = Recorder()
+
+
+class SessionState(dict):
+    """支持属性访问的 session_state"""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+    def __delattr__(self, name):
+        del self[name]
+
+
+class RerunException(Exception):
+    """st.rerun() 在替身中直接结束本次渲染"""
+
+
+class Container:
+    """布局容器和输出元素的替身"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def _element(self, *args, **kwargs):
+        recorder.elements += 1
+        for value in args:
+            if isinstance(value, str):
+                recorder.payload_bytes += len(value.encode("utf-8"))
+        return None
+
+    markdown = write = caption = header = subheader = title = text = _element
+    metric = info = success = warning = error = code = json = table = _element
+    balloons = snow = divider = image = progress = download_button = _element
+
+    def dataframe(self, data=None, *args, **kwargs):
+        recorder.elements += 1
+        if hasattr(data, "to_json"):
+            recorder.payload_bytes += len(data.to_json())
+        return None
+
+    def plotly_chart(self, figure, *args, **kwargs):
+        recorder.elements += 1
+        recorder.figures += 1
+        start = time.perf_counter()
+        payload = figure.to_json() if hasattr(figure, "to_json") else str(figure)
+        recorder.figure_serialize_seconds += time.perf_counter() - start
+        recorder.payload_bytes += len(payload)
+        return None
+
+    def columns(self, spec, *args, **kwargs):
+        count = spec if isinstance(spec, int) else len(spec)
+        return [Container() for _ in range(count)]
+
+    def tabs(self, labels):
+        return [Container() for _ in labels]
+
+    def expander(self, *args, **kwargs):
+        recorder.elements += 1
+        return Container()
+
+    def form(self, *args, **kwargs):
+        return Container()
+
+    def container(self, *args, **kwargs):
+        return Container()
+
+    def empty(self):
+        return Container()
+
+    # ---- 输入控件 ----
+
+    def button(self, *args, **kwargs):
+        recorder.elements += 1
+        return False
+
+    form_submit_button = button
+
+    def selectbox(self, label, options, index=0, *args, **kwargs):
+        recorder.elements += 1
+        options = list(options)
+        return options[index] if options else None
+
+    def radio(self, label, options, index=0, *args, **kwargs):
+        return self.selectbox(label, options, index)
+
+    def multiselect(self, label, options, default=None, *args, **kwargs):
+        recorder.elements += 1
+        return list(default or [])
+
+    def text_input(self, label, value="", *args, **kwargs):
+        recorder.elements += 1
+        return value
+
+    text_area = text_input
+
+    def number_input(self, label, min_value=None, max_value=None, value=None, *args, **kwargs):
+        recorder.elements += 1
+        if value is not None:
+            return value
+        return min_value if min_value is not None else 0
+
+    def slider(self, label, min_value=None, max_value=None, value=None, *args, **kwargs):
+        recorder.elements += 1
+        return value if value is not None else min_value
+
+    def date_input(self, label, value=None, *args, **kwargs):
+        recorder.elements += 1
+        return value
+
+    def checkbox(self, label, value=False, *args, **kwargs):
+        recorder.elements += 1
+        return value
+
+    toggle = checkbox
+
+    def file_uploader(self, *args, **kwargs):
+        recorder.elements += 1
+        return None
+
+
+def build_module():
+    """构造可放入 sys.modules["streamlit"] 的替身模块"""
+    module = types.ModuleType("streamlit")
+    root = Container()
+    for name in dir(Container):
+        if not name.startswith("_"):
+            setattr(module, name, getattr(root, name))
+    module.sidebar = Container()
+    module.session_state = SessionState()
+    module.set_page_config = lambda *args, **kwargs: None
+
+    def rerun():
+        raise RerunException()
+
+    module.rerun = rerun
+    module.experimental_rerun = rerun
+    module.__version__ = "stub"
+    return module
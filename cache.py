@@ -0,0 +1,170 @@
+# 智播农链销售平台数据缓存
+#
+# 为数据访问函数提供两种缓存作用域：
+# - global：进程内所有会话共享
+# - session：每个 Streamlit 会话独立（保存在 st.session_state 中，脱离 Streamlit 运行时退化为 global）
+# 缓存按 REFRESH_INTERVAL 对齐的刷新窗口过期，超出容量时按 LRU 淘汰，
+# 写入路径通过 invalidate(标签) 主动失效。
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+
+from config import REFRESH_INTERVAL
+
+SESSION_STATE_KEY = "_data_cache"
+
+_registry = {}  # 缓存名 -> CachedFunction
+_registry_lock = threading.Lock()
+
+
+class LRUCache:
+    """带过期时间的 LRU 缓存"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, now):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None or item[0] <= now:
+                if item is not None:
+                    del self._items[key]
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item
+
+    def put(self, key, value, expires_at):
+        with self._lock:
+            self._items[key] = (expires_at, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
+
+
+def _session_caches():
+    """当前 Streamlit 会话中的缓存字典（缓存名 -> LRUCache），不在会话中时返回 None"""
+    try:
+        import streamlit as st
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return None
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return None
+    state = st.session_state
+    if SESSION_STATE_KEY not in state:
+        state[SESSION_STATE_KEY] = {}
+    return state[SESSION_STATE_KEY]
+
+
+def window_expiry(ttl, now=None):
+    """按 ttl 对齐的刷新窗口结束时间，同一窗口内的所有会话共用一次计算结果"""
+    now = time.time() if now is None else now
+    return (now // ttl + 1) * ttl
+
+
+class CachedFunction:
+    """被缓存的函数"""
+
+    def __init__(self, func, name, scope, ttl, maxsize, tags):
+        self.func = func
+        self.name = name
+        self.scope = scope
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.tags = set(tags)
+        self._global = LRUCache(maxsize)
+        # 失效代数：作为键的一部分，失效后所有会话中的旧条目都不再命中
+        self._generation = 0
+        functools.update_wrapper(self, func)
+
+    def _cache(self):
+        if self.scope == "session":
+            caches = _session_caches()
+            if caches is not None:
+                if self.name not in caches:
+                    caches[self.name] = LRUCache(self.maxsize)
+                return caches[self.name]
+        return self._global
+
+    def __call__(self, *args, **kwargs):
+        key = (self._generation, args, tuple(sorted(kwargs.items())))
+        cache = self._cache()
+        now = time.time()
+        item = cache.get(key, now)
+        if item is not None:
+            return item[1]
+        value = self.func(*args, **kwargs)
+        expires_at = window_expiry(self.ttl, now) if self.ttl else float("inf")
+        cache.put(key, value, expires_at)
+        return value
+
+    def clear(self):
+        """清空缓存（其他会话中的条目随代数递增失效）"""
+        self._generation += 1
+        self._cache().clear()
+        self._global.clear()
+
+    def stats(self):
+        cache = self._cache()
+        return {"name": self.name, "scope": self.scope, "size": len(cache),
+                "hits": cache.hits, "misses": cache.misses}
+
+
+def cached(scope="global", ttl=REFRESH_INTERVAL, maxsize=128, tags=(), name=None):
+    """缓存装饰器
+
+    scope 为 "global" 或 "session"；ttl 为刷新窗口长度（秒），None 表示不过期；
+    tags 为失效标签，调用 invalidate(标签) 时清空。
+    """
+    if scope not in ("global", "session"):
+        raise ValueError(f"未知的缓存作用域: {scope}")
+
+    def decorator(func):
+        cache_name = name or f"{func.__module__}.{func.__qualname__}"
+        wrapper = CachedFunction(func, cache_name, scope, ttl, maxsize, tags)
+        with _registry_lock:
+            _registry[cache_name] = wrapper
+        return wrapper
+
+    return decorator
+
+
+def invalidate(*tags):
+    """使带有指定标签（或同名）的缓存失效；不传参数时清空全部缓存"""
+    with _registry_lock:
+        targets = list(_registry.values())
+    for cached_func in targets:
+        if not tags or cached_func.name in tags or cached_func.tags & set(tags):
+            cached_func.clear()
+
+
+def cache_stats():
+    """各缓存的命中统计"""
+    with _registry_lock:
+        return [cached_func.stats() for cached_func in _registry.values()]
+
+
+def generation(*tags):
+    """带有指定标签的缓存的失效代数，可作为下游缓存的数据版本"""
+    with _registry_lock:
+        targets = list(_registry.values())
+    return tuple(
+        (cached_func.name, cached_func._generation)
+        for cached_func in targets
+        if cached_func.name in tags or cached_func.tags & set(tags)
+    )
@@ -0,0 +1,391 @@
+# 智播农链销售平台产品目录
+#
+# 产品按列保存在 ProductTable 中，只有查询返回的一页产品才还原为 Product 记录。在产品表之上维护：
+# - 分类索引与排序索引：每个 (分类, 排序字段) 预先排好序的位置数组，筛选 + 排序后取一页只需切片
+# - 全文索引：名称、描述、特色、营养价值按字符单字和二元组建立倒排索引，名称权重最高。
+#   倒排列表按 CSR 格式保存为 NumPy 数组（排好序的词项键 + 偏移 + int32 位置）；字典编码的字段
+#   只对不同取值建索引（词项 -> 取值编码），再经 取值编码 -> 位置 展开，重复的描述只占一份。
+#   索引在第一次检索时整体构建，之后新增或修改的产品记在增量缓冲区中，超过 TEXT_DELTA_LIMIT 个后
+#   丢弃索引，下次检索时重建。
+# 产品新增或修改时排序索引标记为过期，下次查询时重建；
+# 只修改库存、销量等数值字段时不动全文索引，只重建受影响字段的排序索引。
+
+import math
+import re
+import threading
+from collections import Counter
+
+import numpy as np
+
+from faq_search import tokenize
+from records import ProductTable
+
+# 可排序字段
+SORT_FIELDS = ("current_price", "stock", "sales", "rating")
+
+# 全文检索字段权重
+TEXT_FIELDS = {
+    "name": 3.0,
+    "features": 1.5,
+    "description": 1.0,
+    "nutrition": 0.5,
+}
+
+ALL_CATEGORIES = "全部"
+
+# 全文索引增量缓冲区的产品数上限
+TEXT_DELTA_LIMIT = 1024
+
+# 构建全文索引时每块切分的文本数
+TEXT_CHUNK = 65536
+
+_WORD = re.compile(r"\w")
+
+
+def _field_text(value):
+    if isinstance(value, (list, tuple)):
+        return " ".join(value)
+    return str(value or "")
+
+
+def _term_key(term):
+    """词项（单字或二元组）-> 整数键"""
+    if len(term) == 1:
+        return ord(term)
+    return (ord(term[0]) + 1) << 21 | ord(term[1])
+
+
+def _text_terms(text):
+    """文本 -> 词项键集合（单字和二元组，与 tokenize 的切分一致）"""
+    return {_term_key(term) for term in set(tokenize(text, n=1)) | set(tokenize(text, n=2))}
+
+
+class _CharTable:
+    """码位 -> (小写码位, 是否文字字符)，按需补充"""
+
+    def __init__(self):
+        self._lower = {}
+        self._word = {}
+
+    def map(self, chars):
+        codes, inverse = np.unique(chars, return_inverse=True)
+        for code in codes.tolist():
+            if code not in self._lower:
+                char = chr(code)
+                lower = char.lower()
+                self._lower[code] = ord(lower) if len(lower) == 1 else code
+                self._word[code] = code != 0 and _WORD.match(lower) is not None
+        lower = np.array([self._lower[code] for code in codes.tolist()], dtype=np.int64)
+        word = np.array([self._word[code] for code in codes.tolist()], dtype=bool)
+        return lower[inverse].reshape(chars.shape), word[inverse].reshape(chars.shape)
+
+
+def _text_pairs(texts, chars):
+    """一块文本（Unicode 数组）-> 按 (词项键, 行号) 排好序且去重的 (键数组, 行号数组)"""
+    width = texts.dtype.itemsize // 4
+    codes, word = chars.map(np.ascontiguousarray(texts).view(np.uint32).reshape(len(texts), width))
+    rows = np.broadcast_to(np.arange(len(texts), dtype=np.int64)[:, None], codes.shape)
+    pair = word[:, :-1] & word[:, 1:]
+    keys = np.concatenate([codes[word], (codes[:, :-1][pair] + 1) << 21 | codes[:, 1:][pair]])
+    rows = np.concatenate([rows[word], rows[:, :-1][pair]])
+    # 键小于 2^43、块内行号小于 2^16，合并成一个 int64 同时完成排序和去重
+    merged = np.sort(keys * TEXT_CHUNK + rows)
+    merged = merged[_run_starts(merged)]
+    return merged // TEXT_CHUNK, merged % TEXT_CHUNK
+
+
+def _run_starts(keys):
+    """有序数组中每段相同取值的起点"""
+    if not len(keys):
+        return np.empty(0, dtype=np.int64)
+    return np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+
+
+def _gather(indptr, items, rows):
+    """拼接 CSR 中若干行的条目"""
+    starts = indptr[rows]
+    lengths = indptr[rows + 1] - starts
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return items[offsets + np.arange(offsets.size)]
+
+
+class _Postings:
+    """CSR 倒排列表：keys 为排好序的词项键，词项 keys[i] 的条目为 items[indptr[i]:indptr[i + 1]]（升序）"""
+
+    def __init__(self, chunks, count):
+        """chunks 为块迭代函数，每次调用依次产生 (起始条目, 文本数组)，条目总数为 count"""
+        chars = _CharTable()
+        # 第一遍：词项表和每个词项的条目数
+        found, counts = [], []
+        for start, texts in chunks():
+            keys, _ = _text_pairs(texts, chars)
+            starts = _run_starts(keys)
+            found.append(keys[starts])
+            counts.append(np.diff(np.r_[starts, len(keys)]))
+        found = np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+        self.keys = np.unique(found)
+        totals = np.bincount(np.searchsorted(self.keys, found), np.concatenate(counts) if counts else None,
+                             minlength=len(self.keys)).astype(np.int64)
+        self.indptr = np.r_[0, np.cumsum(totals)]
+        # 第二遍：按块顺序填入条目，同一词项内保持升序
+        self.items = np.empty(self.indptr[-1], dtype=np.int32 if count < 2 ** 31 else np.int64)
+        cursor = self.indptr[:-1].copy()
+        for start, texts in chunks():
+            keys, rows = _text_pairs(texts, chars)
+            ids = np.searchsorted(self.keys, keys)
+            starts = _run_starts(ids)
+            lengths = np.diff(np.r_[starts, len(ids)])
+            within = np.arange(len(ids)) - np.repeat(starts, lengths)
+            self.items[cursor[ids] + within] = rows + start
+            cursor[ids[starts]] += lengths
+
+    def get(self, key):
+        i = int(np.searchsorted(self.keys, key))
+        if i < len(self.keys) and self.keys[i] == key:
+            return self.items[self.indptr[i]:self.indptr[i + 1]]
+        return self.items[:0]
+
+
+class _TextIndex:
+    """全文索引快照（构建时的前 size 个产品）
+
+    名称直接索引 词项 -> 位置；字典编码的字段索引 词项 -> 取值编码，
+    再用按编码分组的位置数组（CSR）展开为位置。
+    """
+
+    def __init__(self, table):
+        self.size = len(table)
+        self.fields = {}
+        for field, weight in TEXT_FIELDS.items():
+            if field in ProductTable.DICTIONARY_COLUMNS:
+                values = table.dictionary(field)
+                codes = table.codes(field)
+                by_code = np.argsort(codes, kind="stable").astype(self._position_dtype())
+                indptr = np.r_[0, np.cumsum(np.bincount(codes, minlength=len(values)))]
+                postings = _Postings(self._dictionary_chunks(values), len(values))
+                self.fields[field] = (weight, postings, (indptr, by_code))
+            else:
+                postings = _Postings(self._column_chunks(table.column(field)), self.size)
+                self.fields[field] = (weight, postings, None)
+
+    def _position_dtype(self):
+        return np.int32 if self.size < 2 ** 31 else np.int64
+
+    @staticmethod
+    def _column_chunks(column):
+        return lambda: ((start, column[start:start + TEXT_CHUNK]) for start in range(0, len(column), TEXT_CHUNK))
+
+    @staticmethod
+    def _dictionary_chunks(values):
+        def chunks():
+            for start in range(0, len(values), TEXT_CHUNK):
+                yield start, np.array([_field_text(v) for v in values[start:start + TEXT_CHUNK]], dtype=str)
+        return chunks
+
+    def lookup(self, key):
+        """词项 -> (升序位置数组, 对应权重数组)"""
+        positions, weights = [], []
+        for weight, postings, by_code in self.fields.values():
+            items = postings.get(key)
+            if by_code is not None and len(items):
+                items = _gather(*by_code, items.astype(np.int64))
+            positions.append(items)
+            weights.append(np.full(len(items), weight))
+        positions = np.concatenate(positions)
+        order = np.argsort(positions, kind="stable")
+        positions = positions[order]
+        starts = _run_starts(positions)
+        if not len(starts):
+            return positions, np.empty(0)
+        return positions[starts], np.add.reduceat(np.concatenate(weights)[order], starts)
+
+
+class ProductCatalog:
+    """产品目录（分类索引、排序索引、全文索引）
+
+    products 为初始产品记录；table 为已按列建好的产品表（如大批量合成或导入的数据）。
+    """
+
+    def __init__(self, products=(), table=None):
+        self._lock = threading.RLock()
+        self.table = ProductTable() if table is None else table
+        self._text = None                   # 全文索引（第一次检索时构建）
+        self._delta = {}                    # 构建后新增或修改的 位置 -> {词项键: 权重}
+        self._sorted = {}                   # 排序字段 -> {分类: 升序位置数组}
+        self.version = 0
+        for product in products:
+            self.upsert(product)
+
+    def __len__(self):
+        return len(self.table)
+
+    def get(self, product_id):
+        """按编号读取产品记录，不存在时为 None"""
+        position = self.table.position(product_id)
+        return None if position is None else self.table.record(position)
+
+    def products(self, positions):
+        """按位置读取产品记录"""
+        return self.table.records(positions)
+
+    def column(self, name):
+        """整列读取（见 ProductTable.column）"""
+        return self.table.column(name)
+
+    def find_name(self, name):
+        """按名称精确查找第一个产品，不存在时为 None"""
+        matches = np.flatnonzero(self.table.column("name") == name)
+        return self.table.record(matches[0]) if len(matches) else None
+
+    # ---- 写入 ----
+
+    def _index_text(self, position):
+        """记入全文索引的增量缓冲区；缓冲区满时丢弃索引，下次检索时重建"""
+        if self._text is None:
+            return
+        if len(self._delta) >= TEXT_DELTA_LIMIT and position not in self._delta:
+            self._text = None
+            self._delta = {}
+            return
+        product = self.table.record(position)
+        weights = Counter()
+        for field, weight in TEXT_FIELDS.items():
+            for key in _text_terms(_field_text(product[field])):
+                weights[key] += weight
+        self._delta[position] = weights
+
+    def upsert(self, product):
+        """新增或更新产品（Product 记录或字典），返回位置"""
+        with self._lock:
+            position = self.table.position(product["id"])
+            if position is None:
+                position = int(self.table.append([product])[0])
+            else:
+                self.table.set_record(position, product)
+            self._index_text(position)
+            self._sorted = {}
+            self.version += 1
+            return position
+
+    def update_fields(self, product_id, **fields):
+        """更新数值字段（库存、销量、价格等），只使受影响的排序索引过期；编号不存在时抛出 KeyError"""
+        with self._lock:
+            position = self.table.position(product_id)
+            if position is None:
+                raise KeyError(product_id)
+            self.table.update(position, **fields)
+            if TEXT_FIELDS.keys() & fields:
+                self._index_text(position)
+            for field in fields:
+                self._sorted.pop(field, None)
+            self.version += 1
+
+    # ---- 索引 ----
+
+    def _sorted_index(self, field, category):
+        """(分类, 排序字段) 的升序位置数组；分类为 ALL_CATEGORIES 时为全部产品"""
+        indexes = self._sorted.get(field)
+        if indexes is None:
+            with self._lock:
+                categories = self.table.codes("category")
+                order = np.argsort(self.table.column(field), kind="stable")
+                indexes = {ALL_CATEGORIES: order}
+                # 按分类编码稳定分组，组内仍保持字段升序
+                grouped = order[np.argsort(categories[order], kind="stable")]
+                codes, starts = np.unique(categories[grouped], return_index=True)
+                bounds = list(starts) + [len(grouped)]
+                names = self.table.dictionary("category")
+                for i, code in enumerate(codes):
+                    indexes[names[code]] = grouped[bounds[i]:bounds[i + 1]]
+                self._sorted[field] = indexes
+        return indexes.get(category, np.empty(0, dtype=np.int64))
+
+    def category_positions(self, category):
+        """某分类下的全部位置"""
+        return self._sorted_index("sales", category)
+
+    # ---- 查询 ----
+
+    def _text_index(self):
+        with self._lock:
+            if self._text is None:
+                self._text = _TextIndex(self.table)
+                self._delta = {}
+            return self._text, dict(self._delta)
+
+    def _term_postings(self, key, index, delta, dirty):
+        """词项 -> (升序位置数组, 权重数组)，增量缓冲区中的产品以缓冲区为准"""
+        positions, weights = index.lookup(key)
+        if len(dirty):
+            keep = ~np.isin(positions, dirty)
+            positions, weights = positions[keep], weights[keep]
+        extra = [(position, terms[key]) for position, terms in delta.items() if key in terms]
+        if extra:
+            positions = np.concatenate([positions, [p for p, _ in extra]])
+            weights = np.concatenate([weights, [w for _, w in extra]])
+            order = np.argsort(positions, kind="stable")
+            positions, weights = positions[order], weights[order]
+        return positions, weights
+
+    def search_scores(self, text):
+        """全文检索：(升序位置数组, 得分数组)，要求命中全部查询词项"""
+        empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64))
+        terms = set(tokenize(text, n=2)) or set(tokenize(text, n=1))
+        if not terms:
+            return empty
+        n_docs = max(len(self.table), 1)
+        index, delta = self._text_index()
+        dirty = np.array(sorted(delta), dtype=np.int64)
+        postings = [self._term_postings(_term_key(term), index, delta, dirty) for term in terms]
+        if any(not len(positions) for positions, _ in postings):
+            return empty
+        # 从最短的倒排列表开始求交集
+        postings.sort(key=lambda p: len(p[0]))
+        candidates = postings[0][0]
+        for positions, _ in postings[1:]:
+            candidates = candidates[np.isin(candidates, positions, assume_unique=True)]
+            if not len(candidates):
+                return empty
+        scores = np.zeros(len(candidates))
+        for positions, weights in postings:
+            idf = math.log(1 + n_docs / len(positions))
+            scores += idf * weights[np.searchsorted(positions, candidates)]
+        return candidates.astype(np.int64), scores
+
+    def query(self, text=None, category=None, sort_by=None, descending=True, offset=0, limit=None):
+        """筛选 + 排序查询，返回 (产品列表, 命中总数)
+
+        text 为全文检索词，category 为分类（None 或 "全部" 表示不限），
+        sort_by 为排序字段（None 时有检索词按相关度、否则按销量）。
+        """
+        if sort_by and sort_by not in SORT_FIELDS:
+            raise ValueError(f"不支持的排序字段: {sort_by}")
+        category = category or ALL_CATEGORIES
+        end = None if limit is None else offset + limit
+
+        if text and text.strip():
+            positions, scores = self.search_scores(text.strip())
+            if category != ALL_CATEGORIES:
+                matched = np.isin(positions, self.category_positions(category))
+                positions, scores = positions[matched], scores[matched]
+            if sort_by:
+                values = self.table.column(sort_by)[positions]
+            else:
+                values = scores
+                descending = True
+            order = np.argsort(values, kind="stable")
+            if descending:
+                order = order[::-1]
+            positions = positions[order]
+            return self.products(positions[offset:end]), len(positions)
+
+        positions = self._sorted_index(sort_by or "sales", category)
+        total = len(positions)
+        if descending:
+            # 从尾部倒序切片，不复制整个索引
+            start = total - offset - 1
+            stop = None if end is None or total - end - 1 < 0 else total - end - 1
+            page = positions[start:stop:-1] if start >= 0 else positions[:0]
+        else:
+            page = positions[offset:end]
+        return self.products(page), total
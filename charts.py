@@ -0,0 +1,57 @@
+# 智播农链销售平台图表工厂
+#
+# 所有图表统一套用 THEME_COLORS 主题布局，构建好的图表按 (图表名, 数据版本) 缓存，
+# 所有会话共享：数据未变化时直接复用已构建的图表，不再重复执行 px.* 构造和布局更新。
+# 缓存的图表对象只读，页面代码不要再修改返回的图表。
+
+import threading
+import time
+
+from cache import LRUCache
+from config import THEME_COLORS
+
+# 主题布局
+THEME_LAYOUT = {
+    "plot_bgcolor": THEME_COLORS['background'],
+    "paper_bgcolor": THEME_COLORS['accent'],
+}
+
+CACHE_SIZE = 256
+
+_figures = LRUCache(CACHE_SIZE)
+_build_lock = threading.Lock()
+
+
+def themed(fig, **layout):
+    """套用主题布局（可追加其他布局参数）"""
+    fig.update_layout(**THEME_LAYOUT, **layout)
+    return fig
+
+
+def cached_figure(name, version, build, **layout):
+    """按 (图表名, 数据版本) 缓存的图表
+
+    build 为无参函数，返回未套用主题的图表；version 为可哈希的数据版本，
+    数据变化时版本必须变化。
+    """
+    key = (name, version)
+    item = _figures.get(key, time.time())
+    if item is not None:
+        return item[1]
+    with _build_lock:
+        # 多个会话同时未命中时只构建一次
+        item = _figures.get(key, time.time())
+        if item is not None:
+            return item[1]
+        fig = themed(build(), **layout)
+        _figures.put(key, fig, float("inf"))
+    return fig
+
+
+def figure_cache_stats():
+    return {"size": len(_figures), "hits": _figures.hits, "misses": _figures.misses}
+
+
+def clear_figures():
+    """清空图表缓存"""
+    _figures.clear()
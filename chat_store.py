@@ -0,0 +1,169 @@
+# 智播农链销售平台AI客服对话记录
+#
+# ChatStore 把每条消息追加写入本地 SQLite（WAL 模式），按 会话 -> 消息序号 保存完整记录，
+# 会话表按客户和开始时间建索引，客服人员可按客户、日期分页查找历史会话。
+# ChatSession 是每个浏览器会话在内存中的对话窗口：只保留最近 window 条、总字数不超过 max_chars 的消息，
+# 更早的消息只在需要时从 ChatStore 分页读取，会话内存不随对话变长而增长。
+
+import sqlite3
+import threading
+import time
+import uuid
+from collections import deque
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversations (
+    id TEXT PRIMARY KEY,
+    customer TEXT NOT NULL,
+    started_at INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL,
+    messages INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS conversations_customer ON conversations (customer, started_at);
+CREATE INDEX IF NOT EXISTS conversations_started ON conversations (started_at);
+CREATE TABLE IF NOT EXISTS messages (
+    conversation_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    role TEXT NOT NULL,
+    content TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    PRIMARY KEY (conversation_id, seq)
+) WITHOUT ROWID;
+"""
+
+
+class ChatStore:
+    """持久化的对话记录（只追加）"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def start(self, customer, now=None):
+        """开始新会话，返回会话编号"""
+        conversation_id = uuid.uuid4().hex
+        now = int(now if now is not None else time.time())
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO conversations (id, customer, started_at, updated_at) VALUES (?, ?, ?, ?)",
+                (conversation_id, customer, now, now),
+            )
+        return conversation_id
+
+    def append(self, conversation_id, messages, now=None):
+        """追加消息（[{"role", "content"}, ...]），在一个事务内写入，返回第一条消息的序号"""
+        now = int(now if now is not None else time.time())
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._db.execute(
+                    "SELECT messages FROM conversations WHERE id = ?", (conversation_id,)
+                ).fetchone()
+                if row is None:
+                    raise KeyError(f"会话不存在: {conversation_id}")
+                first = row["messages"]
+                self._db.executemany(
+                    "INSERT INTO messages (conversation_id, seq, role, content, created_at) VALUES (?, ?, ?, ?, ?)",
+                    [(conversation_id, first + i, m["role"], m["content"], now) for i, m in enumerate(messages)],
+                )
+                self._db.execute(
+                    "UPDATE conversations SET messages = ?, updated_at = ? WHERE id = ?",
+                    (first + len(messages), now, conversation_id),
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return first
+
+    def conversation(self, conversation_id):
+        """会话信息字典，不存在时为 None"""
+        with self._lock:
+            row = self._db.execute("SELECT * FROM conversations WHERE id = ?", (conversation_id,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def history(self, conversation_id, offset=0, limit=20):
+        """按时间倒序分页读取消息（offset 为从最新一条往前数的条数），返回 (消息列表, 消息总数)"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT messages FROM conversations WHERE id = ?", (conversation_id,)
+            ).fetchone()
+            total = row["messages"] if row else 0
+            # 序号连续，按序号范围定位而不是 OFFSET 逐行跳过
+            rows = self._db.execute(
+                "SELECT seq, role, content, created_at FROM messages WHERE conversation_id = ? AND seq < ? "
+                "ORDER BY seq DESC LIMIT ?",
+                (conversation_id, total - offset, limit),
+            ).fetchall()
+        return [dict(row) for row in rows], total
+
+    def search(self, customer=None, start=None, end=None, offset=0, limit=20):
+        """按客户和开始时间（秒，[start, end)）查找会话，最近的在前，返回 (会话列表, 命中总数)"""
+        clauses, params = [], []
+        if customer:
+            clauses.append("customer = ?")
+            params.append(customer)
+        if start is not None:
+            clauses.append("started_at >= ?")
+            params.append(int(start))
+        if end is not None:
+            clauses.append("started_at < ?")
+            params.append(int(end))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            total = self._db.execute(f"SELECT COUNT(*) FROM conversations{where}", params).fetchone()[0]
+            rows = self._db.execute(
+                f"SELECT * FROM conversations{where} ORDER BY started_at DESC, id LIMIT ? OFFSET ?",
+                [*params, limit, offset],
+            ).fetchall()
+        return [dict(row) for row in rows], total
+
+
+class ChatSession:
+    """一个浏览器会话的对话窗口：最近的消息在内存中，全部消息写入 ChatStore"""
+
+    def __init__(self, store, customer, window=20, max_chars=20000):
+        self.store = store
+        self.customer = customer
+        self.max_chars = max_chars
+        self.conversation_id = None       # 第一次发送消息时才创建会话
+        self.messages = deque(maxlen=window)
+        self.total = 0                    # 会话消息总数（含已移出内存窗口的）
+        self._chars = 0
+
+    @property
+    def dropped(self):
+        """已移出内存窗口、需要从 ChatStore 读取的消息数"""
+        return self.total - len(self.messages)
+
+    def add(self, *messages):
+        """追加消息（先持久化再放入内存窗口）"""
+        if self.conversation_id is None:
+            self.conversation_id = self.store.start(self.customer)
+        self.store.append(self.conversation_id, messages)
+        for message in messages:
+            if len(self.messages) == self.messages.maxlen:
+                self._chars -= len(self.messages[0]["content"])
+            self.messages.append({"role": message["role"], "content": message["content"]})
+            self._chars += len(message["content"])
+        self.total += len(messages)
+        while self._chars > self.max_chars and len(self.messages) > 1:
+            self._chars -= len(self.messages.popleft()["content"])
+
+    def restart(self, customer):
+        """换客户时开始新会话"""
+        self.customer = customer
+        self.conversation_id = None
+        self.messages.clear()
+        self.total = 0
+        self._chars = 0
@@ -1,5 +1,7 @@
 # 智播农链销售平台配置文件
 
+import os
+
 # 页面配置
 PAGE_CONFIG = {
     "page_title": "智播农链销售平台",
@@ -91,6 +93,138 @@ ORDER_STATUS = {
     "cancelled": "已取消"
 }
 
+# 演示数据随机种子（固定后每次刷新的数字保持一致）
+DATA_SEED = 2024
+
+# 订单存储目录（列式内存映射文件）
+ORDER_STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data_store", "orders")
+
+# 销售历史数据范围（演示数据）
+SALES_HISTORY = {
+    "start_date": "2022-01-01",
+    "end_date": "2024-12-31 23:00"
+}
+
+# 销售趋势图时间范围：显示名 -> 天数（None 表示全部）
+SALES_RANGE_OPTIONS = {
+    "最近24小时": 1,
+    "最近7天": 7,
+    "最近30天": 30,
+    "最近90天": 90,
+    "最近1年": 365,
+    "全部": None
+}
+
+# 图表降采样配置（每条曲线发送到浏览器的最多点数）
+DOWNSAMPLING = {
+    "max_points": 2000,
+    "method": "lttb"  # lttb 或 minmax
+}
+
+# 批量导入/导出产品的持久化文件（追加写入，启动时按产品编号合并到演示数据）
+PRODUCT_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data_store", "products.jsonl")
+
+# 批量导入导出配置
+TRANSFER = {
+    "chunk_size": 5000,   # 每块读取/写入的行数
+    "max_errors": 100,    # 导入结果中保留的错误行数
+    "export_dir": os.path.join(os.path.dirname(os.path.abspath(__file__)), "data_store", "exports")
+}
+
+# AI客服问答检索配置
+FAQ_SEARCH = {
+    "top_k": 3,
+    "min_score": 1.0
+}
+
+# 直播实时数据配置
+LIVE_METRICS = {
+    "window_seconds": 3600,  # 每个直播间保留的逐秒样本数
+    "tick_seconds": 1,       # 采集间隔
+    "simulate": True         # 使用本地模拟器代替直播平台推送
+}
+
+# 产品列表排序选项：显示名 -> (排序字段, 是否降序)，字段为 None 时按相关度/销量
+PRODUCT_SORT_OPTIONS = {
+    "综合排序": (None, True),
+    "销量从高到低": ("sales", True),
+    "价格从低到高": ("current_price", False),
+    "价格从高到低": ("current_price", True),
+    "库存从少到多": ("stock", False),
+    "评分从高到低": ("rating", True)
+}
+
+# 库存配置
+INVENTORY = {
+    "default_threshold": 100,  # 产品未单独设置时的补货阈值
+    "reservation_ttl": 900     # 预留库存的有效期（秒）
+}
+
+# 事件总线与局部刷新配置
+EVENT_BUS = {
+    "queue_size": 1000,           # 每个异步订阅者的队列长度
+    "history": 200,               # 保留最近多少条事件
+    "refresh_seconds": 2,         # 局部刷新区域的检查间隔（需要 Streamlit 支持 fragment）
+    "load_orders_per_second": 20  # 负载模拟的默认写入速率
+}
+
+# 客户分析配置
+CUSTOMER_ANALYTICS = {
+    "spend_bins": [50, 100, 200],   # 消费金额区间边界（元）
+    "rfm_quantiles": 5,             # RFM 各维度的分档数
+    "cohort_months": 6              # 复购队列观察的月数
+}
+
+# 销售预测配置
+FORECAST = {
+    "season_length": 7,             # 季节周期（天）
+    "refit_days": 7,                # 增量更新累计超过多少天后重新拟合参数
+    "processes": None,              # 拟合进程数，None 为 CPU 核数（序列较多时才启用进程池）
+    "horizon_options": [7, 14, 30], # 可选的预测天数
+    "history_days": 60              # 预测图中显示的历史天数
+}
+
+# 共享数据快照配置（同机多个 streamlit 进程共享列式数据，发布方：python snapshots.py）
+DATASET_HOST = {
+    "path": os.path.join(os.path.dirname(os.path.abspath(__file__)), "data_store", "snapshots"),
+    "attach": False,                # 为 True 时销售数据和订单分析从最新快照读取
+    "poll_seconds": 2.0,            # 检查新版本的间隔（秒）
+    "keep": 3                       # 保留的快照版本数
+}
+
+# AI客服对话记录配置
+CHAT_STORE = {
+    "path": os.path.join(os.path.dirname(os.path.abspath(__file__)), "data_store", "chat.sqlite3"),
+    "window": 20,                   # 每个会话在内存中保留的最近消息数
+    "max_chars": 20000,             # 每个会话在内存中保留的消息总字数上限
+    "page_size": 10                 # 历史消息和会话查询每页条数
+}
+
+# 数据接口配置（python api.py）
+API = {
+    "host": "127.0.0.1",
+    "port": 8600,
+    "keepalive_timeout": 15,        # 长连接空闲超时（秒）
+    "page_size": 20,                # 列表接口默认每页条数
+    "max_page_size": 500,           # 列表接口每页条数上限
+    "cache_size": 4096              # 缓存的响应数
+}
+
+# 产品目录配置
+CATALOG = {
+    "chart_products": 50            # 产品图表最多显示的产品数（按销量或库存取前 N 个）
+}
+
+# 性能剖析配置
+PROFILING = {
+    "enabled": True,
+    "history": 20,              # 保留最近多少次页面运行的明细
+    "admin_roles": ["管理员"],   # 可查看性能监控面板的角色
+    "default_role": "访客",      # 未登录（会话中没有 current_role）时的角色，不属于 admin_roles
+    "metrics_port": None,       # Prometheus 抓取端口，None 表示不启动
+    "metrics_host": "127.0.0.1",  # 抓取接口绑定地址，需要从其他机器抓取时再改为对外地址
+}
+
 # 数据刷新间隔（秒）
 REFRESH_INTERVAL = 30
 
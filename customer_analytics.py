@@ -0,0 +1,147 @@
+# 智播农链销售平台客户分析
+#
+# 在列式订单数据（客户编号、金额（分）、下单时间（秒））上做客户维度的统计，全部向量化：
+# - customer_summary：按客户分组汇总订单数、消费金额、首末次下单时间（bincount / ufunc.at 分组聚合）
+# - spend_distribution：按可配置的金额区间边界统计客户数（np.digitize + bincount）
+# - rfm_scores：RFM 打分（最近消费间隔 / 消费频次 / 消费金额按分位数分档）和八类客户分群
+# - cohort_retention：按首购月份分组的复购队列，统计此后各月仍有购买的客户比例
+
+import numpy as np
+import pandas as pd
+
+from records import from_cents
+
+SECONDS_PER_DAY = 86400
+
+# RFM 八类分群，按 R 高 * 4 + F 高 * 2 + M 高 编码（高 = 得分高于平均分）
+RFM_SEGMENTS = np.array([
+    "一般挽留客户",   # R 低 F 低 M 低
+    "重要挽留客户",   # R 低 F 低 M 高
+    "一般保持客户",   # R 低 F 高 M 低
+    "重要保持客户",   # R 低 F 高 M 高
+    "一般发展客户",   # R 高 F 低 M 低
+    "重要发展客户",   # R 高 F 低 M 高
+    "一般价值客户",   # R 高 F 高 M 低
+    "重要价值客户",   # R 高 F 高 M 高
+], dtype=object)
+
+
+def customer_summary(customer_ids, amounts, dates):
+    """按客户汇总，返回以客户编号为索引的 DataFrame
+
+    列为 orders（订单数）、monetary（消费金额，元）、first_order / last_order（首末次下单时间，秒）。
+    customer_ids 为非负整数（订单存储的客户编号），amounts 以分为单位。
+    """
+    customer_ids = np.asarray(customer_ids, dtype=np.int64)
+    dates = np.asarray(dates, dtype=np.int64)
+    size = int(customer_ids.max()) + 1 if len(customer_ids) else 0
+    orders = np.bincount(customer_ids, minlength=size)
+    spent = np.bincount(customer_ids, weights=amounts, minlength=size)
+    first = np.full(size, np.iinfo(np.int64).max)
+    last = np.full(size, np.iinfo(np.int64).min)
+    np.minimum.at(first, customer_ids, dates)
+    np.maximum.at(last, customer_ids, dates)
+
+    present = np.flatnonzero(orders)
+    return pd.DataFrame({
+        "orders": orders[present],
+        "monetary": from_cents(spent[present]),
+        "first_order": first[present],
+        "last_order": last[present],
+    }, index=pd.Index(present, name="customer_id"))
+
+
+def spend_labels(bins):
+    """区间边界 -> 区间标签，如 [50, 100] -> ['0-50', '50-100', '100+']"""
+    edges = [0, *bins]
+    labels = [f"{lo:g}-{hi:g}" for lo, hi in zip(edges[:-1], edges[1:])]
+    return labels + [f"{edges[-1]:g}+"]
+
+
+def spend_distribution(spending, bins):
+    """按金额区间边界（升序，左闭右开）统计客户数，返回以区间标签为索引的 Series"""
+    bins = np.asarray(bins, dtype=np.float64)
+    if np.any(np.diff(bins) <= 0):
+        raise ValueError(f"消费金额区间边界必须严格递增: {bins.tolist()}")
+    counts = np.bincount(np.digitize(spending, bins), minlength=len(bins) + 1)
+    return pd.Series(counts, index=spend_labels(bins.tolist()))
+
+
+def _quantile_score(values, quantiles):
+    """按分位数分档，返回 1..quantiles（值越大分越高，相同的值得分相同）"""
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.int8)
+    edges = np.quantile(values, np.linspace(0, 1, quantiles + 1)[1:-1])
+    return (np.digitize(values, edges, right=True) + 1).astype(np.int8)
+
+
+def rfm_scores(summary, now=None, quantiles=5):
+    """RFM 打分与分群
+
+    summary 为 customer_summary 的结果；now 为计算最近消费间隔的基准时间（秒），默认取最后一笔订单时间。
+    返回以客户编号为索引的 DataFrame：recency（天）、frequency、monetary、r / f / m（1..quantiles）、segment。
+    """
+    last_order = summary["last_order"].to_numpy()
+    if now is None:
+        now = last_order.max() if len(last_order) else 0
+    recency = (now - last_order) / SECONDS_PER_DAY
+    frequency = summary["orders"].to_numpy()
+    monetary = summary["monetary"].to_numpy()
+
+    # 最近消费间隔越短得分越高
+    r = (quantiles + 1 - _quantile_score(recency, quantiles)).astype(np.int8)
+    f = _quantile_score(frequency, quantiles)
+    m = _quantile_score(monetary, quantiles)
+    codes = (r > r.mean()) * 4 + (f > f.mean()) * 2 + (m > m.mean())
+    return pd.DataFrame({
+        "recency": recency,
+        "frequency": frequency,
+        "monetary": monetary,
+        "r": r,
+        "f": f,
+        "m": m,
+        "segment": RFM_SEGMENTS[codes],
+    }, index=summary.index)
+
+
+def _month_index(dates):
+    """下单时间（秒）-> (自最早月份起的月序号, 月份列表)"""
+    lo, hi = (np.datetime64(int(value), "s").astype("datetime64[M]") for value in (dates.min(), dates.max()))
+    months = np.arange(lo, hi + 1)
+    starts = months.astype("datetime64[s]").astype(np.int64)
+    return np.searchsorted(starts, dates, side="right") - 1, months
+
+
+def cohort_retention(customer_ids, dates, months=6):
+    """复购队列：按首购月份分组，返回各队列此后第 0..months-1 个月有购买的客户比例
+
+    返回 DataFrame，索引为首购月份（YYYY-MM），列为 0..months-1，另附 customers 列为队列人数；
+    尚未到达的月份为 NaN。
+    """
+    customer_ids = np.asarray(customer_ids, dtype=np.int64)
+    dates = np.asarray(dates, dtype=np.int64)
+    if len(customer_ids) == 0:
+        return pd.DataFrame(columns=[*range(months), "customers"])
+    month, calendar = _month_index(dates)
+    n_months = len(calendar)
+
+    # 每个客户的首购月份，以及每笔订单距首购的月数
+    first = np.full(int(customer_ids.max()) + 1, n_months)
+    np.minimum.at(first, customer_ids, month)
+    offset = month - first[customer_ids]
+
+    # 客户 x 月数 的购买标记（同一客户同月多笔订单只计一次）
+    keep = offset < months
+    active = np.zeros((len(first), months), dtype=bool)
+    active[customer_ids[keep], offset[keep]] = True
+    buyers, ks = np.nonzero(active)
+    counts = np.bincount(first[buyers] * months + ks, minlength=n_months * months).reshape(n_months, months)
+
+    sizes = counts[:, 0]
+    rates = counts / np.maximum(sizes, 1)[:, None]
+    rates[np.arange(n_months)[:, None] + np.arange(months) >= n_months] = np.nan
+    present = sizes > 0
+    table = pd.DataFrame(rates[present], index=calendar[present].astype(str), columns=range(months))
+    table["customers"] = sizes[present]
+    return table
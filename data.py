@@ -1,9 +1,30 @@
 # 智播农链销售平台演示数据
+#
+# pandas 只在生成销售数据等需要 DataFrame 的函数中按需导入，首屏（侧边栏和首页仪表板）不加载。
 
-import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
+import json
+import os
+import threading
+
+from cache import cached, generation, invalidate
+from catalog import ProductCatalog
+from chat_store import ChatStore
+from config import (CHAT_STORE, DATA_SEED, DATASET_HOST, DOWNSAMPLING, EVENT_BUS, FORECAST, INVENTORY, LIVE_METRICS,
+                    ORDER_STORE_DIR, PRODUCT_STORE_PATH, SALES_HISTORY)
+from downsample import downsample, time_slice
+from events import LIVE_METRICS_UPDATED, ORDER_CREATED, ORDER_STATUS_CHANGED, STOCK_CHANGED, bus, refresh_on, simulate_load
+from faq_search import FAQIndex
+from forecast import ForecastEngine, daily_sales_matrix
+from inventory import InsufficientStockError, InventoryEngine
+from live_metrics import LiveMetricsHub, start_background
+from order_query import OrderIndex
+from profiling import profiled
+from records import FAQ, Product, ProductTable, from_cents
+from order_store import ORDER_COLUMNS, STATUS_KEYS, OrderStore, to_timestamp
+from rollups import OrderRollups, SalesRollup
+from snapshots import SnapshotReader, SnapshotStore
 
 # 农产品演示数据
 PRODUCTS_DATA = [
@@ -88,27 +109,46 @@ PRODUCTS_DATA = [
         "nutrition": "富含维生素C、膳食纤维、钾等营养成分"
     }
 ]
+PRODUCTS_DATA = [Product.from_dict(product) for product in PRODUCTS_DATA]
 
 # 销售数据
-def generate_sales_data():
-    """生成销售数据"""
-    dates = pd.date_range(start='2024-01-01', end='2024-12-31', freq='D')
-    sales_data = []
-    
-    for date in dates:
-        daily_sales = random.randint(3000, 15000)
-        orders = random.randint(20, 80)
-        customers = random.randint(15, 60)
-        
-        sales_data.append({
-            'date': date,
-            'sales_amount': daily_sales,
-            'orders': orders,
-            'customers': customers,
-            'avg_order_value': round(daily_sales / orders, 2)
-        })
-    
-    return pd.DataFrame(sales_data)
+def generate_sales_data(start_date='2024-01-01', end_date='2024-12-31', seed=None,
+                        periods=None, freq='D', series=None):
+    """生成销售数据
+
+    按列向量化生成，`periods` 指定行数（给定时忽略 `end_date`），
+    `series` 为可选的序列标签（如 产品×乡镇），每个标签生成一条完整的日期序列。
+    相同的 `seed` 生成相同的数据。
+    """
+    import pandas as pd
+
+    if periods is not None:
+        dates = pd.date_range(start=start_date, periods=periods, freq=freq)
+    else:
+        dates = pd.date_range(start=start_date, end=end_date, freq=freq)
+
+    n_dates = len(dates)
+    n_series = 1 if series is None else len(series)
+    rows = n_dates * n_series
+    rng = np.random.default_rng(seed)
+
+    # 与原先 random.randint 的闭区间保持一致
+    daily_sales = rng.integers(3000, 15001, size=rows, dtype=np.int64)
+    orders = rng.integers(20, 81, size=rows, dtype=np.int64)
+    customers = rng.integers(15, 61, size=rows, dtype=np.int64)
+
+    columns = {}
+    if series is not None:
+        columns['series'] = pd.Categorical.from_codes(
+            np.repeat(np.arange(n_series), n_dates), categories=list(series)
+        )
+    columns['date'] = np.tile(dates.values, n_series)
+    columns['sales_amount'] = daily_sales
+    columns['orders'] = orders
+    columns['customers'] = customers
+    columns['avg_order_value'] = np.round(daily_sales / orders, 2)
+
+    return pd.DataFrame(columns)
 
 # 直播数据
 LIVE_STREAMING_DATA = {
@@ -152,34 +192,27 @@ LIVE_STREAMING_DATA = {
 }
 
 # 订单数据
-def generate_orders_data():
-    """生成订单数据"""
-    orders = []
+def generate_order_columns(count, seed=None, start_no=1):
+    """按列生成订单数据（供订单存储使用），字典列为编码"""
+    rng = np.random.default_rng(seed)
     order_statuses = ["pending", "confirmed", "processing", "shipped", "delivered", "completed"]
-    
-    for i in range(50):
-        order_id = f"ORD{str(i+1).zfill(6)}"
-        customer_name = f"客户{i+1}"
-        product = random.choice(PRODUCTS_DATA)
-        quantity = random.randint(1, 5)
-        total_amount = product["current_price"] * quantity
-        status = random.choice(order_statuses)
-        order_date = datetime.now() - timedelta(days=random.randint(0, 30))
-        
-        orders.append({
-            "order_id": order_id,
-            "customer_name": customer_name,
-            "product_name": product["name"],
-            "quantity": quantity,
-            "unit_price": product["current_price"],
-            "total_amount": total_amount,
-            "status": status,
-            "order_date": order_date,
-            "phone": f"138****{random.randint(1000, 9999)}",
-            "address": f"保定市阜平县{random.choice(['城关镇', '平阳镇', '王林口镇'])}",
-        })
-    
-    return orders
+    prices = np.array([p.current_price_cents for p in PRODUCTS_DATA], dtype=np.int64)
+
+    product = rng.integers(0, len(PRODUCTS_DATA), size=count)
+    quantity = rng.integers(1, 6, size=count)
+    now = to_timestamp(datetime.now())
+    return {
+        "order_no": np.arange(start_no, start_no + count),
+        "customer_id": np.arange(start_no, start_no + count),
+        "product": product,
+        "quantity": quantity,
+        "unit_price": prices[product],
+        "total_amount": prices[product] * quantity,
+        "status": rng.integers(0, len(order_statuses), size=count),
+        "township": rng.integers(0, 3, size=count),
+        "order_date": now - rng.integers(0, 31, size=count) * 86400,
+        "phone": rng.integers(1000, 10000, size=count),
+    }
 
 # 客服问答数据
 FAQ_DATA = [
@@ -209,6 +242,7 @@ FAQ_DATA = [
         "category": "物流配送"
     }
 ]
+FAQ_DATA = [FAQ.from_dict(faq) for faq in FAQ_DATA]
 
 # 公告数据
 ANNOUNCEMENTS = [
@@ -233,26 +267,449 @@ ANNOUNCEMENTS = [
 ]
 
 # 获取数据的函数
-def get_products_data():
-    """获取产品数据"""
-    return PRODUCTS_DATA
+_order_store = None
+_order_index = None
+_order_rollups = None
+_order_store_lock = threading.RLock()
+_product_catalog = None
+_inventory = None
+_product_catalog_lock = threading.Lock()
+_product_write_lock = threading.Lock()
+_faq_index = None
+_faq_index_lock = threading.RLock()
+_live_metrics = None
+_live_metrics_lock = threading.Lock()
+_forecast_engine = None
+_forecast_engine_lock = threading.Lock()
+_snapshot_reader = None
+_snapshot_reader_lock = threading.Lock()
+_chat_store = None
+_chat_store_lock = threading.Lock()
+
+def get_product_catalog():
+    """获取产品目录（首次使用时以演示产品和持久化文件中的产品建立）"""
+    global _product_catalog
+    with _product_catalog_lock:
+        if _product_catalog is None:
+            catalog = ProductCatalog(PRODUCTS_DATA)
+            _load_saved_products(catalog)
+            _product_catalog = catalog
+    return _product_catalog
+
+def _load_saved_products(catalog):
+    """把持久化文件中的产品按编号写入产品目录（后写入的覆盖先写入的）"""
+    if not PRODUCT_STORE_PATH or not os.path.exists(PRODUCT_STORE_PATH):
+        return
+    with open(PRODUCT_STORE_PATH, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                catalog.upsert(Product.from_dict(json.loads(line)))
+
+def next_product_id():
+    """下一个可用的产品编号"""
+    catalog = get_product_catalog()
+    number = len(catalog) + 1
+    while catalog.get(f"P{number:03d}") is not None:
+        number += 1
+    return f"P{number:03d}"
 
-def get_sales_data():
-    """获取销售数据"""
-    return generate_sales_data()
+def upsert_products(products, defaults=None):
+    """批量新增或更新产品：写入持久化文件，更新产品目录和库存，返回产品编号列表
 
+    已存在的产品只更新给出的字段，补货阈值未给出时保持库存引擎中的当前值；
+    新产品缺少的字段取 defaults（导入时为 transfer.PRODUCT_DEFAULTS）。
+    """
+    catalog = get_product_catalog()
+    inventory = get_inventory()
+    ids = []
+    with _product_write_lock:
+        for product in products:
+            product = dict(product)
+            if not product.get("id"):
+                product["id"] = next_product_id()
+            fields = product
+            existing = catalog.get(product["id"])
+            if existing is not None:
+                existing.update(fields)
+                product = existing
+            else:
+                product = Product.from_dict(dict(defaults or {}, **fields))
+            catalog.upsert(product)
+            threshold = fields.get("reorder_threshold")
+            if threshold is None and product["id"] in inventory:
+                threshold = inventory.threshold(product["id"])
+            inventory.add_product(product["id"], product["stock"], threshold)
+            ids.append(product["id"])
+        if PRODUCT_STORE_PATH:
+            os.makedirs(os.path.dirname(PRODUCT_STORE_PATH), exist_ok=True)
+            with open(PRODUCT_STORE_PATH, "a", encoding="utf-8") as f:
+                f.writelines(
+                    json.dumps(catalog.get(product_id).to_dict(), ensure_ascii=False) + "\n" for product_id in ids
+                )
+    invalidate("products")
+    bus.publish(STOCK_CHANGED, products=len(ids), reason="import")
+    return ids
+
+def get_inventory():
+    """获取库存引擎（首次使用时按产品当前库存登记）"""
+    global _inventory
+    catalog = get_product_catalog()
+    with _product_catalog_lock:
+        if _inventory is None:
+            inventory = InventoryEngine(INVENTORY["default_threshold"], INVENTORY["reservation_ttl"])
+            thresholds = catalog.column("reorder_threshold")
+            inventory.add_products(
+                catalog.column("id").tolist(), catalog.column("stock"),
+                np.where(thresholds == ProductTable.NO_THRESHOLD, inventory.default_threshold, thresholds)
+            )
+            inventory.subscribe(_on_stock_change)
+            _inventory = inventory
+    return _inventory
+
+def _on_stock_change(product_id, on_hand, available, reason):
+    """库存变化后：同步产品库存字段并发布事件"""
+    if reason in ("commit", "restock"):
+        get_product_catalog().update_fields(product_id, stock=on_hand)
+        invalidate("products")
+    bus.publish(STOCK_CHANGED, product_id=product_id, on_hand=on_hand, available=available, reason=reason)
+
+def place_order(product_id, quantity, customer_id, township=0, phone=0):
+    """下单：预留库存 -> 写入订单 -> 提交扣减，返回订单行号；可售库存不足时抛出 InsufficientStockError"""
+    inventory = get_inventory()
+    store = get_order_store()
+    product = get_product_catalog().get(product_id)
+    reservation = inventory.reserve(product_id, quantity)
+    try:
+        rows = store.append_columns({
+            "customer_id": [customer_id],
+            "product": [store.encode("product", product["name"], create=True)],
+            "quantity": [quantity],
+            "unit_price": [product.current_price_cents],
+            "total_amount": [product.current_price_cents * quantity],
+            "status": [store.encode("status", "pending")],
+            "township": [township],
+            "order_date": [to_timestamp(datetime.now())],
+            "phone": [phone],
+        })
+    except Exception:
+        inventory.release(reservation.id)
+        raise
+    inventory.commit(reservation.id)
+    return int(rows[0])
+
+@profiled()
+@cached(scope="session", tags=("products",))
+def search_products(text=None, category=None, sort_by=None, descending=True, offset=0, limit=None):
+    """产品检索：全文检索 + 分类筛选 + 排序，返回 (产品列表, 命中总数)
+
+    检索条件和页码因会话而异，结果缓存在各自会话中，翻页或其他控件触发重新运行时不再重复查询。
+    """
+    return get_product_catalog().query(text, category, sort_by, descending, offset, limit)
+
+def data_version(source):
+    """数据版本（products/orders/order_columns/sales/...），数据变化后随之变化，用作图表等下游缓存的键
+
+    orders 为本进程订单存储的版本（订单索引、汇总读取的数据）；order_columns 为 get_order_columns
+    读取的数据的版本，挂载共享快照时为快照版本。
+    """
+    if source == "order_columns":
+        snapshot = get_snapshot()
+        if snapshot is not None and "orders" in snapshot:
+            return ("snapshot", snapshot.version)
+        source = "orders"
+    if source == "orders":
+        store = get_order_store()
+        return (store.path, store.version)
+    if source == "products":
+        return (get_product_catalog().version, generation("products"))
+    return generation(source)
+
+@profiled()
+@cached(tags=("sales",))
+def get_sales_data(freq='D'):
+    """获取销售数据（freq='h' 为逐小时数据）"""
+    snapshot = get_snapshot()
+    if snapshot is not None and f"sales_{freq}" in snapshot:
+        return snapshot.frame(f"sales_{freq}")
+    return generate_sales_data(seed=DATA_SEED, freq=freq, **SALES_HISTORY)
+
+@profiled()
+def get_sales_trend(days=None, metric='sales_amount', freq='h', max_points=None):
+    """销售趋势：最近 days 天（None 为全部）降采样后的 (日期, 数值, 原始点数)"""
+    sales_data = get_sales_data(freq)
+    dates = sales_data['date'].values
+    window = slice(None)
+    if days is not None and len(dates):
+        window = time_slice(dates, start=dates[-1] - np.timedelta64(days * 24 - 1, 'h'))
+    x, y = downsample(
+        dates[window],
+        sales_data[metric].values[window],
+        max_points or DOWNSAMPLING['max_points'],
+        DOWNSAMPLING['method']
+    )
+    return x, y, len(dates[window])
+
+@profiled()
+@cached(tags=("live",))
 def get_live_data():
     """获取直播数据"""
     return LIVE_STREAMING_DATA
 
-def get_orders_data():
-    """获取订单数据"""
-    return generate_orders_data()
+@profiled()
+def get_live_metrics():
+    """获取直播实时数据（首次使用时启动采集）"""
+    global _live_metrics
+    with _live_metrics_lock:
+        if _live_metrics is None:
+            hub = LiveMetricsHub(LIVE_METRICS["window_seconds"])
+            rooms = LIVE_STREAMING_DATA["live_rooms"]
+            for room in rooms:
+                hub.room(room["id"])
+            hub.subscribe(lambda timestamp, room_ids: bus.publish(
+                LIVE_METRICS_UPDATED, time=timestamp, rooms=len(room_ids)
+            ))
+            if LIVE_METRICS["simulate"]:
+                start_background(hub, rooms, LIVE_METRICS["tick_seconds"], seed=DATA_SEED)
+            _live_metrics = hub
+    return _live_metrics
+
+@profiled()
+def get_live_rooms():
+    """获取直播间列表（观众数和销售额为实时数据）"""
+    hub = get_live_metrics()
+    rooms = []
+    for room in get_live_data()["live_rooms"]:
+        series = hub.room(room["id"])
+        if series.last_time is not None:
+            room = dict(
+                room,
+                viewers=int(series.latest()["viewers"]),
+                sales=room["sales"] + round(series.total_gmv)
+            )
+        rooms.append(room)
+    return rooms
+
+@profiled()
+def get_order_store():
+    """获取订单存储（首次使用时写入演示订单）"""
+    global _order_store
+    with _order_store_lock:
+        if _order_store is None:
+            store = OrderStore(ORDER_STORE_DIR)
+            if len(store) == 0:
+                for name in (p["name"] for p in PRODUCTS_DATA):
+                    store.encode("product", name, create=True)
+                store.append_columns(generate_order_columns(50, seed=DATA_SEED))
+            store.subscribe(_on_order_write)
+            _order_store = store
+    return _order_store
+
+def _on_order_write(event, rows, **details):
+    """订单写入后：使订单缓存失效并发布事件"""
+    invalidate("orders")
+    event = details.get("written", event)
+    if event == "append":
+        bus.publish(ORDER_CREATED, rows=len(rows), first_row=int(rows[0]) if len(rows) else None)
+    elif event == "status":
+        bus.publish(ORDER_STATUS_CHANGED, rows=len(rows), status=STATUS_KEYS[details["status"]])
 
+@profiled()
+@refresh_on(ORDER_CREATED, ORDER_STATUS_CHANGED, LIVE_METRICS_UPDATED)
+def get_quick_stats():
+    """侧边栏快速统计（订单或直播数据有新事件时才重新计算）"""
+    live_rooms = get_live_rooms()
+    _, today_sales = get_order_rollups().cell('day', datetime.now())
+    return {
+        "rooms": len(live_rooms),
+        "today_sales": today_sales,
+        "viewers": sum(room['viewers'] for room in live_rooms),
+    }
+
+def start_load_simulator(rate=None, seconds=60, seed=None):
+    """启动负载模拟：按 rate 次/秒随机下单、更新订单状态和补货，返回 Future（结果为执行次数）"""
+    store = get_order_store()
+    inventory = get_inventory()
+    product_ids = get_product_catalog().column("id")
+
+    def random_product(rng):
+        return str(product_ids[int(rng.integers(len(product_ids)))])
+
+    def create_order(rng):
+        try:
+            place_order(
+                random_product(rng), int(rng.integers(1, 6)), int(rng.integers(1, 100000)),
+                township=int(rng.integers(3)), phone=int(rng.integers(1000, 10000))
+            )
+        except InsufficientStockError:
+            pass
+
+    def restock(rng):
+        inventory.restock(random_product(rng), int(rng.integers(50, 201)))
+
+    def change_status(rng):
+        if len(store):
+            store.update_status(int(rng.integers(len(store))), STATUS_KEYS[int(rng.integers(len(STATUS_KEYS)))])
+
+    actions = [(3, create_order), (1, change_status), (0.2, restock)]
+    return bus.submit(simulate_load(actions, rate or EVENT_BUS["load_orders_per_second"], seconds, seed))
+
+@profiled()
+def get_order_index():
+    """获取订单索引"""
+    global _order_index
+    with _order_store_lock:
+        if _order_index is None:
+            _order_index = OrderIndex(get_order_store())
+    return _order_index
+
+@profiled()
+@cached(scope="session", tags=("orders",))
+def query_orders(statuses=None, start=None, end=None, id_prefix=None, cursor=None, limit=None):
+    """订单组合查询（参数同 OrderIndex.query），结果缓存在当前会话中"""
+    return get_order_index().query(statuses, start, end, id_prefix, cursor, limit)
+
+@profiled()
+def get_order_rollups():
+    """获取订单汇总"""
+    global _order_rollups
+    with _order_store_lock:
+        if _order_rollups is None:
+            _order_rollups = OrderRollups(get_order_store())
+    return _order_rollups
+
+@profiled()
+@cached(tags=("sales",))
+def get_sales_rollup():
+    """获取销售数据前缀和"""
+    return SalesRollup(get_sales_data())
+
+@profiled()
+@cached(tags=("orders",))
+def get_customer_summary():
+    """获取客户汇总（订单数、消费金额、首末次下单时间）"""
+    from customer_analytics import customer_summary
+
+    orders, _ = get_order_columns(['customer_id', 'total_amount', 'order_date'])
+    return customer_summary(orders['customer_id'], orders['total_amount'], orders['order_date'])
+
+@profiled()
+@cached(tags=("orders",))
+def get_sales_matrix():
+    """产品×乡镇 逐日销售额（不含今天和已取消的订单），返回 (序列标签列表, 起始日, 序列 × 天 矩阵)
+
+    序列标签为 (产品名, 乡镇)，只保留有过销售的组合；起始日为自 1970-01-01 起的天数。
+    """
+    orders, dictionaries = get_order_columns(['product', 'township', 'order_date', 'total_amount', 'status'])
+    products = dictionaries['product']
+    townships = dictionaries['township']
+    valid = orders['status'] != dictionaries['status'].index('cancelled')
+    codes = orders['product'][valid].astype(np.int64) * len(townships) + orders['township'][valid]
+    today = to_timestamp(datetime.now().replace(hour=0, minute=0, second=0, microsecond=0))
+    start_day, matrix = daily_sales_matrix(
+        codes, orders['order_date'][valid], from_cents(orders['total_amount'][valid]),
+        len(products) * len(townships), today
+    )
+    active = np.flatnonzero(matrix.any(axis=1))
+    labels = [(products[i // len(townships)], townships[i % len(townships)]) for i in active]
+    return labels, start_day, matrix[active]
+
+def get_forecast_engine():
+    """获取销售预测引擎（单例）"""
+    global _forecast_engine
+    with _forecast_engine_lock:
+        if _forecast_engine is None:
+            _forecast_engine = ForecastEngine(
+                FORECAST['season_length'], FORECAST['refit_days'], FORECAST['processes']
+            )
+    return _forecast_engine
+
+@profiled()
+def get_sales_forecast(horizon):
+    """产品×乡镇 逐日销售额预测，返回 (序列标签列表, 起始日, 历史矩阵, 预测矩阵)
+
+    有新的完整天时预测引擎增量更新，否则直接复用已拟合的模型。
+    """
+    labels, start_day, history = get_sales_matrix()
+    engine = get_forecast_engine()
+    engine.update(start_day, history)
+    return labels, start_day, history, engine.forecast(horizon)
+
+def get_order_columns(names):
+    """订单列（只读数组）和字典列的取值表，返回 (列名 -> 数组, 字典名 -> 取值列表)
+
+    已挂载共享快照时从快照读取，否则直接读取订单存储。
+    """
+    snapshot = get_snapshot()
+    if snapshot is not None and "orders" in snapshot:
+        return snapshot.columns("orders", names), snapshot.meta["orders"]["dictionaries"]
+    store = get_order_store()
+    return store.columns(names), {name: store.dictionary(name) for name in ("status", "product", "township")}
+
+def get_snapshot():
+    """当前共享数据快照，未启用挂载或尚未发布时为 None"""
+    global _snapshot_reader
+    if not DATASET_HOST["attach"]:
+        return None
+    with _snapshot_reader_lock:
+        if _snapshot_reader is None:
+            reader = SnapshotReader(SnapshotStore(DATASET_HOST["path"], DATASET_HOST["keep"]),
+                                    DATASET_HOST["poll_seconds"])
+            reader.subscribe(lambda snapshot: invalidate("sales", "orders"))
+            _snapshot_reader = reader
+    return _snapshot_reader.current()
+
+def publish_snapshot():
+    """把本进程的销售数据和订单列发布为新的共享快照，返回版本号"""
+    tables = {}
+    for freq in ('D', 'h'):
+        frame = generate_sales_data(seed=DATA_SEED, freq=freq, **SALES_HISTORY)
+        tables[f"sales_{freq}"] = {name: frame[name].to_numpy() for name in frame.columns}
+
+    store = get_order_store()
+    with _order_store_lock:
+        tables["orders"] = store.columns(ORDER_COLUMNS)
+        orders_meta = {
+            "version": store.version,
+            "dictionaries": {name: list(store.dictionary(name)) for name in ("status", "product", "township")},
+        }
+    return SnapshotStore(DATASET_HOST["path"], DATASET_HOST["keep"]).publish(tables, {"orders": orders_meta})
+
+def get_chat_store():
+    """获取AI客服对话记录（首次使用时打开数据库）"""
+    global _chat_store
+    with _chat_store_lock:
+        if _chat_store is None:
+            os.makedirs(os.path.dirname(CHAT_STORE["path"]), exist_ok=True)
+            _chat_store = ChatStore(CHAT_STORE["path"])
+    return _chat_store
+
+@profiled()
+@cached(tags=("faq",))
 def get_faq_data():
     """获取FAQ数据"""
     return FAQ_DATA
 
+@profiled()
+def get_faq_index():
+    """获取FAQ检索索引（首次使用时建立）"""
+    global _faq_index
+    with _faq_index_lock:
+        if _faq_index is None:
+            _faq_index = FAQIndex(FAQ_DATA)
+    return _faq_index
+
+def add_faq(question, answer, category):
+    """新增问答并增量更新检索索引"""
+    faq = FAQ(question=question, answer=answer, category=category)
+    index = get_faq_index()
+    with _faq_index_lock:
+        FAQ_DATA.append(faq)
+        index.add(faq)
+    invalidate("faq")
+    return faq
+
+@profiled()
+@cached(tags=("announcements",))
 def get_announcements():
     """获取公告数据"""
     return ANNOUNCEMENTS 
\ No newline at end of file
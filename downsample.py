@@ -0,0 +1,118 @@
+# 智播农链销售平台时间序列降采样
+#
+# 长时间序列（多年逐小时数据）在服务端降采样后再交给图表，浏览器收到的点数有上限：
+# - minmax：把序列等分为若干桶，每桶保留最小值和最大值，完全向量化
+# - lttb：Largest-Triangle-Three-Buckets，保留视觉形状最好；先用 minmax 预选候选点，
+#   再在候选点上逐桶选取三角形面积最大的点（MinMaxLTTB）
+# 横轴可以是数值或 datetime64，序列须按横轴升序排列。
+
+import numpy as np
+
+# minmax 预选时每个输出点保留的候选点数
+LTTB_PRESELECT_RATIO = 4
+
+
+def _as_float(x):
+    """横轴转为浮点数（datetime64 按纳秒）"""
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype("datetime64[ns]").astype(np.int64).astype(np.float64)
+    return x.astype(np.float64)
+
+
+def _buckets(n, n_buckets):
+    """把 1..n-2 之间的下标分为 n_buckets 个等长桶，返回 (桶长度, 补齐后的下标矩阵, 有效掩码)"""
+    inner = n - 2
+    size = -(-inner // n_buckets)
+    n_buckets = -(-inner // size)
+    index = np.arange(n_buckets * size).reshape(n_buckets, size) + 1
+    return size, index, index < n - 1
+
+
+def _stride_indices(n, n_out):
+    """输出点数低于算法下限时等间隔取点（含首尾点），保证不超过 n_out 个"""
+    if n_out <= 0:
+        return np.arange(0)
+    if n_out == 1:
+        return np.arange(1)
+    return np.unique(np.linspace(0, n - 1, n_out).round().astype(np.int64))
+
+
+def minmax_indices(y, n_out):
+    """minmax 降采样，返回保留点的下标（含首尾点，升序）"""
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    if n_out < 4:
+        return _stride_indices(n, n_out)
+    _, index, valid = _buckets(n, (n_out - 2) // 2)
+    values = np.where(valid, y[np.minimum(index, n - 1)], np.nan)
+    rows = np.arange(len(index))
+    low = index[rows, np.nanargmin(values, axis=1)]
+    high = index[rows, np.nanargmax(values, axis=1)]
+    picked = np.unique(np.concatenate(([0], low, high, [n - 1])))
+    return picked
+
+
+def lttb_indices(x, y, n_out):
+    """LTTB 降采样，返回保留点的下标（含首尾点，升序）"""
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    if n_out < 3:
+        return _stride_indices(n, n_out)
+
+    # 点数远多于输出时先用 minmax 缩小候选集
+    candidates = np.arange(n)
+    if n > n_out * LTTB_PRESELECT_RATIO:
+        candidates = minmax_indices(y, n_out * LTTB_PRESELECT_RATIO)
+    xs = _as_float(x)[candidates]
+    ys = y[candidates]
+    m = len(candidates)
+    if m <= n_out:
+        return candidates
+
+    # 候选点分为 n_out - 2 个桶，预先算出每桶平均点（作为下一桶的参照点）
+    edges = np.linspace(1, m - 1, n_out - 1).astype(np.int64)
+    counts = np.diff(edges)
+    sum_x = np.add.reduceat(xs[:m - 1], edges[:-1])
+    sum_y = np.add.reduceat(ys[:m - 1], edges[:-1])
+    avg_x = np.append(sum_x / counts, xs[-1])
+    avg_y = np.append(sum_y / counts, ys[-1])
+
+    picked = np.empty(n_out, dtype=np.int64)
+    picked[0], picked[-1] = 0, m - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        bx, by = xs[lo:hi], ys[lo:hi]
+        # 三角形 (a, b, 下一桶平均点) 面积的两倍
+        area = np.abs((xs[a] - avg_x[i + 1]) * (by - ys[a]) - (xs[a] - bx) * (avg_y[i + 1] - ys[a]))
+        a = lo + int(np.argmax(area))
+        picked[i + 1] = a
+    return candidates[picked]
+
+
+def downsample(x, y, max_points, method="lttb"):
+    """降采样到不超过 max_points 个点，返回 (x, y)"""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(y) <= max_points:
+        return x, y
+    if method == "minmax":
+        index = minmax_indices(y, max_points)
+    elif method == "lttb":
+        index = lttb_indices(x, y, max_points)
+    else:
+        raise ValueError(f"未知的降采样方法: {method}")
+    return x[index], y[index]
+
+
+def time_slice(dates, start=None, end=None):
+    """升序时间轴上 [start, end] 对应的切片（二分查找）"""
+    dates = np.asarray(dates)
+    lo = 0 if start is None else np.searchsorted(dates, np.datetime64(start, "ns"), side="left")
+    hi = len(dates) if end is None else np.searchsorted(dates, np.datetime64(end, "ns"), side="right")
+    return slice(int(lo), int(hi))
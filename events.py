@@ -0,0 +1,188 @@
+# 智播农链销售平台事件总线
+#
+# 进程内的发布/订阅总线，主题包括新订单、订单状态变更、库存变更和直播间实时数据。
+# - 写入路径（订单存储、库存、直播采集）调用 publish 发布事件，任意线程均可调用
+# - 异步消费者用 async for event in bus.listen(主题) 订阅，事件循环运行在后台线程
+# - 同步消费者用 subscribe 注册回调，或用 refresh_on 按主题版本缓存计算结果：
+#   页面局部区域定时重跑时，相关主题没有新事件就直接复用上次结果
+# simulate_load 是本地负载发生器，按设定速率调用写入动作以模拟直播带货高峰。
+
+import asyncio
+import functools
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from config import EVENT_BUS
+
+# 主题
+ORDER_CREATED = "order.created"
+ORDER_STATUS_CHANGED = "order.status"
+STOCK_CHANGED = "stock.changed"
+LIVE_METRICS_UPDATED = "live.metrics"
+
+TOPICS = (ORDER_CREATED, ORDER_STATUS_CHANGED, STOCK_CHANGED, LIVE_METRICS_UPDATED)
+
+# 订阅全部主题
+ALL = "*"
+
+
+@dataclass
+class Event:
+    """事件"""
+
+    topic: str
+    seq: int
+    time: float
+    payload: dict = field(default_factory=dict)
+
+
+class EventBus:
+    """进程内异步发布/订阅总线"""
+
+    def __init__(self, queue_size=1000, history=200):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._versions = defaultdict(int)
+        self._callbacks = defaultdict(list)
+        self._queues = defaultdict(set)
+        self._recent = deque(maxlen=history)
+        self._loop = None
+        self._loop_lock = threading.Lock()
+
+    # ---- 事件循环 ----
+
+    @property
+    def loop(self):
+        """后台线程中的事件循环（首次使用时启动）"""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="event-bus", daemon=True).start()
+                self._loop = loop
+        return self._loop
+
+    def submit(self, coro):
+        """在总线的事件循环中运行协程，返回 concurrent.futures.Future"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    # ---- 发布 ----
+
+    def publish(self, topic, **payload):
+        """发布事件（线程安全）"""
+        with self._lock:
+            self._seq += 1
+            self._versions[topic] += 1
+            event = Event(topic, self._seq, time.time(), payload)
+            self._recent.append(event)
+            callbacks = self._callbacks[topic] + self._callbacks[ALL]
+            has_queues = bool(self._queues[topic] or self._queues[ALL])
+        for callback in callbacks:
+            callback(event)
+        if has_queues:
+            self.loop.call_soon_threadsafe(self._fan_out, event)
+        return event
+
+    def _fan_out(self, event):
+        for queue in list(self._queues[event.topic] | self._queues[ALL]):
+            if queue.full():
+                # 消费者跟不上时丢弃最旧的事件
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    # ---- 订阅 ----
+
+    def subscribe(self, topic, callback):
+        """注册同步回调 callback(event)，在发布者线程中调用；返回取消订阅函数"""
+        with self._lock:
+            self._callbacks[topic].append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                if callback in self._callbacks[topic]:
+                    self._callbacks[topic].remove(callback)
+
+        return unsubscribe
+
+    async def listen(self, *topics):
+        """异步订阅：async for event in bus.listen(主题, ...)，须在总线的事件循环中运行"""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        topics = topics or (ALL,)
+        with self._lock:
+            for topic in topics:
+                self._queues[topic].add(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            with self._lock:
+                for topic in topics:
+                    self._queues[topic].discard(queue)
+
+    # ---- 查询 ----
+
+    def version(self, *topics):
+        """各主题已发布的事件数，可作为缓存版本"""
+        with self._lock:
+            return tuple(self._versions[topic] for topic in topics)
+
+    def recent(self, limit=50):
+        """最近发布的事件（新的在前）"""
+        with self._lock:
+            return list(self._recent)[::-1][:limit]
+
+    def counts(self):
+        with self._lock:
+            return {topic: self._versions[topic] for topic in TOPICS}
+
+
+bus = EventBus(queue_size=EVENT_BUS["queue_size"], history=EVENT_BUS["history"])
+
+
+def refresh_on(*topics):
+    """按主题版本缓存的装饰器：相关主题没有新事件时返回上次的计算结果（所有会话共享）"""
+
+    def decorator(func):
+        cache = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            version = bus.version(*topics)
+            with lock:
+                item = cache.get(args)
+            if item is not None and item[0] == version:
+                return item[1]
+            value = func(*args)
+            with lock:
+                cache[args] = (version, value)
+            return value
+
+        wrapper.clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+async def simulate_load(actions, rate, seconds=None, seed=None):
+    """负载发生器：以平均 rate 次/秒（泊松分布）随机执行写入动作
+
+    actions 为 [(权重, 函数(rng)), ...]，函数在总线事件循环所在线程中同步调用。
+    返回已执行的动作次数。
+    """
+    rng = np.random.default_rng(seed)
+    weights = np.array([weight for weight, _ in actions], dtype=np.float64)
+    weights /= weights.sum()
+    tick = 0.1
+    deadline = None if seconds is None else time.monotonic() + seconds
+    done = 0
+    while deadline is None or time.monotonic() < deadline:
+        for choice in rng.choice(len(actions), size=rng.poisson(rate * tick), p=weights):
+            actions[choice][1](rng)
+            done += 1
+        await asyncio.sleep(tick)
+    return done
@@ -0,0 +1,106 @@
+# 智播农链销售平台FAQ检索
+#
+# 问题和答案按字符 n-gram（默认二元组）切分，建立倒排索引，按 BM25 打分取前 k 条。
+# 查询只遍历查询词项的倒排列表，知识库增大时耗时基本不变；新增问答时增量更新索引。
+
+import heapq
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+
+# 去掉标点、空白等非文字字符
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+@dataclass
+class FAQMatch:
+    """检索结果"""
+    doc_id: int
+    score: float
+    question: str
+    answer: str
+    category: str
+
+
+def tokenize(text, n=2):
+    """文本 -> 字符 n-gram 列表；短于 n 的片段保留为单字"""
+    tokens = []
+    for segment in _NON_WORD.split(text.lower()):
+        if not segment:
+            continue
+        if len(segment) < n:
+            tokens.append(segment)
+            continue
+        tokens.extend(segment[i:i + n] for i in range(len(segment) - n + 1))
+    return tokens
+
+
+class FAQIndex:
+    """FAQ 倒排索引（BM25 排序）"""
+
+    # 问题字段的权重高于答案字段
+    FIELD_WEIGHTS = {"question": 1.0, "answer": 0.3}
+
+    def __init__(self, faqs=(), k1=1.2, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+        self._docs = []
+        self._postings = defaultdict(dict)  # 词项 -> {文档编号: 加权词频}
+        self._lengths = []
+        self._total_length = 0.0
+        for faq in faqs:
+            self.add(faq)
+
+    def __len__(self):
+        return len(self._docs)
+
+    def add(self, faq):
+        """新增一条问答，返回文档编号"""
+        weighted = Counter()
+        for field, weight in self.FIELD_WEIGHTS.items():
+            for token in tokenize(faq.get(field, "")):
+                weighted[token] += weight
+
+        with self._lock:
+            doc_id = len(self._docs)
+            self._docs.append(faq)
+            for token, tf in weighted.items():
+                self._postings[token][doc_id] = tf
+            length = sum(weighted.values())
+            self._lengths.append(length)
+            self._total_length += length
+        return doc_id
+
+    def search(self, query, top_k=3, min_score=0.0):
+        """检索与 query 最相关的前 top_k 条问答"""
+        terms = set(tokenize(query)) or set(tokenize(query, n=1))
+        with self._lock:
+            n_docs = len(self._docs)
+            if not n_docs or not terms:
+                return []
+            avg_length = self._total_length / n_docs
+            scores = defaultdict(float)
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                df = len(postings)
+                idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+                for doc_id, tf in postings.items():
+                    norm = self.k1 * (1 - self.b + self.b * self._lengths[doc_id] / avg_length)
+                    scores[doc_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+
+            best = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+            return [
+                FAQMatch(
+                    doc_id=doc_id,
+                    score=score,
+                    question=self._docs[doc_id]["question"],
+                    answer=self._docs[doc_id]["answer"],
+                    category=self._docs[doc_id]["category"],
+                )
+                for doc_id, score in best if score >= min_score
+            ]
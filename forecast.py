@@ -0,0 +1,201 @@
+# 智播农链销售平台销售预测
+#
+# 对每个 产品×乡镇 的逐日销售额序列拟合加性 Holt-Winters 模型（水平 + 趋势 + 周季节）。
+# 所有序列排成二维数组（序列 × 天）一起计算：时间方向逐天递推，序列方向完全向量化；
+# 平滑参数在 PARAM_GRID 的候选组合上网格搜索，每个序列选一步预测误差平方和最小的一组，
+# 候选组合作为额外的数组维度一并计算。序列数超过 PROCESS_POOL_THRESHOLD 时按块分发到进程池。
+# ForecastEngine 缓存拟合结果：新增完整的一天时只用已选定的参数向前递推新的天数，
+# 累计新增天数达到 refit_days 或已拟合的历史数据发生变化时才重新搜索参数。
+
+import itertools
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+SECONDS_PER_DAY = 86400
+
+# 序列数超过该值时用进程池拟合
+PROCESS_POOL_THRESHOLD = 2000
+
+# 平滑参数候选值：alpha（水平）、beta（趋势）、gamma（季节）
+ALPHAS = (0.1, 0.3, 0.5, 0.8)
+BETAS = (0.0, 0.05, 0.2)
+GAMMAS = (0.05, 0.2, 0.5)
+PARAM_GRID = np.array(list(itertools.product(ALPHAS, BETAS, GAMMAS)))
+
+
+@dataclass
+class HoltWintersState:
+    """一组序列的模型状态，数组第一维为序列"""
+
+    params: np.ndarray   # (n, 3) alpha, beta, gamma
+    level: np.ndarray    # (n,)
+    trend: np.ndarray    # (n,)
+    season: np.ndarray   # (m, n)，season[d % m] 为第 d 天对应的季节项
+    days: int            # 已递推到的天数
+    sse: np.ndarray      # (n,) 一步预测误差平方和
+
+    @classmethod
+    def concat(cls, states):
+        return cls(
+            np.concatenate([s.params for s in states]),
+            np.concatenate([s.level for s in states]),
+            np.concatenate([s.trend for s in states]),
+            np.concatenate([s.season for s in states], axis=1),
+            states[0].days,
+            np.concatenate([s.sse for s in states]),
+        )
+
+
+def _recurse(y, start, params, level, trend, season):
+    """从第 start 天起用 y 的各列递推（level/trend/season 原地更新），返回一步预测误差平方和
+
+    状态数组的形状为 (n,) 或 (n, k)（k 组候选参数），season 多一个前置的季节维 (m, ...)，
+    params 的最后一维为 (alpha, beta, gamma)。
+    """
+    alpha, beta, gamma = params[..., 0], params[..., 1], params[..., 2]
+    m = len(season)
+    sse = np.zeros(level.shape)
+    column_shape = (len(y),) + (1,) * (level.ndim - 1)
+    for t in range(y.shape[1]):
+        observed = y[:, t].reshape(column_shape)
+        slot = (start + t) % m
+        seasonal = season[slot]
+        error = observed - (level + trend + seasonal)
+        sse += error * error
+        new_level = alpha * (observed - seasonal) + (1 - alpha) * (level + trend)
+        trend[...] = beta * (new_level - level) + (1 - beta) * trend
+        season[slot] = gamma * (observed - new_level) + (1 - gamma) * seasonal
+        level[...] = new_level
+    return sse
+
+
+def fit(y, season_length=7):
+    """对 y（序列 × 天）的每一行拟合 Holt-Winters 模型，返回 HoltWintersState
+
+    用前两个季节周期初始化水平、趋势和季节项；不足两个周期时退化为均值预测。
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n, days = y.shape
+    m = season_length
+    if days < 2 * m:
+        level = y.mean(axis=1) if days else np.zeros(n)
+        return HoltWintersState(
+            np.zeros((n, 3)), level, np.zeros(n), np.zeros((m, n)), days, np.zeros(n)
+        )
+
+    # 每个序列 × 每组候选参数一起递推，状态形状为 (n, k)
+    k = len(PARAM_GRID)
+    first = y[:, :m].mean(axis=1)
+    level = np.repeat(first[:, None], k, axis=1)
+    trend = np.repeat(((y[:, m:2 * m].mean(axis=1) - first) / m)[:, None], k, axis=1)
+    season = np.repeat((y[:, :m] - first[:, None]).T[:, :, None], k, axis=2)
+    sse = _recurse(y[:, m:], m, PARAM_GRID, level, trend, season)
+
+    rows = np.arange(n)
+    best = sse.argmin(axis=1)
+    return HoltWintersState(
+        PARAM_GRID[best], level[rows, best], trend[rows, best], season[:, rows, best], days, sse[rows, best]
+    )
+
+
+def fit_parallel(y, season_length=7, processes=None, chunk_size=500):
+    """fit 的批量版本：序列数超过 PROCESS_POOL_THRESHOLD（或指定多个进程）时按块分发到进程池"""
+    y = np.asarray(y, dtype=np.float64)
+    if len(y) > PROCESS_POOL_THRESHOLD or (processes and processes > 1 and len(y) > chunk_size):
+        chunks = [y[i:i + chunk_size] for i in range(0, len(y), chunk_size)]
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            return HoltWintersState.concat(list(pool.map(fit, chunks, itertools.repeat(season_length))))
+    return fit(y, season_length)
+
+
+def predict(state, horizon):
+    """未来 horizon 天的预测，返回 (n, horizon)，负值截为 0"""
+    steps = np.arange(1, horizon + 1)
+    slots = (state.days + steps - 1) % len(state.season)
+    values = state.level[:, None] + state.trend[:, None] * steps + state.season[slots].T
+    return np.maximum(values, 0)
+
+
+def daily_sales_matrix(codes, order_dates, amounts, n_series, end):
+    """订单 -> (起始日, 序列 × 天 销售额矩阵)
+
+    codes 为每笔订单的序列编码（0..n_series-1），order_dates 为下单时间（秒），
+    只统计 end（秒，一般为今天零点）之前的完整天。起始日为最早订单所在的天（自 1970-01-01 起的天数）。
+    """
+    end_day = int(end) // SECONDS_PER_DAY
+    day = np.asarray(order_dates, dtype=np.int64) // SECONDS_PER_DAY
+    keep = day < end_day
+    if not keep.any():
+        return end_day, np.zeros((n_series, 0))
+    start_day = int(day[keep].min())
+    n_days = end_day - start_day
+    matrix = np.bincount(
+        np.asarray(codes, dtype=np.int64)[keep] * n_days + (day[keep] - start_day),
+        weights=np.asarray(amounts, dtype=np.float64)[keep],
+        minlength=n_series * n_days,
+    )
+    return start_day, matrix.reshape(n_series, n_days)
+
+
+class ForecastEngine:
+    """带缓存的多序列预测引擎"""
+
+    def __init__(self, season_length=7, refit_days=7, processes=None):
+        self.season_length = season_length
+        self.refit_days = refit_days
+        self.processes = processes
+        self._lock = threading.Lock()
+        self._state = None
+        self._start_day = None
+        self._checksum = None      # 已拟合部分每个序列的合计，用于发现历史数据变化
+        self._fitted_days = 0      # 上次搜索参数时的天数
+        self.version = 0           # 每次拟合或增量更新后递增
+        self.stats = {"fits": 0, "updates": 0}
+
+    def update(self, start_day, y):
+        """用最新的 序列 × 天 矩阵更新模型：没有新的天时不计算，新增天数较少时增量递推"""
+        y = np.asarray(y, dtype=np.float64)
+        with self._lock:
+            state = self._state
+            if self._can_extend(start_day, y):
+                if y.shape[1] == state.days:
+                    return False
+                if y.shape[1] - self._fitted_days < self.refit_days:
+                    state.sse += _recurse(
+                        y[:, state.days:], state.days, state.params, state.level, state.trend, state.season
+                    )
+                    state.days = y.shape[1]
+                    self._checksum = y.sum(axis=1)
+                    self.stats["updates"] += 1
+                    self.version += 1
+                    return True
+            self._state = fit_parallel(y, self.season_length, self.processes)
+            self._start_day = start_day
+            self._checksum = y.sum(axis=1)
+            self._fitted_days = y.shape[1]
+            self.stats["fits"] += 1
+            self.version += 1
+            return True
+
+    def _can_extend(self, start_day, y):
+        """已有模型能否沿用：序列和起始日相同，已拟合的天数据未变且足够两个季节周期"""
+        state = self._state
+        return (
+            state is not None
+            and start_day == self._start_day
+            and len(y) == len(state.level)
+            and 2 * self.season_length <= state.days <= y.shape[1]
+            and np.allclose(y[:, :state.days].sum(axis=1), self._checksum)
+        )
+
+    def forecast(self, horizon):
+        """未来 horizon 天的预测 (n, horizon)；尚未拟合时为 None"""
+        with self._lock:
+            return None if self._state is None else predict(self._state, horizon)
+
+    @property
+    def days(self):
+        return 0 if self._state is None else self._state.days
@@ -0,0 +1,162 @@
+# 智播农链销售平台 HTML 片段
+#
+# 卡片类界面（产品、直播间、公告、库存预警、客服消息）统一用 Template 生成 HTML：
+# 模板在导入时编译一次，{字段} 插入时做 HTML 转义，{字段!s} 原样插入（值本身已是 HTML），
+# 可带格式说明，如 {sales:,}。一个列表按列批量渲染为一个 HTML 字符串，只输出一个页面元素。
+# 渲染结果可按 (片段名, 数据版本) 缓存，所有会话共享，数据未变化时不再重新拼接。
+
+import html
+import itertools
+import string
+import threading
+import time
+
+import streamlit as st
+
+from cache import LRUCache
+from config import THEME_COLORS
+
+CACHE_SIZE = 256
+
+# 这些类型的值转为字符串后不含 HTML 特殊字符
+NUMBER_TYPES = {int, float, bool}
+
+_fragments = LRUCache(CACHE_SIZE)
+_build_lock = threading.Lock()
+
+
+class Template:
+    """编译后的 HTML 片段模板"""
+
+    def __init__(self, source):
+        self.source = source
+        self.fields = []
+        self._raw = []
+        self._specs = []
+        # 编译为一个参数为各字段（已格式化和转义的字符串）的 f-string 函数，渲染一个片段就是一次函数调用
+        body = []
+        for literal, field, spec, conversion in string.Formatter().parse(source):
+            body.append(literal.replace("{", "{{").replace("}", "}}"))
+            if field is None:
+                continue
+            if conversion not in (None, "s"):
+                raise ValueError(f"模板字段只支持 !s（原样插入）: {{{field}!{conversion}}}")
+            body.append(f"{{_{len(self.fields)}}}")
+            self.fields.append(field)
+            self._raw.append(conversion == "s")
+            self._specs.append(spec or "")
+        params = ", ".join(f"_{i}" for i in range(len(self.fields)))
+        self._render = eval(f"lambda {params}: f{''.join(body)!r}")
+
+    def _column(self, i, values):
+        """一列值 -> 格式化并转义后的字符串（整列都是数字时不必转义）"""
+        values = list(values)
+        spec = self._specs[i]
+        strings = map(format, values, itertools.repeat(spec)) if spec else map(str, values)
+        if self._raw[i] or set(map(type, values)) <= NUMBER_TYPES:
+            return strings
+        return map(html.escape, strings)
+
+    def render_columns(self, columns, sep=""):
+        """按列渲染：columns 为 字段 -> 值序列（各列等长），返回拼接后的 HTML"""
+        escaped = [self._column(i, columns[field]) for i, field in enumerate(self.fields)]
+        return sep.join(itertools.starmap(self._render, zip(*escaped)))
+
+    def render(self, items, sep="", **columns):
+        """按行渲染：items 为字典（或产品等记录）列表，columns 可直接给出部分字段的整列值"""
+        items = list(items)
+        if not self.fields:
+            return sep.join(self.source for _ in items)
+        for field in self.fields:
+            if field not in columns:
+                columns[field] = [item[field] for item in items]
+        return self.render_columns(columns, sep)
+
+    def render_one(self, item=None, **values):
+        """渲染单个片段，values 覆盖或补充 item 中的字段"""
+        return self.render([values if item is None else item], **{k: [v] for k, v in values.items()})
+
+
+def cached_fragment(name, version, build):
+    """按 (片段名, 数据版本) 缓存的 HTML 字符串
+
+    build 为无参函数，返回 HTML；version 为可哈希的数据版本，数据变化时版本必须变化。
+    """
+    key = (name, version)
+    item = _fragments.get(key, time.time())
+    if item is not None:
+        return item[1]
+    with _build_lock:
+        item = _fragments.get(key, time.time())
+        if item is not None:
+            return item[1]
+        body = build()
+        _fragments.put(key, body, float("inf"))
+    return body
+
+
+def emit(body, container=st):
+    """把 HTML 输出为一个页面元素（空字符串不输出）"""
+    if body:
+        container.markdown(body, unsafe_allow_html=True)
+
+
+def fragment_cache_stats():
+    return {"size": len(_fragments), "hits": _fragments.hits, "misses": _fragments.misses}
+
+
+def clear_fragments():
+    """清空片段缓存"""
+    _fragments.clear()
+
+
+# ---- 卡片模板 ----
+
+PRODUCT_CARD = Template("""<div class="product-card" style="display: flex; gap: 1.5rem; align-items: center;">
+<div style="font-size: 3rem; min-width: 4rem; text-align: center;">{image}</div>
+<div>
+<h4>{name} <small style="color: gray;">{id}</small></h4>
+<p><strong>分类:</strong> {category} | <strong>规格:</strong> {specification} | <strong>产地:</strong> {origin}</p>
+<p><strong>描述:</strong> {description}</p>
+<p><strong>价格:</strong> <span style="color: red; font-size: 1.2rem;">¥{current_price}</span>
+<del style="color: gray;">¥{original_price}</del></p>
+<p><strong>库存:</strong> {stock} | <strong>销量:</strong> {sales} | <strong>评分:</strong> {rating}⭐</p>
+</div>
+</div>""")
+
+PRODUCT_RANK_CARD = Template("""<div class="product-card">
+<strong>{rank}. {image} {name}</strong><br>
+销量: {sales} | 评分: {rating}⭐<br>
+价格: <span style="color: red;">¥{current_price}</span>
+<del style="color: gray;">¥{original_price}</del>
+</div>""")
+
+LIVE_ROOM_CARD = Template("""<div class="live-room-card">
+<strong>🔴 {title}</strong><br>
+主播: {avatar} | 观众: {viewers}人<br>
+销售额: ¥{sales} | 开始时间: {start_time}
+</div>""")
+
+LIVE_ROOM_STATUS_CARD = Template("""<div class="live-room-card">
+<strong>{title}</strong><br>
+主播: {avatar} | 状态: {status}<br>
+观众: {viewers}人 | 销售: ¥{sales}
+</div>""")
+
+ANNOUNCEMENT_CARD = Template("""<div class="announcement-card">
+<strong>{title}</strong><br>
+{content}<br>
+<small>{date}</small>
+</div>""")
+
+LOW_STOCK_ALERT = Template(
+    '<div style="background-color: ' + THEME_COLORS['warning']
+    + '; padding: 0.5rem; border-radius: 5px; margin: 0.5rem 0;">'
+    + '<strong>{name}</strong> - 可售库存: {available} 件（补货阈值 {threshold} 件）</div>'
+)
+
+# 客服回复来自问答库，可含 HTML；客户输入一律转义
+CHAT_MESSAGE = {
+    "user": Template('<div class="chat-message user-message"><strong>您:</strong> {content}</div>'),
+    "assistant": Template('<div class="chat-message bot-message"><strong>🤖 AI客服:</strong> {content!s}</div>'),
+}
@@ -0,0 +1,209 @@
+# 智播农链销售平台库存引擎
+#
+# 每个产品记录在库数量、已预留数量和补货阈值，可售数量 = 在库 - 已预留。
+# 下单流程：reserve 预留 -> commit 扣减（或 release 释放），所有操作在锁内原子完成，
+# 多个会话线程同时抢购同一产品时不会超卖。预留超过有效期未提交的由 release_expired 回收
+# （每次 reserve 前自动执行，按到期时间堆只检查已到期的预留）。
+# 变更回调在锁内按变更顺序调用，传入变更后的数量，回调中不要执行耗时操作。
+# 低库存索引：可售数量低于补货阈值的产品单独登记，变化时 O(1) 维护，
+# 预警列表按缺口从大到小取前 N 个（堆选择，O(k log N)）。
+
+import heapq
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+
+class InsufficientStockError(ValueError):
+    """可售库存不足"""
+
+
+@dataclass
+class Reservation:
+    """库存预留"""
+
+    id: int
+    product_id: str
+    quantity: int
+    expires_at: float
+
+
+class InventoryEngine:
+    """库存引擎"""
+
+    def __init__(self, default_threshold=100, reservation_ttl=900):
+        self.default_threshold = default_threshold
+        self.reservation_ttl = reservation_ttl
+        self._lock = threading.RLock()
+        self._on_hand = {}
+        self._reserved = {}
+        self._thresholds = {}
+        self._reservations = {}
+        self._expiry = []                 # (到期时间, 预留编号) 小顶堆
+        self._low = {}                    # 低库存产品 -> 可售数量 - 阈值（负数）
+        self._ids = itertools.count(1)
+        self._listeners = []
+
+    # ---- 登记与查询 ----
+
+    def add_product(self, product_id, on_hand, threshold=None):
+        """登记产品（已登记时覆盖在库数量和阈值）"""
+        with self._lock:
+            self._on_hand[product_id] = int(on_hand)
+            self._reserved.setdefault(product_id, 0)
+            self._thresholds[product_id] = self.default_threshold if threshold is None else int(threshold)
+            self._reindex(product_id)
+
+    def add_products(self, product_ids, on_hand, thresholds=None):
+        """批量登记产品（已登记时覆盖在库数量和阈值），thresholds 为 None 时全部取默认阈值"""
+        product_ids = list(product_ids)
+        on_hand = np.asarray(on_hand, dtype=np.int64)
+        if thresholds is None:
+            thresholds = np.full(len(product_ids), self.default_threshold, dtype=np.int64)
+        thresholds = np.asarray(thresholds, dtype=np.int64)
+        with self._lock:
+            reserved = [self._reserved.get(product_id, 0) for product_id in product_ids]
+            self._on_hand.update(zip(product_ids, on_hand.tolist()))
+            self._reserved.update(zip(product_ids, reserved))
+            self._thresholds.update(zip(product_ids, thresholds.tolist()))
+            margins = on_hand - np.asarray(reserved, dtype=np.int64) - thresholds
+            low = margins < 0
+            if self._low:
+                for product_id in itertools.compress(product_ids, (~low).tolist()):
+                    self._low.pop(product_id, None)
+            self._low.update(zip(itertools.compress(product_ids, low.tolist()), margins[low].tolist()))
+
+    def __contains__(self, product_id):
+        return product_id in self._on_hand
+
+    def __len__(self):
+        return len(self._on_hand)
+
+    def on_hand(self, product_id):
+        return self._on_hand[product_id]
+
+    def reserved(self, product_id):
+        return self._reserved[product_id]
+
+    def available(self, product_id):
+        with self._lock:
+            return self._on_hand[product_id] - self._reserved[product_id]
+
+    def threshold(self, product_id):
+        return self._thresholds[product_id]
+
+    def subscribe(self, callback):
+        """注册变更回调 callback(product_id, on_hand, available, reason)，在锁内调用"""
+        self._listeners.append(callback)
+
+    def _notify(self, product_id, reason):
+        # 调用方持有锁：数量在变更的同一临界区内读取，回调按变更顺序收到对应的数量
+        on_hand = self._on_hand[product_id]
+        available = on_hand - self._reserved[product_id]
+        for callback in list(self._listeners):
+            callback(product_id, on_hand, available, reason)
+
+    def _reindex(self, product_id):
+        margin = self._on_hand[product_id] - self._reserved[product_id] - self._thresholds[product_id]
+        if margin < 0:
+            self._low[product_id] = margin
+        else:
+            self._low.pop(product_id, None)
+
+    # ---- 预留 / 提交 / 释放 ----
+
+    def reserve(self, product_id, quantity, ttl=None):
+        """预留库存，可售数量不足时抛出 InsufficientStockError"""
+        if quantity <= 0:
+            raise ValueError(f"预留数量必须为正数: {quantity}")
+        self.release_expired()
+        with self._lock:
+            if product_id not in self._on_hand:
+                raise KeyError(f"未登记的产品: {product_id}")
+            available = self._on_hand[product_id] - self._reserved[product_id]
+            if available < quantity:
+                raise InsufficientStockError(f"{product_id} 可售库存不足：需要 {quantity}，可售 {available}")
+            self._reserved[product_id] += quantity
+            reservation = Reservation(
+                next(self._ids), product_id, quantity,
+                time.time() + (self.reservation_ttl if ttl is None else ttl)
+            )
+            self._reservations[reservation.id] = reservation
+            heapq.heappush(self._expiry, (reservation.expires_at, reservation.id))
+            self._reindex(product_id)
+            self._notify(product_id, "reserve")
+        return reservation
+
+    def commit(self, reservation_id):
+        """提交预留：扣减在库数量"""
+        with self._lock:
+            reservation = self._reservations.pop(reservation_id)
+            self._reserved[reservation.product_id] -= reservation.quantity
+            self._on_hand[reservation.product_id] -= reservation.quantity
+            self._reindex(reservation.product_id)
+            self._notify(reservation.product_id, "commit")
+        return reservation
+
+    def release(self, reservation_id):
+        """释放预留（已提交或已释放时忽略）"""
+        with self._lock:
+            reservation = self._reservations.pop(reservation_id, None)
+            if reservation is None:
+                return None
+            self._reserved[reservation.product_id] -= reservation.quantity
+            self._reindex(reservation.product_id)
+            self._notify(reservation.product_id, "release")
+        return reservation
+
+    def release_expired(self, now=None):
+        """回收过期未提交的预留，返回回收数量"""
+        now = time.time() if now is None else now
+        released = 0
+        with self._lock:
+            while self._expiry and self._expiry[0][0] <= now:
+                _, reservation_id = heapq.heappop(self._expiry)
+                # 已提交或已释放的预留在堆中留有过期条目，release 会忽略
+                released += self.release(reservation_id) is not None
+            if len(self._expiry) > 2 * len(self._reservations) + 1024:
+                self._expiry = [(r.expires_at, r.id) for r in self._reservations.values()]
+                heapq.heapify(self._expiry)
+        return released
+
+    # ---- 补货与阈值 ----
+
+    def restock(self, product_id, quantity):
+        """补货（quantity 为负数时为盘亏）"""
+        with self._lock:
+            if self._on_hand[product_id] + quantity < self._reserved[product_id]:
+                raise InsufficientStockError(f"{product_id} 在库数量不能低于已预留数量")
+            self._on_hand[product_id] += int(quantity)
+            self._reindex(product_id)
+            self._notify(product_id, "restock")
+
+    def set_threshold(self, product_id, threshold):
+        """设置补货阈值"""
+        with self._lock:
+            self._thresholds[product_id] = int(threshold)
+            self._reindex(product_id)
+            self._notify(product_id, "threshold")
+
+    # ---- 低库存预警 ----
+
+    def low_stock_count(self):
+        return len(self._low)
+
+    def low_stock(self, limit=None):
+        """低库存产品 [(产品编号, 可售数量, 阈值)]，按缺口从大到小"""
+        with self._lock:
+            items = list(self._low.items())
+            if limit is None:
+                items.sort(key=lambda item: item[1])
+            else:
+                items = heapq.nsmallest(limit, items, key=lambda item: item[1])
+            return [
+                (product_id, self._on_hand[product_id] - self._reserved[product_id], self._thresholds[product_id])
+                for product_id, _ in items
+            ]
@@ -0,0 +1,69 @@
+# 智播农链销售平台分页列表组件
+#
+# 列表只从数据层取当前页的数据，整页合并为一个 HTML 元素（或一个表格）输出，
+# 每次运行发送到浏览器的元素数量与列表总长度无关。
+
+import math
+
+import streamlit as st
+
+from config import PAGINATION
+from fragments import emit
+
+
+def page_count(total, page_size=None, max_pages=None):
+    """总页数（不超过 max_pages）"""
+    page_size = page_size or PAGINATION['page_size']
+    max_pages = max_pages or PAGINATION['max_pages']
+    return max(1, min(max_pages, math.ceil(total / page_size)))
+
+
+def page_state(key, filters):
+    """分页状态：筛选条件变化时回到第一页"""
+    state = st.session_state.get(key)
+    if state is None or state['filters'] != filters:
+        state = {'filters': filters, 'page': 0}
+        st.session_state[key] = state
+    return state
+
+
+def pager_controls(key, caption, has_prev, has_next):
+    """上一页/下一页控件，返回 -1、0 或 1"""
+    col1, col2, col3 = st.columns([1, 2, 1])
+    step = 0
+    with col1:
+        if st.button("上一页", key=f"{key}_prev", disabled=not has_prev):
+            step = -1
+    with col2:
+        st.caption(caption)
+    with col3:
+        if st.button("下一页", key=f"{key}_next", disabled=not has_next):
+            step = 1
+    return step
+
+
+def paginate(key, fetch, filters, page_size=None, max_pages=None):
+    """按偏移量分页
+
+    fetch(offset, limit) 返回 (当前页数据, 总条数)，只取当前页；
+    筛选条件 filters 变化时回到第一页。返回 (当前页数据, 总条数)。
+    """
+    page_size = page_size or PAGINATION['page_size']
+    state = page_state(key, filters)
+    items, total = fetch(state['page'] * page_size, page_size)
+    pages = page_count(total, page_size, max_pages)
+    if state['page'] >= pages:
+        # 数据变少后当前页越界，退回最后一页
+        state['page'] = pages - 1
+        items, total = fetch(state['page'] * page_size, page_size)
+    step = pager_controls(key, f"共 {total} 条 · 第 {state['page'] + 1}/{pages} 页",
+                          state['page'] > 0, state['page'] < pages - 1)
+    if step:
+        state['page'] += step
+        st.rerun()
+    return items, total
+
+
+def render_cards(items, template):
+    """把一页数据按模板（fragments.Template）拼成一个 HTML 元素输出"""
+    emit(template.render(items))
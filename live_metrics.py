@@ -0,0 +1,161 @@
+# 智播农链销售平台直播数据采集
+#
+# 每个直播间保存固定长度的逐秒时间序列（观众数、订单数、成交额），存放在 NumPy 环形缓冲区中。
+# 缓冲区长度为窗口的两倍，每个样本同时写入 i 和 i+窗口 两个位置，
+# 因此任意不超过窗口长度的最近时间段都是一段连续内存，图表可以直接使用视图而无需拷贝。
+# 写入和读取共用一把锁，时间轴与数据在同一次加锁中取出，两者的样本数和结束时间一致。
+# 数据由后台线程中的 asyncio 采集循环写入，本地模拟器代替真实直播平台推送数据。
+
+import asyncio
+import threading
+from datetime import datetime
+
+import numpy as np
+
+from order_store import to_timestamp
+
+METRICS = ("viewers", "orders", "gmv")
+
+
+class RoomSeries:
+    """单个直播间的环形缓冲区"""
+
+    def __init__(self, room_id, capacity):
+        self.room_id = room_id
+        self.capacity = capacity
+        self._buffer = np.zeros((len(METRICS), capacity * 2), dtype=np.float32)
+        self._head = 0          # 下一次写入的位置
+        self._count = 0         # 已写入的样本数（不超过 capacity）
+        self.last_time = None   # 最近一个样本的时间（本地时间秒数）
+        self.total_orders = 0
+        self.total_gmv = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self):
+        return self._buffer.nbytes
+
+    def append(self, timestamp, viewers, orders, gmv):
+        """写入一个样本"""
+        sample = (viewers, orders, gmv)
+        with self._lock:
+            head = self._head
+            self._buffer[:, head] = sample
+            self._buffer[:, head + self.capacity] = sample
+            self._head = (head + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+            self.last_time = timestamp
+            self.total_orders += int(orders)
+            self.total_gmv += float(gmv)
+
+    def recent(self, seconds=None, copy=False):
+        """最近 seconds 个样本的 (时间轴（秒）, 指标数 × 样本数 的只读视图)
+
+        视图会随后续写入滚动；copy=True 时在锁内拷贝，供稍后才编码数据的调用方使用。
+        """
+        with self._lock:
+            n = self._count if seconds is None else min(seconds, self._count)
+            if self.last_time is None:
+                times = np.empty(0, dtype=np.int64)
+            else:
+                times = np.arange(self.last_time - n + 1, self.last_time + 1, dtype=np.int64)
+            end = self._head + self.capacity
+            view = self._buffer[:, end - n:end]
+            if copy:
+                view = view.copy()
+        view.flags.writeable = False
+        return times, view
+
+    def latest(self):
+        """最近一个样本 {指标: 值}"""
+        with self._lock:
+            if not self._count:
+                return {name: 0 for name in METRICS}
+            values = self._buffer[:, self._head + self.capacity - 1]
+            return dict(zip(METRICS, values.tolist()))
+
+
+class LiveMetricsHub:
+    """所有直播间的时间序列"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._rooms = {}
+        self._lock = threading.Lock()
+        self._listeners = []
+
+    def room(self, room_id):
+        """获取（必要时创建）直播间时间序列"""
+        series = self._rooms.get(room_id)
+        if series is None:
+            with self._lock:
+                series = self._rooms.setdefault(room_id, RoomSeries(room_id, self.capacity))
+        return series
+
+    def room_ids(self):
+        return list(self._rooms)
+
+    def subscribe(self, callback):
+        """注册写入回调 callback(timestamp, room_ids)"""
+        self._listeners.append(callback)
+
+    def ingest(self, timestamp, room_ids, viewers, orders, gmv):
+        """批量写入同一时刻多个直播间的样本"""
+        for i, room_id in enumerate(room_ids):
+            self.room(room_id).append(timestamp, viewers[i], orders[i], gmv[i])
+        for callback in list(self._listeners):
+            callback(timestamp, room_ids)
+
+    def snapshot(self):
+        """各直播间最新数据 {直播间: {指标: 值, total_gmv: 累计成交额}}"""
+        result = {}
+        for room_id, series in list(self._rooms.items()):
+            latest = series.latest()
+            latest["total_orders"] = series.total_orders
+            latest["total_gmv"] = series.total_gmv
+            result[room_id] = latest
+        return result
+
+    @property
+    def nbytes(self):
+        return sum(series.nbytes for series in list(self._rooms.values()))
+
+
+async def ingest_loop(hub, queue):
+    """采集循环：从队列读取 (时间, 直播间列表, 观众数, 订单数, 成交额) 批次写入缓冲区"""
+    while True:
+        batch = await queue.get()
+        if batch is None:
+            break
+        hub.ingest(*batch)
+
+
+async def simulate_rooms(queue, rooms, tick_seconds=1.0, avg_price=35.0, seed=None, ticks=None):
+    """本地模拟器：按秒为所有直播间生成观众数随机游走和泊松订单"""
+    rng = np.random.default_rng(seed)
+    room_ids = [room["id"] for room in rooms]
+    viewers = np.array([room.get("viewers", 100) for room in rooms], dtype=np.float64)
+    sent = 0
+    while ticks is None or sent < ticks:
+        viewers = np.maximum(0, viewers + rng.normal(0, np.sqrt(viewers + 1)))
+        orders = rng.poisson(viewers / 2000)
+        gmv = orders * avg_price * rng.uniform(0.8, 1.5, size=len(rooms))
+        await queue.put((to_timestamp(datetime.now()), room_ids, viewers.round(), orders, gmv.round(2)))
+        sent += 1
+        await asyncio.sleep(tick_seconds)
+    await queue.put(None)
+
+
+def start_background(hub, rooms, tick_seconds=1.0, seed=None):
+    """在后台线程中启动模拟器和采集循环，返回线程"""
+
+    async def run():
+        queue = asyncio.Queue(maxsize=1000)
+        await asyncio.gather(
+            ingest_loop(hub, queue),
+            simulate_rooms(queue, rooms, tick_seconds=tick_seconds, seed=seed),
+        )
+
+    thread = threading.Thread(target=asyncio.run, args=(run(),), name="live-metrics", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,340 @@
+# 智播农链销售平台订单查询
+#
+# 在列式订单存储之上维护三类索引：
+# - 状态位图：每个订单状态一行布尔位图，并记录各状态订单数；另按日期索引每 COUNT_BLOCK 个位置分块
+#   记录各状态订单数，状态 + 日期范围的命中总数由整块计数加两端不足一块的部分得到
+# - 日期索引：按 (下单时间, 行号) 排序的复合键数组，日期范围和分页游标都通过二分查找定位
+# - 订单号前缀索引：订单号为 "ORD" + 补零编号，编号前缀对应若干个数值区间
+#   （隐式的数字字典树），在排序后的编号数组上二分查找即可
+# 订单追加和状态更新时通过存储的写入回调增量维护索引。
+
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, time as dt_time
+
+import numpy as np
+
+from config import PAGINATION
+from order_store import to_timestamp
+
+# 复合键中行号占用的位数
+ROW_BITS = 32
+ROW_MASK = (1 << ROW_BITS) - 1
+
+# 订单号编号部分的补零宽度
+ORDER_NO_WIDTH = 6
+MAX_ORDER_NO_WIDTH = 18
+
+# 分块计数的块大小（日期索引中的位置数）
+COUNT_BLOCK = 4096
+
+
+@dataclass
+class OrderPage:
+    """一页查询结果"""
+    rows: np.ndarray
+    next_cursor: str = None
+    total: int = 0
+    filters: dict = field(default_factory=dict)
+
+
+def _day_start(value):
+    if isinstance(value, datetime):
+        return value
+    return datetime.combine(value, dt_time.min)
+
+
+def _day_end(value):
+    if isinstance(value, datetime):
+        return value
+    return datetime.combine(value, dt_time.max)
+
+
+def prefix_ranges(digits):
+    """编号前缀 -> 编号数值区间列表 [(lo, hi), ...]（左闭右开）"""
+    ranges = []
+    length = len(digits)
+    value = int(digits)
+    # 补零宽度内：前缀可以带前导零
+    if length <= ORDER_NO_WIDTH:
+        scale = 10 ** (ORDER_NO_WIDTH - length)
+        ranges.append((value * scale, (value + 1) * scale))
+    # 超出补零宽度的编号没有前导零
+    if not digits.startswith("0"):
+        for width in range(max(length, ORDER_NO_WIDTH + 1), MAX_ORDER_NO_WIDTH + 1):
+            scale = 10 ** (width - length)
+            ranges.append((value * scale, (value + 1) * scale))
+    return ranges
+
+
+class _SortedArray:
+    """可增长的有序数组，新值不小于当前最大值时直接写入尾部"""
+
+    def __init__(self, values, payload=None):
+        order = np.argsort(values, kind="stable")
+        self._size = len(values)
+        capacity = max(1024, self._size * 2)
+        self._values = np.empty(capacity, dtype=np.int64)
+        self._values[:self._size] = values[order]
+        self._payload = None
+        if payload is not None:
+            self._payload = np.empty(capacity, dtype=np.int64)
+            self._payload[:self._size] = payload[order]
+
+    @property
+    def values(self):
+        return self._values[:self._size]
+
+    @property
+    def payload(self):
+        return self._payload[:self._size]
+
+    def __len__(self):
+        return self._size
+
+    def extend(self, values, payload=None):
+        order = np.argsort(values, kind="stable")
+        values = values[order]
+        if payload is not None:
+            payload = payload[order]
+        count = len(values)
+        if count == 0:
+            return
+        if self._size and values[0] < self._values[self._size - 1]:
+            # 乱序写入：插入到有序位置
+            positions = np.searchsorted(self.values, values, side="right")
+            merged = np.insert(self.values, positions, values)
+            merged_payload = None
+            if payload is not None:
+                merged_payload = np.insert(self.payload, positions, payload)
+            self.__init__(merged, merged_payload)
+            return
+        if self._size + count > len(self._values):
+            capacity = max(len(self._values) * 2, self._size + count)
+            self._values = np.resize(self._values, capacity)
+            if self._payload is not None:
+                self._payload = np.resize(self._payload, capacity)
+        self._values[self._size:self._size + count] = values
+        if payload is not None:
+            self._payload[self._size:self._size + count] = payload
+        self._size += count
+
+
+class OrderIndex:
+    """订单索引与查询"""
+
+    def __init__(self, store):
+        self.store = store
+        self._lock = threading.RLock()
+        self._rebuild()
+        store.subscribe(self._on_write)
+
+    # ---- 索引维护 ----
+
+    def _rebuild(self):
+        with self._lock:
+            status = self.store.column("status")
+            n_status = len(self.store.dictionary("status"))
+            self._size = len(status)
+            self._bitmaps = np.zeros((n_status, max(1024, self._size * 2)), dtype=bool)
+            self._bitmaps[status, np.arange(self._size)] = True
+            self._status_counts = np.bincount(status, minlength=n_status)
+
+            rows = np.arange(self._size, dtype=np.int64)
+            self._dates = _SortedArray(self._make_keys(rows))
+            self._order_nos = _SortedArray(self.store.column("order_no").astype(np.int64), rows)
+            self._block_counts = np.zeros((n_status, 0), dtype=np.int64)
+            self._count_blocks(0)
+
+    def _count_blocks(self, start):
+        """重新统计日期索引 start 位置之后的分块状态计数（start 为块边界）"""
+        keys = self._dates.values
+        status = self.store.column("status")[keys[start:] & ROW_MASK]
+        first = start // COUNT_BLOCK
+        n_blocks = -(-len(keys) // COUNT_BLOCK)
+        n_status = self._block_counts.shape[0]
+        counts = np.zeros((n_status, n_blocks), dtype=np.int64)
+        counts[:, :first] = self._block_counts[:, :first]
+        blocks = first + np.arange(len(status)) // COUNT_BLOCK
+        counts[:, first:] = np.bincount(
+            status.astype(np.int64) * (n_blocks - first) + (blocks - first),
+            minlength=n_status * (n_blocks - first)
+        ).reshape(n_status, n_blocks - first)
+        self._block_counts = counts
+
+    def _make_keys(self, rows):
+        dates = self.store.column("order_date")[rows].astype(np.int64)
+        return (dates << ROW_BITS) | rows
+
+    def _on_write(self, event, rows, **details):
+        with self._lock:
+            if event == "reset":
+                self._rebuild()
+            elif event == "append":
+                self._append_rows(rows)
+            elif event == "status":
+                previous = details["previous"]
+                code = details["status"]
+                self._bitmaps[previous, rows] = False
+                self._bitmaps[code, rows] = True
+                np.subtract.at(self._status_counts, previous, 1)
+                self._status_counts[code] += len(rows)
+                blocks = np.searchsorted(self._dates.values, self._make_keys(rows)) // COUNT_BLOCK
+                np.subtract.at(self._block_counts, (previous, blocks), 1)
+                np.add.at(self._block_counts, (code, blocks), 1)
+
+    def _append_rows(self, rows):
+        if len(rows) == 0:
+            return
+        if rows[0] != self._size:
+            self._rebuild()
+            return
+        end = self._size + len(rows)
+        if end > self._bitmaps.shape[1]:
+            grown = np.zeros((self._bitmaps.shape[0], end * 2), dtype=bool)
+            grown[:, :self._size] = self._bitmaps[:, :self._size]
+            self._bitmaps = grown
+        status = self.store.column("status")[rows]
+        self._bitmaps[status, rows] = True
+        self._status_counts += np.bincount(status, minlength=len(self._status_counts))
+        keys = self._make_keys(rows)
+        # 按时间顺序追加时只需重新统计最后一块之后的计数，乱序插入时位置整体后移，全部重新统计
+        in_order = not len(self._dates) or keys.min() > self._dates.values[-1]
+        first = len(self._dates) // COUNT_BLOCK * COUNT_BLOCK if in_order else 0
+        self._dates.extend(keys)
+        self._order_nos.extend(self.store.column("order_no")[rows].astype(np.int64), rows)
+        self._size = end
+        self._count_blocks(first)
+
+    # ---- 单项索引 ----
+
+    def status_count(self, status):
+        """某状态的订单数"""
+        return int(self._status_counts[self.store.encode("status", status)])
+
+    def _status_codes(self, statuses):
+        return [self.store.encode("status", s) for s in statuses]
+
+    def _status_mask(self, codes):
+        if len(codes) == 1:
+            return self._bitmaps[codes[0], :self._size]
+        return np.logical_or.reduce(self._bitmaps[codes, :self._size], axis=0)
+
+    def _date_bounds(self, start=None, end=None):
+        keys = self._dates.values
+        lo, hi = 0, len(keys)
+        if start is not None:
+            lo = np.searchsorted(keys, to_timestamp(_day_start(start)) << ROW_BITS, side="left")
+        if end is not None:
+            hi = np.searchsorted(keys, (to_timestamp(_day_end(end)) + 1) << ROW_BITS, side="left")
+        # 起始日期晚于结束日期时为空区间
+        return int(lo), int(max(lo, hi))
+
+    def rows_with_prefix(self, prefix):
+        """订单号前缀查询；省略 "ORD" 的纯数字同时精确匹配该编号"""
+        digits = prefix.strip().upper()
+        ranges = []
+        if digits.startswith("ORD"):
+            digits = digits[3:]
+        elif digits.isdigit():
+            ranges.append((int(digits), int(digits) + 1))
+        if not digits:
+            return np.arange(self._size)
+        if not digits.isdigit():
+            return np.arange(0)
+        numbers = self._order_nos.values
+        matches = []
+        for lo, hi in ranges + prefix_ranges(digits):
+            start = np.searchsorted(numbers, lo, side="left")
+            stop = np.searchsorted(numbers, hi, side="left")
+            matches.append(self._order_nos.payload[start:stop])
+        return np.unique(np.concatenate(matches))
+
+    # ---- 组合查询 ----
+
+    def query(self, statuses=None, start=None, end=None, id_prefix=None,
+              cursor=None, limit=None):
+        """组合查询，按下单时间倒序返回一页结果
+
+        statuses 为订单状态键（或键列表），start/end 为日期范围（含端点），
+        id_prefix 为订单号前缀，cursor 为上一页返回的 next_cursor。
+        """
+        limit = limit or PAGINATION["page_size"]
+        if isinstance(statuses, str):
+            statuses = [statuses]
+        if id_prefix and not id_prefix.strip().upper().removeprefix("ORD"):
+            # 空白或只有 "ORD" 的前缀匹配全部订单，等同于不按订单号筛选
+            id_prefix = None
+
+        with self._lock:
+            keys = self._dates.values
+            codes = self._status_codes(statuses) if statuses else None
+            mask = self._status_mask(codes) if codes else None
+            lo, hi = self._date_bounds(start, end)
+            page_hi = hi
+            if cursor:
+                page_hi = min(hi, int(np.searchsorted(keys, int(cursor), side="left")))
+
+            if id_prefix:
+                rows = self.rows_with_prefix(id_prefix)
+                if mask is not None:
+                    rows = rows[mask[rows]]
+                matched = np.sort(self._make_keys(rows))
+                lo_key = keys[lo] if lo < len(keys) else np.iinfo(np.int64).max
+                matched = matched[matched >= lo_key]
+                if hi < len(keys):
+                    matched = matched[matched < keys[hi]]
+                total = len(matched)
+                if page_hi < len(keys):
+                    matched = matched[matched < keys[page_hi]]
+                page_keys = matched[::-1][:limit]
+            else:
+                total = self._count(codes, mask, lo, hi)
+                page_keys = self._scan_backward(mask, lo, page_hi, limit)
+
+        next_cursor = None
+        if len(page_keys) == limit and page_keys[-1] != keys[lo]:
+            next_cursor = str(int(page_keys[-1]))
+        return OrderPage(
+            rows=(page_keys & ROW_MASK).astype(np.int64),
+            next_cursor=next_cursor,
+            total=total,
+            filters={"statuses": statuses, "start": start, "end": end, "id_prefix": id_prefix},
+        )
+
+    def _count(self, codes, mask, lo, hi):
+        """日期索引 [lo, hi) 内符合状态条件的订单数：整块读取分块计数，两端不足一块的部分查位图"""
+        if mask is None:
+            return hi - lo
+        if lo == 0 and hi == self._size:
+            return int(self._status_counts[codes].sum())
+        keys = self._dates.values
+        first = -(-lo // COUNT_BLOCK)
+        last = hi // COUNT_BLOCK
+        if first >= last:
+            return int(np.count_nonzero(mask[keys[lo:hi] & ROW_MASK]))
+        return int(
+            self._block_counts[codes, first:last].sum()
+            + np.count_nonzero(mask[keys[lo:first * COUNT_BLOCK] & ROW_MASK])
+            + np.count_nonzero(mask[keys[last * COUNT_BLOCK:hi] & ROW_MASK])
+        )
+
+    def _scan_backward(self, mask, lo, hi, limit):
+        """从 hi 向前按块扫描日期索引，取满一页即停止"""
+        keys = self._dates.values
+        if mask is None:
+            return keys[max(lo, hi - limit):hi][::-1]
+        found = []
+        remaining = limit
+        chunk = limit * 4
+        while hi > lo and remaining > 0:
+            start = max(lo, hi - chunk)
+            block = keys[start:hi][::-1]
+            block = block[mask[block & ROW_MASK]][:remaining]
+            found.append(block)
+            remaining -= len(block)
+            hi = start
+            chunk *= 2
+        if not found:
+            return keys[:0]
+        return np.concatenate(found)
@@ -0,0 +1,309 @@
+# 智播农链销售平台订单存储
+#
+# 订单按列保存为内存映射文件（每列一个 .bin 文件），元数据（行数、容量、字典编码）
+# 保存在 meta.json 中。页面只加载需要的列，追加和状态更新直接写入映射文件。
+# 金额列以整数分保存，旧版本的浮点金额列在打开时自动转换。
+# 多个进程可以同时打开同一目录写入：写入在文件锁（write.lock）内进行，进入时先重新读取
+# 元数据；发现其他进程写过时，写入后以 "reset" 事件通知订阅方重建索引。
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows 没有 fcntl，只支持单个进程写入
+    fcntl = None
+
+from config import ORDER_STATUS
+from records import from_cents, to_cents
+
+# 列定义：列名 -> 存储类型
+ORDER_COLUMNS = {
+    "order_no": np.int64,
+    "customer_id": np.int32,
+    "product": np.int16,
+    "quantity": np.int16,
+    "unit_price": np.int64,      # 分
+    "total_amount": np.int64,    # 分
+    "status": np.int8,
+    "township": np.int8,
+    "order_date": np.int64,
+    "phone": np.int16,
+}
+
+# 金额列（以分为单位）
+MONEY_COLUMNS = ("unit_price", "total_amount")
+
+# 字典编码的列：列名 -> 元数据中的字典名
+DICTIONARY_COLUMNS = {
+    "status": "status",
+    "product": "product",
+    "township": "township",
+}
+
+# 订单状态编码顺序固定为 ORDER_STATUS 的键顺序
+STATUS_KEYS = list(ORDER_STATUS.keys())
+
+DEFAULT_TOWNSHIPS = ["城关镇", "平阳镇", "王林口镇"]
+
+INITIAL_CAPACITY = 1024
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def format_order_id(order_no):
+    """订单编号 -> 订单号"""
+    return f"ORD{str(int(order_no)).zfill(6)}"
+
+
+def to_timestamp(value):
+    """本地时间（naive datetime）-> 秒数，与 pd.to_datetime(unit="s") 互逆"""
+    return int((value - EPOCH).total_seconds())
+
+
+def from_timestamp(seconds):
+    """秒数 -> 本地时间（naive datetime）"""
+    return EPOCH + timedelta(seconds=int(seconds))
+
+
+class OrderStore:
+    """列式订单存储"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.RLock()
+        self._listeners = []
+        os.makedirs(path, exist_ok=True)
+
+        meta_path = os.path.join(path, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding="utf-8") as f:
+                self._meta = json.load(f)
+        else:
+            self._meta = {
+                "rows": 0,
+                "capacity": INITIAL_CAPACITY,
+                "version": 0,
+                "money": "cents",
+                "dictionaries": {
+                    "status": list(STATUS_KEYS),
+                    "product": [],
+                    "township": list(DEFAULT_TOWNSHIPS),
+                },
+            }
+        if self._meta.get("money") != "cents":
+            self._migrate_money()
+        self._maps = {}
+        self._open_columns()
+        self._write_meta()
+
+    # ---- 元数据 ----
+
+    def __len__(self):
+        return self._meta["rows"]
+
+    @property
+    def version(self):
+        """每次追加或更新后递增，用于缓存失效"""
+        return self._meta["version"]
+
+    def dictionary(self, name):
+        """获取字典编码列的取值列表"""
+        return self._meta["dictionaries"][name]
+
+    def encode(self, name, value, create=False):
+        """取值 -> 编码；create 为 True 时自动扩充字典"""
+        try:
+            return self._meta["dictionaries"][name].index(value)
+        except ValueError:
+            if not create:
+                raise KeyError(f"未知的{name}取值: {value}") from None
+        with self._writing():
+            values = self._meta["dictionaries"][name]
+            if value not in values:
+                values.append(value)
+                self._write_meta()
+            return values.index(value)
+
+    def _write_meta(self):
+        meta_path = os.path.join(self.path, "meta.json")
+        tmp_path = meta_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._meta, f, ensure_ascii=False)
+        os.replace(tmp_path, meta_path)
+
+    # ---- 列文件 ----
+
+    def _column_path(self, name):
+        return os.path.join(self.path, f"{name}.bin")
+
+    def _migrate_money(self):
+        """旧版本金额列为 float64（元），转换为 int64（分）"""
+        for name in MONEY_COLUMNS:
+            file_path = self._column_path(name)
+            if os.path.exists(file_path):
+                yuan = np.fromfile(file_path, dtype=np.float64)
+                tmp_path = file_path + ".tmp"
+                to_cents(yuan).tofile(tmp_path)
+                os.replace(tmp_path, file_path)
+        self._meta["money"] = "cents"
+
+    def _open_columns(self):
+        capacity = self._meta["capacity"]
+        for name, dtype in ORDER_COLUMNS.items():
+            file_path = self._column_path(name)
+            size = capacity * np.dtype(dtype).itemsize
+            with open(file_path, "ab") as f:
+                if f.tell() < size:
+                    f.truncate(size)
+            self._maps[name] = np.memmap(file_path, dtype=dtype, mode="r+", shape=(capacity,))
+
+    def _reserve(self, rows):
+        """保证容量足够，不足时按倍数扩容"""
+        capacity = self._meta["capacity"]
+        if rows <= capacity:
+            return
+        while capacity < rows:
+            capacity *= 2
+        self.flush()
+        self._maps = {}
+        self._meta["capacity"] = capacity
+        self._open_columns()
+
+    @contextmanager
+    def _writing(self):
+        """写入临界区（线程锁 + 文件锁），进入时读取其他进程写入的元数据，返回是否有其他进程写过"""
+        with self._lock, open(os.path.join(self.path, "write.lock"), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield self._refresh()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _refresh(self):
+        with open(os.path.join(self.path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta == self._meta:
+            return False
+        capacity = self._meta["capacity"]
+        self._meta = meta
+        if meta["capacity"] != capacity:
+            self._maps = {}
+            self._open_columns()
+        return True
+
+    def flush(self):
+        """将映射文件写回磁盘"""
+        for array in self._maps.values():
+            array.flush()
+
+    def column(self, name):
+        """获取单列（只读视图，不复制数据）"""
+        view = self._maps[name][: self._meta["rows"]].view(np.ndarray)
+        view.flags.writeable = False
+        return view
+
+    def columns(self, names):
+        """获取多列"""
+        return {name: self.column(name) for name in names}
+
+    # ---- 写入 ----
+
+    def subscribe(self, callback):
+        """注册写入回调 callback(event, rows, **details)
+
+        event 为 "append" 或 "status"；其他进程写过时为 "reset"（订阅方应整体重建），
+        details["written"] 为本次写入的事件。
+        """
+        self._listeners.append(callback)
+
+    def _notify(self, event, rows, **details):
+        for callback in list(self._listeners):
+            callback(event, rows, **details)
+
+    def append_columns(self, data):
+        """按列追加订单，data 为 列名 -> 数组（字典列传入编码，金额列传入分）"""
+        with self._writing() as reset:
+            count = len(next(iter(data.values())))
+            start = self._meta["rows"]
+            self._reserve(start + count)
+            if "order_no" not in data:
+                data = dict(data, order_no=np.arange(start + 1, start + count + 1))
+            for name in ORDER_COLUMNS:
+                if name in data:
+                    self._maps[name][start:start + count] = data[name]
+                else:
+                    self._maps[name][start:start + count] = 0
+            self._meta["rows"] = start + count
+            self._meta["version"] += 1
+            self.flush()
+            self._write_meta()
+            rows = np.arange(start, start + count)
+        self._notify("reset" if reset else "append", rows, written="append")
+        return rows
+
+    def update_status(self, rows, status):
+        """批量更新订单状态"""
+        # 去重：同一行出现多次时索引的计数只能调整一次
+        rows = np.unique(np.asarray(rows, dtype=np.int64))
+        code = self.encode("status", status)
+        with self._writing() as reset:
+            previous = self._maps["status"][rows].copy()
+            self._maps["status"][rows] = code
+            self._meta["version"] += 1
+            self._maps["status"].flush()
+            self._write_meta()
+        self._notify("reset" if reset else "status", rows, written="status", previous=previous, status=code)
+
+    # ---- 读取 ----
+
+    def decode(self, name, codes):
+        """编码数组 -> 取值数组"""
+        values = np.asarray(self._meta["dictionaries"][DICTIONARY_COLUMNS[name]], dtype=object)
+        return values[codes]
+
+    def to_frame(self, names):
+        """以 DataFrame 形式加载指定列，字典列解码为分类类型"""
+        import pandas as pd
+
+        frame = {}
+        for name in names:
+            column = self.column(name)
+            if name in DICTIONARY_COLUMNS:
+                frame[name] = pd.Categorical.from_codes(
+                    column, categories=self._meta["dictionaries"][DICTIONARY_COLUMNS[name]]
+                )
+            elif name == "order_date":
+                frame[name] = pd.to_datetime(column, unit="s")
+            else:
+                frame[name] = column
+        return pd.DataFrame(frame)
+
+    def records(self, rows):
+        """将指定行还原为订单字典（仅用于展示少量订单）"""
+        rows = np.asarray(rows, dtype=np.int64)
+        data = {name: self.column(name)[rows] for name in ORDER_COLUMNS}
+        products = self.dictionary("product")
+        townships = self.dictionary("township")
+        records = []
+        for i in range(len(rows)):
+            records.append({
+                "order_id": format_order_id(data["order_no"][i]),
+                "customer_name": f"客户{data['customer_id'][i]}",
+                "product_name": products[data["product"][i]],
+                "quantity": int(data["quantity"][i]),
+                "unit_price": from_cents(data["unit_price"][i]),
+                "total_amount": from_cents(data["total_amount"][i]),
+                "status": STATUS_KEYS[data["status"][i]],
+                "order_date": from_timestamp(data["order_date"][i]),
+                "phone": f"138****{data['phone'][i]}",
+                "address": f"保定市阜平县{townships[data['township'][i]]}",
+            })
+        return records
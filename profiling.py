@@ -0,0 +1,215 @@
+# 智播农链销售平台性能剖析
+#
+# profiled 装饰器和 profile_section 上下文管理器记录每个区段（页面渲染函数、标签页、
+# 数据访问函数）的墙钟时间、CPU 时间和调用次数，写入进程内的指标注册表。
+# 注册表同时保留最近 N 次页面运行（rerun）的明细，并可导出为 Prometheus 文本格式。
+# 进程内首次页面运行的耗时单独记录为冷启动耗时。
+
+import functools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from config import PROFILING
+
+METRIC_PREFIX = "zhibo_section"
+STARTUP_METRIC = "zhibo_startup"
+
+
+class SectionStats:
+    """单个区段的累计统计"""
+
+    __slots__ = ("calls", "wall", "cpu", "wall_max")
+
+    def __init__(self):
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.wall_max = 0.0
+
+    def add(self, wall, cpu, calls=1):
+        self.calls += calls
+        self.wall += wall
+        self.cpu += cpu
+        self.wall_max = max(self.wall_max, wall)
+
+
+class MetricsRegistry:
+    """进程内指标注册表"""
+
+    def __init__(self, history=20):
+        self._lock = threading.Lock()
+        self._totals = {}
+        self._reruns = deque(maxlen=history)
+        self._local = threading.local()  # 每个会话线程当前 rerun 的明细
+        self._startup = None
+
+    def record(self, name, wall, cpu):
+        with self._lock:
+            self._totals.setdefault(name, SectionStats()).add(wall, cpu)
+        current = getattr(self._local, "rerun", None)
+        if current is not None:
+            current["sections"].setdefault(name, SectionStats()).add(wall, cpu)
+
+    def begin_rerun(self, page=None):
+        self._local.rerun = {"page": page, "started_at": time.time(), "sections": {}}
+
+    def end_rerun(self):
+        current = getattr(self._local, "rerun", None)
+        self._local.rerun = None
+        if current is not None:
+            current["wall"] = time.time() - current["started_at"]
+            with self._lock:
+                self._reruns.append(current)
+
+    def set_page(self, page):
+        current = getattr(self._local, "rerun", None)
+        if current is not None:
+            current["page"] = page
+
+    def record_startup(self, wall, imports, page=None):
+        """记录冷启动耗时：wall 为首次运行总耗时，imports 为其中模块导入耗时（只记录一次）"""
+        with self._lock:
+            if self._startup is None:
+                self._startup = {"wall": wall, "imports": imports, "page": page, "at": time.time()}
+
+    def startup(self):
+        """冷启动耗时，尚未完成首次运行时为 None"""
+        with self._lock:
+            return None if self._startup is None else dict(self._startup)
+
+    def totals(self):
+        with self._lock:
+            return {name: (s.calls, s.wall, s.cpu, s.wall_max) for name, s in self._totals.items()}
+
+    def recent_reruns(self):
+        with self._lock:
+            return list(self._reruns)
+
+    def slowest_sections(self, limit=20):
+        """最近 N 次运行中各区段的统计，按平均墙钟时间降序"""
+        merged = {}
+        reruns = self.recent_reruns()
+        for rerun in reruns:
+            for name, stats in rerun["sections"].items():
+                merged.setdefault(name, SectionStats()).add(stats.wall, stats.cpu, stats.calls)
+                merged[name].wall_max = max(merged[name].wall_max, stats.wall_max)
+        rows = [
+            {
+                "section": name,
+                "calls": s.calls,
+                "wall_ms_total": s.wall * 1000,
+                "wall_ms_mean": s.wall * 1000 / s.calls,
+                "wall_ms_max": s.wall_max * 1000,
+                "cpu_ms_total": s.cpu * 1000,
+            }
+            for name, s in merged.items()
+        ]
+        rows.sort(key=lambda row: row["wall_ms_mean"], reverse=True)
+        return rows[:limit]
+
+    def reset(self):
+        with self._lock:
+            self._totals.clear()
+            self._reruns.clear()
+
+    def to_prometheus(self):
+        """导出为 Prometheus 文本格式"""
+        totals = self.totals()
+        lines = []
+        metrics = (
+            ("calls_total", "counter", "区段调用次数", lambda s: s[0]),
+            ("wall_seconds_total", "counter", "区段累计墙钟时间（秒）", lambda s: s[1]),
+            ("cpu_seconds_total", "counter", "区段累计CPU时间（秒）", lambda s: s[2]),
+            ("wall_seconds_max", "gauge", "区段单次最长墙钟时间（秒）", lambda s: s[3]),
+        )
+        for suffix, kind, help_text, value in metrics:
+            name = f"{METRIC_PREFIX}_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for section in sorted(totals):
+                lines.append(f'{name}{{section="{_escape_label(section)}"}} {value(totals[section]):.9g}')
+        startup = self.startup()
+        if startup is not None:
+            name = f"{STARTUP_METRIC}_seconds"
+            lines.append(f"# HELP {name} 冷启动耗时（秒）")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f'{name}{{phase="imports"}} {startup["imports"]:.9g}')
+            lines.append(f'{name}{{phase="first_run"}} {startup["wall"]:.9g}')
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value):
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+registry = MetricsRegistry(history=PROFILING["history"])
+
+
+@contextmanager
+def profile_section(name):
+    """记录一个代码区段的耗时"""
+    if not PROFILING["enabled"]:
+        yield
+        return
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield
+    finally:
+        registry.record(name, time.perf_counter() - wall_start, time.thread_time() - cpu_start)
+
+
+def profiled(name=None):
+    """记录函数耗时的装饰器，默认以函数名作为区段名"""
+
+    def decorator(func):
+        section = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profile_section(section):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = registry.to_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port=None, host=None):
+    """在后台线程中提供 /metrics 抓取接口（每个进程只启动一次）"""
+    global _server
+    port = port or PROFILING["metrics_port"]
+    host = host or PROFILING["metrics_host"]
+    if not port:
+        return None
+    with _server_lock:
+        if _server is None:
+            try:
+                _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            except OSError:
+                return None
+            threading.Thread(target=_server.serve_forever, name="metrics-server", daemon=True).start()
+    return _server
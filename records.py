@@ -0,0 +1,375 @@
+# 智播农链销售平台紧凑记录
+#
+# 产品和问答用 __slots__ 记录代替字典：字段名不再随每条记录重复保存，
+# 分类、产地、规格、图标、产品特色等重复取值的字符串驻留（sys.intern）后共用同一个对象，
+# 价格以整数分保存。记录实现只读映射接口（record['name']、record.get、dict(record)、
+# pd.DataFrame(records)），原先按字典读取的代码无需改动。
+# 产品目录按列保存在 ProductTable 中（数值列为 NumPy 数组，重复取值的字符串列按字典编码），
+# 只有需要展示的行才还原为 Product 记录。
+# 订单已按列保存在 order_store 中，金额列同样以分为单位。
+
+import sys
+from collections.abc import Mapping
+from operator import attrgetter
+
+import numpy as np
+
+
+def to_cents(yuan):
+    """元 -> 分（四舍五入，标量或数组）"""
+    if np.ndim(yuan):
+        return np.rint(np.asarray(yuan, dtype=np.float64) * 100).astype(np.int64)
+    return int(round(float(yuan) * 100))
+
+
+def from_cents(cents):
+    """分 -> 元（标量或数组）"""
+    if np.ndim(cents):
+        return np.asarray(cents, dtype=np.int64) / 100
+    return int(cents) / 100
+
+
+def records_frame(records, fields):
+    """记录列表 -> DataFrame（按列读取属性，只取需要的字段）"""
+    import pandas as pd
+
+    return pd.DataFrame({name: list(map(attrgetter(name), records)) for name in fields}, columns=list(fields))
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class Record(Mapping):
+    """紧凑记录基类：FIELDS 为字段及默认值，INTERNED 为需要驻留的字符串字段"""
+
+    __slots__ = ()
+    FIELDS = {}
+    INTERNED = ()
+
+    def __init__(self, **fields):
+        unknown = fields.keys() - self.FIELDS.keys()
+        if unknown:
+            raise KeyError(f"{type(self).__name__} 没有字段: {', '.join(sorted(unknown))}")
+        for name, default in self.FIELDS.items():
+            self[name] = fields.get(name, default)
+
+    @classmethod
+    def from_dict(cls, data):
+        """字典（或其他记录）-> 记录，已是本类型时原样返回"""
+        if isinstance(data, cls):
+            return data
+        return cls(**data)
+
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        setattr(self, key, self.normalize(key, value))
+
+    @classmethod
+    def normalize(cls, key, value):
+        """字段取值的保存形式（重复取值的字符串驻留）"""
+        return _intern(value) if key in cls.INTERNED else value
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self):
+        return len(self.FIELDS)
+
+    def update(self, fields=(), **kwargs):
+        for key, value in dict(fields, **kwargs).items():
+            self[key] = value
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class Product(Record):
+    """产品（价格以分保存，current_price/original_price 读写时按元换算）"""
+
+    FIELDS = {
+        "id": "",
+        "name": "",
+        "category": "",
+        "description": "",
+        "origin": "",
+        "specification": "",
+        "original_price": 0.0,
+        "current_price": 0.0,
+        "stock": 0,
+        "sales": 0,
+        "rating": 0.0,
+        "image": "",
+        "features": (),
+        "nutrition": "",
+        "reorder_threshold": None,
+    }
+    INTERNED = ("category", "origin", "specification", "image")
+
+    __slots__ = tuple(name for name in FIELDS if not name.endswith("_price")) + (
+        "original_price_cents", "current_price_cents"
+    )
+
+    @property
+    def original_price(self):
+        return self.original_price_cents / 100
+
+    @original_price.setter
+    def original_price(self, value):
+        self.original_price_cents = to_cents(value)
+
+    @property
+    def current_price(self):
+        return self.current_price_cents / 100
+
+    @current_price.setter
+    def current_price(self, value):
+        self.current_price_cents = to_cents(value)
+
+    @classmethod
+    def normalize(cls, key, value):
+        if key == "features":
+            # 产品特色保存为驻留字符串的元组
+            if isinstance(value, str):
+                value = [f for f in value.split(",") if f]
+            return tuple(sys.intern(str(f)) for f in value)
+        return super().normalize(key, value)
+
+
+class FAQ(Record):
+    """客服问答"""
+
+    FIELDS = {"question": "", "answer": "", "category": ""}
+    INTERNED = ("category",)
+
+    __slots__ = tuple(FIELDS)
+
+
+class ProductTable:
+    """按列保存的产品表
+
+    数值列为 NumPy 数组（价格为整数分，未设置的补货阈值为 -1），编号和名称为 Unicode 数组，
+    分类、描述、产地、规格、图标、产品特色、营养价值按字典编码（字典列传入和保存的都是编码）。
+    record/records 把指定行还原为 Product；按编号查找位置使用排好序的编号数组，
+    新增的编号先记在一个小字典中，积累到 RECENT_IDS 个后再重新排序。
+    """
+
+    NUMBER_COLUMNS = {
+        "original_price_cents": np.int64,
+        "current_price_cents": np.int64,
+        "stock": np.int64,
+        "sales": np.int64,
+        "rating": np.float64,
+        "reorder_threshold": np.int64,
+    }
+    TEXT_COLUMNS = ("id", "name")
+    DICTIONARY_COLUMNS = ("category", "description", "origin", "specification", "image", "features", "nutrition")
+    PRICE_FIELDS = {"original_price": "original_price_cents", "current_price": "current_price_cents"}
+    NO_THRESHOLD = -1
+    RECENT_IDS = 4096
+
+    def __init__(self, products=()):
+        self._size = 0
+        self._columns = {name: np.empty(0, dtype=dtype) for name, dtype in self.NUMBER_COLUMNS.items()}
+        self._columns.update({name: np.empty(0, dtype="<U1") for name in self.TEXT_COLUMNS})
+        self._columns.update({name: np.empty(0, dtype=np.int32) for name in self.DICTIONARY_COLUMNS})
+        self._dictionaries = {name: [] for name in self.DICTIONARY_COLUMNS}
+        self._lookup = {name: {} for name in self.DICTIONARY_COLUMNS}
+        self._sorted_ids = None           # (排好序的编号, 对应位置)
+        self._recent_ids = {}             # 排序之后新增的 编号 -> 位置
+        self.append(products)
+
+    def __len__(self):
+        return self._size
+
+    # ---- 字典编码 ----
+
+    def encode(self, name, value):
+        """字典列取值 -> 编码（新取值自动加入字典）"""
+        value = Product.normalize(name, value)
+        code = self._lookup[name].get(value)
+        if code is None:
+            code = self._lookup[name][value] = len(self._dictionaries[name])
+            self._dictionaries[name].append(value)
+        return code
+
+    def dictionary(self, name):
+        """字典列的取值列表（编码 -> 取值）"""
+        return self._dictionaries[name]
+
+    def codes(self, name):
+        """字典列的编码数组（只读视图）"""
+        return self._view(name)
+
+    # ---- 写入 ----
+
+    def _reserve(self, rows):
+        capacity = len(self._columns["stock"])
+        if rows <= capacity:
+            return
+        capacity = max(rows, capacity * 2, 1024)
+        for name, column in self._columns.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+
+    def _write_text(self, name, rows, values):
+        values = np.asarray(values, dtype=str)
+        width = int(np.char.str_len(values).max(initial=1))
+        column = self._columns[name]
+        if width > column.dtype.itemsize // 4:
+            column = self._columns[name] = column.astype(f"<U{width}")
+        column[rows] = values
+
+    def append_columns(self, columns):
+        """按列追加产品，columns 为 列名 -> 数组（字典列传入编码，价格传入分），返回新行的位置
+
+        未给出的列取 Product 的默认值。
+        """
+        count = len(columns["id"])
+        start = self._size
+        rows = np.arange(start, start + count)
+        self._reserve(start + count)
+        for name in self._columns:
+            if name in self.TEXT_COLUMNS:
+                self._write_text(name, rows, columns.get(name, [""] * count))
+            elif name in columns:
+                self._columns[name][rows] = columns[name]
+            elif name in self.DICTIONARY_COLUMNS:
+                self._columns[name][rows] = self.encode(name, Product.FIELDS[name])
+            else:
+                self._columns[name][rows] = self.NO_THRESHOLD if name == "reorder_threshold" else 0
+        self._size = start + count
+        self._index_ids(rows)
+        return rows
+
+    def append(self, products):
+        """追加产品记录（或字典），返回新行的位置"""
+        products = [Product.from_dict(product) for product in products]
+        if not products:
+            return np.arange(0)
+        columns = {name: [] for name in self._columns}
+        for product in products:
+            for name, value in self._row(product):
+                columns[name].append(value)
+        return self.append_columns(columns)
+
+    def set_record(self, position, product):
+        """用产品记录覆盖一行（编号不变）"""
+        for name, value in self._row(Product.from_dict(product)):
+            if name != "id":
+                self._set(position, name, value)
+
+    def update(self, position, **fields):
+        """更新一行的部分字段（字段名同 Product）"""
+        for field, value in fields.items():
+            if field in self.PRICE_FIELDS:
+                self._set(position, self.PRICE_FIELDS[field], to_cents(value))
+            elif field == "reorder_threshold":
+                self._set(position, field, self.NO_THRESHOLD if value is None else int(value))
+            elif field in self.DICTIONARY_COLUMNS:
+                self._set(position, field, self.encode(field, value))
+            elif field in self._columns:
+                self._set(position, field, value)
+            else:
+                raise KeyError(field)
+
+    def _row(self, product):
+        """产品记录 -> [(列名, 存储值)]"""
+        for name in self._columns:
+            if name in self.DICTIONARY_COLUMNS:
+                yield name, self.encode(name, getattr(product, name))
+            elif name == "reorder_threshold":
+                threshold = product.reorder_threshold
+                yield name, self.NO_THRESHOLD if threshold is None else int(threshold)
+            else:
+                yield name, getattr(product, name)
+
+    def _check_position(self, position):
+        # None 或越界的位置作为数组下标会写到整列或别的行，必须拒绝
+        if position is None or not 0 <= position < self._size:
+            raise IndexError(f"产品位置越界: {position}")
+
+    def _set(self, position, name, value):
+        self._check_position(position)
+        if name in self.TEXT_COLUMNS:
+            if name == "id":
+                raise KeyError("产品编号不能修改")
+            self._write_text(name, [position], [value])
+        else:
+            self._columns[name][position] = value
+
+    # ---- 编号索引 ----
+
+    def _index_ids(self, rows):
+        if self._sorted_ids is None or len(self._recent_ids) + len(rows) > self.RECENT_IDS:
+            # 下次查找时整体重新排序
+            self._sorted_ids = None
+            self._recent_ids = {}
+            return
+        ids = self._columns["id"]
+        for row in rows:
+            self._recent_ids[str(ids[row])] = int(row)
+
+    def position(self, product_id):
+        """产品编号 -> 位置，不存在时为 None"""
+        position = self._recent_ids.get(product_id)
+        if position is not None:
+            return position
+        if self._sorted_ids is None:
+            ids = self._columns["id"][:self._size]
+            order = np.argsort(ids, kind="stable")
+            self._sorted_ids = (ids[order], order)
+        ids, order = self._sorted_ids
+        i = int(np.searchsorted(ids, product_id))
+        if i < len(ids) and ids[i] == product_id:
+            return int(order[i])
+        return None
+
+    # ---- 读取 ----
+
+    def _view(self, name):
+        view = self._columns[name][:self._size].view()
+        view.flags.writeable = False
+        return view
+
+    def column(self, name):
+        """按 Product 字段名读取整列：数值列和编号、名称为只读数组，价格为元，字典列解码为对象数组"""
+        if name in self.PRICE_FIELDS:
+            return from_cents(self._view(self.PRICE_FIELDS[name]))
+        if name in self.DICTIONARY_COLUMNS:
+            values = np.empty(len(self._dictionaries[name]), dtype=object)
+            values[:] = self._dictionaries[name]
+            return values[self._view(name)]
+        return self._view(name)
+
+    def record(self, position):
+        """还原一行为 Product"""
+        self._check_position(position)
+        fields = {}
+        for name, column in self._columns.items():
+            value = column[position]
+            if name in self.DICTIONARY_COLUMNS:
+                fields[name] = self._dictionaries[name][value]
+            elif name in self.TEXT_COLUMNS:
+                fields[name] = str(value)
+            elif name == "reorder_threshold":
+                fields[name] = None if value == self.NO_THRESHOLD else int(value)
+            else:
+                fields[name] = value.item()
+        for field, name in self.PRICE_FIELDS.items():
+            fields[field] = from_cents(fields.pop(name))
+        return Product(**fields)
+
+    def records(self, positions):
+        """还原多行为 Product 列表（仅用于展示少量产品）"""
+        return [self.record(int(position)) for position in positions]
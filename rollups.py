@@ -0,0 +1,172 @@
+# 智播农链销售平台汇总统计
+#
+# OrderRollups 订阅订单存储的写入回调，按 日/周/月 × 维度（全部/产品/状态/乡镇）
+# 增量维护订单数和金额，页面直接读取汇总单元格而不再扫描订单。
+# 金额按整数分累加（与订单存储一致，反复增减不产生浮点误差），读取时才换算为元。
+# SalesRollup 为销售数据生成前缀和，任意最近 N 天的合计都是 O(1)。
+
+import threading
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from order_store import EPOCH, to_timestamp
+from records import from_cents
+
+GRAINS = ("day", "week", "month")
+DIMENSIONS = ("all", "product", "status", "township")
+
+# 分组键中维度编码占用的位数
+CODE_BITS = 16
+CODE_MASK = (1 << CODE_BITS) - 1
+
+
+def period_of(grain, seconds):
+    """下单时间（秒） -> 周期编号：日为天数，周为周一起算的周数，月为 年*12+月-1"""
+    seconds = np.asarray(seconds, dtype=np.int64)
+    days = seconds // 86400
+    if grain == "day":
+        return days
+    if grain == "week":
+        # 1970-01-01 是星期四
+        return (days + 3) // 7
+    if grain == "month":
+        return seconds.astype("datetime64[s]").astype("datetime64[M]").astype(np.int64) + 1970 * 12
+    raise ValueError(f"未知的汇总粒度: {grain}")
+
+
+def period_start(grain, period):
+    """周期编号 -> 周期起始时间"""
+    if grain == "day":
+        return EPOCH + timedelta(days=int(period))
+    if grain == "week":
+        return EPOCH + timedelta(days=int(period) * 7 - 3)
+    year, month = divmod(int(period), 12)
+    return datetime(year, month + 1, 1)
+
+
+class OrderRollups:
+    """订单汇总（增量维护）"""
+
+    def __init__(self, store):
+        self.store = store
+        self._lock = threading.RLock()
+        # (粒度, 维度) -> {(周期, 维度取值编码): [订单数, 金额（分）]}
+        self._rebuild()
+        store.subscribe(self._on_write)
+
+    def _rebuild(self):
+        with self._lock:
+            self._cells = {(grain, dim): {} for grain in GRAINS for dim in DIMENSIONS}
+            self._total = [0, 0]
+            self._apply(np.arange(len(self.store)), sign=1)
+
+    def _on_write(self, event, rows, **details):
+        if event == "reset":
+            self._rebuild()
+        elif event == "append":
+            self._apply(rows, sign=1)
+        elif event == "status":
+            # 状态变更只影响状态维度
+            self._apply(rows, sign=-1, dims=("status",), status=details["previous"])
+            self._apply(rows, sign=1, dims=("status",))
+
+    def _apply(self, rows, sign, dims=DIMENSIONS, status=None):
+        """把 rows 计入（sign=1）或移出（sign=-1）汇总；status 为行的状态编码（默认取当前值）"""
+        if len(rows) == 0:
+            return
+        dates = self.store.column("order_date")[rows]
+        amounts = self.store.column("total_amount")[rows].astype(np.int64)
+        codes = {
+            "all": np.zeros(len(rows), dtype=np.int64),
+            "product": self.store.column("product")[rows],
+            "status": self.store.column("status")[rows] if status is None else status,
+            "township": self.store.column("township")[rows],
+        }
+        with self._lock:
+            if "all" in dims:
+                self._total[0] += sign * len(rows)
+                self._total[1] += sign * int(amounts.sum())
+            for grain in GRAINS:
+                periods = period_of(grain, dates)
+                for dim in dims:
+                    # (周期, 编码) 合成一个整数键再分组
+                    keys = (periods << CODE_BITS) | codes[dim].astype(np.int64)
+                    groups, inverse = np.unique(keys, return_inverse=True)
+                    counts = np.bincount(inverse, minlength=len(groups))
+                    sums = np.zeros(len(groups), dtype=np.int64)
+                    np.add.at(sums, inverse, amounts)
+                    cells = self._cells[(grain, dim)]
+                    for key, count, amount in zip(groups.tolist(), counts.tolist(), sums.tolist()):
+                        cell_key = (key >> CODE_BITS, key & CODE_MASK)
+                        cell = cells.setdefault(cell_key, [0, 0])
+                        cell[0] += sign * count
+                        cell[1] += sign * amount
+                        if cell[0] == 0:
+                            del cells[cell_key]
+
+    # ---- 读取 ----
+
+    def totals(self):
+        """全部订单的 (订单数, 金额)"""
+        count, cents = self._total
+        return count, from_cents(cents)
+
+    def cell(self, grain, when, dim="all", key=None):
+        """某周期某维度取值的 (订单数, 金额)，when 为 datetime"""
+        period = int(period_of(grain, to_timestamp(when)))
+        code = 0 if dim == "all" else self.store.encode(dim, key)
+        count, cents = self._cells[(grain, dim)].get((period, code), (0, 0))
+        return count, from_cents(cents)
+
+    def breakdown(self, dim, grain=None, when=None):
+        """维度各取值的 {取值: (订单数, 金额)}；不指定周期时为全部时间"""
+        values = self.store.dictionary(dim)
+        result = {}
+        with self._lock:
+            if grain is None:
+                for (period, code), (count, cents) in self._cells[("month", dim)].items():
+                    total = result.setdefault(values[code], [0, 0])
+                    total[0] += count
+                    total[1] += cents
+            else:
+                period = int(period_of(grain, to_timestamp(when)))
+                for (cell_period, code), (count, cents) in self._cells[(grain, dim)].items():
+                    if cell_period == period:
+                        result[values[code]] = (count, cents)
+        return {value: (count, from_cents(cents)) for value, (count, cents) in result.items()}
+
+    def series(self, grain, last=None):
+        """按周期排列的 (周期起始时间列表, 订单数数组, 金额数组)"""
+        with self._lock:
+            items = sorted(self._cells[(grain, "all")].items())
+        if last:
+            items = items[-last:]
+        starts = [period_start(grain, period) for (period, _), _ in items]
+        counts = np.array([cell[0] for _, cell in items], dtype=np.int64)
+        amounts = from_cents(np.array([cell[1] for _, cell in items], dtype=np.int64))
+        return starts, counts, amounts
+
+
+class SalesRollup:
+    """销售数据前缀和，最近 N 天的合计和均值为 O(1)"""
+
+    METRICS = ("sales_amount", "orders", "customers", "avg_order_value")
+
+    def __init__(self, sales_data):
+        self.size = len(sales_data)
+        self._prefix = {
+            name: np.concatenate([[0], np.cumsum(sales_data[name].to_numpy(dtype=np.float64))])
+            for name in self.METRICS
+        }
+
+    def total(self, metric, last):
+        """最近 last 行的合计"""
+        last = min(last, self.size)
+        prefix = self._prefix[metric]
+        return prefix[self.size] - prefix[self.size - last]
+
+    def mean(self, metric, last):
+        """最近 last 行的均值"""
+        last = min(last, self.size)
+        return self.total(metric, last) / last if last else 0.0
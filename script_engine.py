@@ -0,0 +1,185 @@
+# 智播农链销售平台直播脚本生成
+#
+# 脚本模板按 (数字人, 风格, 产品分类) 预编译：数字人相关字段在编译时代入，
+# 渲染时只需代入产品字段。批量接口一次为所有 (直播间, 产品) 组合生成脚本，
+# 数量较多时分发到进程池；输出按内容哈希缓存，产品信息未变化时不重复生成。
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from string import Template
+
+from config import DIGITAL_AVATARS
+
+# 模板版本，修改模板后递增以使缓存失效
+TEMPLATE_VERSION = 1
+
+STYLE_TEMPLATES = {
+    "亲切自然": """大家好！我是$avatar_name，今天给大家推荐我们阜平的特色产品——$name。
+
+这个$name可是我们阜平的骄傲啊！它生长在我们太行山区，
+那里空气清新，水质纯净，昼夜温差大，特别适合农产品的生长。
+$category_line
+
+我们的$name不仅口感好，营养价值也特别高。$features_line
+现在下单只要$current_price元，$discount_line机会难得，大家赶紧抢购吧！""",
+    "专业权威": """各位朋友好，我是$avatar_name，$avatar_speciality。今天为大家详细介绍$name。
+
+【产品概况】$description
+【规格】$specification
+【营养价值】$nutrition
+$category_line
+【产品特色】$features
+
+直播间价格$current_price元，$discount_line欢迎大家放心选购。""",
+    "幽默风趣": """哈喽家人们！$avatar_name又来啦！今天这个宝贝可不得了——$name！
+
+$description，说它是太行山的宝藏一点都不夸张！
+$category_line
+$features_line
+原价$original_price元？不不不，今天直播间只要$current_price元！$discount_line
+手慢无啊家人们，三、二、一，上链接！""",
+}
+
+CATEGORY_LINES = {
+    "特色干果": "干果讲究的是晾晒和挑拣，我们都是老乡们一颗一颗挑出来的。",
+    "有机杂粮": "杂粮都是有机种植，不打农药，吃着放心。",
+    "山区蜂蜜": "蜂蜜来自深山里的百花，蜜蜂采的都是无污染的山花。",
+    "时令水果": "水果都是自然成熟当天采摘，新鲜直达您家。",
+    "绿色蔬菜": "蔬菜都是绿色种植，早上采摘当天发货。",
+    "农家特产": "这是咱们阜平农家的老手艺，外面可买不到。",
+}
+
+DEFAULT_STYLE = "亲切自然"
+
+# 进程池分发的阈值（待生成脚本数）
+PROCESS_POOL_THRESHOLD = 2000
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+CACHE_SIZE = 50000
+
+
+@lru_cache(maxsize=None)
+def compile_template(avatar, style, category):
+    """预编译模板：代入数字人和分类字段，返回只含产品字段的 Template"""
+    avatar_info = DIGITAL_AVATARS[avatar]
+    text = Template(STYLE_TEMPLATES.get(style, STYLE_TEMPLATES[DEFAULT_STYLE])).safe_substitute(
+        avatar_name=avatar_info["name"],
+        avatar_speciality=avatar_info["speciality"],
+        category_line=CATEGORY_LINES.get(category, ""),
+    )
+    return Template(text)
+
+
+def _product_fields(product):
+    """产品 -> 模板字段"""
+    features = product.get("features") or []
+    if isinstance(features, str):
+        features = [f for f in features.split(",") if f]
+    current = product.get("current_price")
+    original = product.get("original_price")
+    discount = ""
+    if current and original and original > current:
+        discount = f"比原价便宜{original - current:g}元，"
+    return {
+        "name": product["name"],
+        "description": product.get("description", ""),
+        "specification": product.get("specification", ""),
+        "nutrition": product.get("nutrition", ""),
+        "features": "、".join(features),
+        "features_line": f"它的特点是：{'、'.join(features)}。" if features else "",
+        "current_price": f"{current:g}" if current else "",
+        "original_price": f"{original:g}" if original else "",
+        "discount_line": discount,
+    }
+
+
+def product_digest(product):
+    """产品内容摘要（分类和模板字段）"""
+    payload = json.dumps([product.get("category"), _product_fields(product)], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def content_hash(avatar, style, digest):
+    """脚本内容哈希：数字人、风格、模板版本和产品摘要都相同时哈希相同"""
+    return hashlib.sha1(f"{TEMPLATE_VERSION}|{avatar}|{style}|{digest}".encode("utf-8")).hexdigest()
+
+
+def _render(avatar, style, product):
+    template = compile_template(avatar, style, product.get("category"))
+    return template.safe_substitute(_product_fields(product))
+
+
+def _render_chunk(jobs):
+    """进程池任务：渲染一批 (数字人, 风格, 产品)"""
+    return [_render(avatar, style, product) for avatar, style, product in jobs]
+
+
+def render_script(avatar, product, style=DEFAULT_STYLE):
+    """生成单个直播脚本"""
+    key = content_hash(avatar, style, product_digest(product))
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+    script = _render(avatar, style, product)
+    _store(key, script)
+    return script
+
+
+def _store(key, script):
+    with _cache_lock:
+        _cache[key] = script
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
+def room_product_jobs(rooms, products, style=DEFAULT_STYLE):
+    """所有 (直播间, 产品) 组合的生成任务"""
+    return [(room["id"], room["avatar"], style, product) for room in rooms for product in products]
+
+
+def render_batch(jobs, processes=None, chunk_size=500):
+    """批量生成脚本
+
+    jobs 为 (直播间, 数字人, 风格, 产品) 列表，返回 ({(直播间, 产品编号): 脚本}, 统计)。
+    未命中缓存的任务超过 PROCESS_POOL_THRESHOLD 时分发到进程池。
+    """
+    results = {}
+    pending = {}
+    digests = {}  # 同一批次中每个产品只计算一次摘要
+    for room_id, avatar, style, product in jobs:
+        digest = digests.get(id(product))
+        if digest is None:
+            digest = digests[id(product)] = product_digest(product)
+        key = content_hash(avatar, style, digest)
+        target = (room_id, product.get("id", product["name"]))
+        with _cache_lock:
+            script = _cache.get(key)
+        if script is not None:
+            results[target] = script
+        else:
+            pending.setdefault(key, ((avatar, style, product), []))[1].append(target)
+
+    keys = list(pending)
+    work = [pending[key][0] for key in keys]
+    if len(work) > PROCESS_POOL_THRESHOLD or (processes and processes > 1 and work):
+        chunks = [work[i:i + chunk_size] for i in range(0, len(work), chunk_size)]
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            scripts = [script for chunk in pool.map(_render_chunk, chunks) for script in chunk]
+    else:
+        scripts = _render_chunk(work)
+
+    for key, script in zip(keys, scripts):
+        _store(key, script)
+        for target in pending[key][1]:
+            results[target] = script
+
+    stats = {"total": len(jobs), "cached": len(jobs) - sum(len(v[1]) for v in pending.values()),
+             "rendered": len(work)}
+    return results, stats
@@ -0,0 +1,219 @@
+# 智播农链销售平台共享数据快照
+#
+# 同一台机器上运行多个 streamlit 进程时，列式数据（销售数据、订单列、产品列）由一个发布进程
+# 写成带版本号的快照目录（每列一个 .npy 文件，清单 manifest.json），各进程以内存映射只读打开：
+# 数据页由操作系统页缓存在进程间共享，增加进程不会再多占一份数据内存。
+#
+# 快照目录写完后才整体改名为 v<版本号>，再用 os.replace 原子替换 CURRENT 指针文件，
+# 读取方要么看到旧版本要么看到完整的新版本。SnapshotReader 定期检查指针，
+# 发现新版本后映射新快照并替换引用；正在使用旧快照的代码不受影响，
+# 旧版本文件被清理后已建立的映射在其关闭前仍然有效（POSIX 语义）。
+#
+# 发布方只能有一个进程：python snapshots.py --interval 60
+
+import argparse
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from datetime import datetime
+
+import numpy as np
+
+CURRENT_FILE = "CURRENT"
+MANIFEST_FILE = "manifest.json"
+VERSION_PREFIX = "v"
+
+
+def _version_dir(version):
+    return f"{VERSION_PREFIX}{version:08d}"
+
+
+class Snapshot:
+    """一个已映射的快照版本（只读）"""
+
+    def __init__(self, path, manifest):
+        self.path = path
+        self.version = manifest["version"]
+        self.created_at = manifest["created_at"]
+        self.meta = manifest["meta"]
+        # 打开时映射全部列：之后旧版本目录即使被清理，已映射的列仍可读取
+        self._tables = {
+            table: {
+                name: np.load(os.path.join(path, table, f"{name}.npy"), mmap_mode="r")
+                for name in spec["columns"]
+            }
+            for table, spec in manifest["tables"].items()
+        }
+
+    def __contains__(self, table):
+        return table in self._tables
+
+    def tables(self):
+        return list(self._tables)
+
+    def table(self, table):
+        """表 -> {列名: 只读数组}（内存映射，不复制数据）"""
+        return self._tables[table]
+
+    def columns(self, table, names):
+        """获取指定列"""
+        columns = self._tables[table]
+        return {name: columns[name] for name in names}
+
+    def frame(self, table):
+        """以 DataFrame 形式读取整张表（列直接引用映射数组）"""
+        import pandas as pd
+
+        return pd.DataFrame(self._tables[table], copy=False)
+
+    def nbytes(self):
+        return sum(array.nbytes for columns in self._tables.values() for array in columns.values())
+
+
+class SnapshotStore:
+    """快照目录：发布新版本、读取当前版本"""
+
+    def __init__(self, path, keep=3):
+        self.path = path
+        self.keep = keep
+        os.makedirs(path, exist_ok=True)
+
+    def versions(self):
+        """已发布的版本号（升序）"""
+        versions = []
+        for name in os.listdir(self.path):
+            if name.startswith(VERSION_PREFIX) and name[len(VERSION_PREFIX):].isdigit():
+                versions.append(int(name[len(VERSION_PREFIX):]))
+        return sorted(versions)
+
+    def current_version(self):
+        """CURRENT 指向的版本号，尚未发布时为 None"""
+        try:
+            with open(os.path.join(self.path, CURRENT_FILE), encoding="utf-8") as f:
+                return int(f.read().strip()[len(VERSION_PREFIX):])
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def publish(self, tables, meta=None):
+        """发布新版本，tables 为 表名 -> {列名: 数组}，返回版本号
+
+        字符串（object）列保存为定长 Unicode 数组，以便内存映射。
+        """
+        versions = self.versions()
+        version = versions[-1] + 1 if versions else 1
+        staging = os.path.join(self.path, f".staging-{uuid.uuid4().hex}")
+        manifest = {
+            "version": version,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "meta": meta or {},
+            "tables": {},
+        }
+        try:
+            for table, columns in tables.items():
+                os.makedirs(os.path.join(staging, table))
+                rows = None
+                for name, values in columns.items():
+                    array = np.asarray(values)
+                    if array.dtype == object:
+                        array = array.astype(str)
+                    if rows is not None and len(array) != rows:
+                        raise ValueError(f"表 {table} 的列 {name} 行数为 {len(array)}，应为 {rows}")
+                    rows = len(array)
+                    np.save(os.path.join(staging, table, f"{name}.npy"), array)
+                manifest["tables"][table] = {"columns": list(columns), "rows": rows or 0}
+            with open(os.path.join(staging, MANIFEST_FILE), "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False)
+            os.rename(staging, os.path.join(self.path, _version_dir(version)))
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        pointer = os.path.join(self.path, CURRENT_FILE)
+        tmp_path = f"{pointer}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(_version_dir(version))
+        os.replace(tmp_path, pointer)
+        self._prune(version)
+        return version
+
+    def _prune(self, current):
+        """只保留最新的 keep 个版本"""
+        for version in self.versions()[:-self.keep or None]:
+            if version != current:
+                shutil.rmtree(os.path.join(self.path, _version_dir(version)), ignore_errors=True)
+
+    def attach(self, version=None):
+        """映射指定版本（默认当前版本），尚未发布时返回 None"""
+        if version is None:
+            version = self.current_version()
+            if version is None:
+                return None
+        path = os.path.join(self.path, _version_dir(version))
+        with open(os.path.join(path, MANIFEST_FILE), encoding="utf-8") as f:
+            return Snapshot(path, json.load(f))
+
+
+class SnapshotReader:
+    """跟随 CURRENT 的快照读取方：每 poll_seconds 秒最多检查一次新版本"""
+
+    def __init__(self, store, poll_seconds=2.0):
+        self.store = store
+        self.poll_seconds = poll_seconds
+        self._snapshot = None
+        self._next_poll = 0.0
+        self._lock = threading.Lock()
+        self._listeners = []
+        self.swaps = 0
+
+    def subscribe(self, callback):
+        """注册切换回调 callback(snapshot)"""
+        self._listeners.append(callback)
+
+    def current(self):
+        """当前快照，尚未发布时为 None
+
+        调用方在一次渲染中应持有返回的快照对象，而不是反复调用 current()，以保证读到同一版本。
+        """
+        if time.monotonic() >= self._next_poll:
+            with self._lock:
+                if time.monotonic() >= self._next_poll:
+                    self._refresh()
+                    self._next_poll = time.monotonic() + self.poll_seconds
+        return self._snapshot
+
+    def _refresh(self):
+        version = self.store.current_version()
+        if version is None or (self._snapshot is not None and self._snapshot.version == version):
+            return
+        try:
+            snapshot = self.store.attach(version)
+        except FileNotFoundError:
+            # 读取指针后该版本已被更新的版本替换并清理，下次检查时再切换
+            return
+        self._snapshot = snapshot
+        self.swaps += 1
+        for callback in list(self._listeners):
+            callback(snapshot)
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="发布共享数据快照")
+    parser.add_argument("--interval", type=float, default=0, help="重复发布的间隔（秒），0 为只发布一次")
+    args = parser.parse_args()
+
+    import data
+
+    while True:
+        start = time.perf_counter()
+        version = data.publish_snapshot()
+        print(f"已发布快照 v{version}（{(time.perf_counter() - start) * 1000:.0f} ms）")
+        if not args.interval:
+            break
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main_cli()
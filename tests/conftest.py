@@ -0,0 +1,29 @@
+# 测试公共夹具：数据层使用临时目录和全新的单例
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DATA_SINGLETONS = (
+    "_order_store", "_order_index", "_order_rollups", "_product_catalog",
+    "_inventory", "_forecast_engine", "_snapshot_reader",
+)
+
+
+@pytest.fixture
+def fresh_data(tmp_path, monkeypatch):
+    """订单和产品写入临时目录，数据层单例和缓存在测试前后重置"""
+    import cache
+    import data
+
+    monkeypatch.setattr(data, "ORDER_STORE_DIR", str(tmp_path / "orders"))
+    monkeypatch.setattr(data, "PRODUCT_STORE_PATH", str(tmp_path / "products.jsonl"))
+    for name in DATA_SINGLETONS:
+        monkeypatch.setattr(data, name, None)
+    cache.invalidate()
+    yield data
+    cache.invalidate()
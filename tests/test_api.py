@@ -0,0 +1,116 @@
+# 数据接口测试：在进程内启动 api.py 的连接处理函数，用原始 HTTP/1.1 长连接发送请求
+
+import asyncio
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import api  # noqa: E402
+
+
+async def read_response(reader, method):
+    """读取一个响应，返回 (状态码, 头部字典, 正文字节)"""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    if method == "HEAD" or status == 304:
+        return status, headers, b""
+    if headers.get("transfer-encoding") == "chunked":
+        body = b""
+        while True:
+            length = int((await reader.readline()).strip(), 16)
+            body += (await reader.readexactly(length + 2))[:-2]
+            if length == 0:
+                return status, headers, body
+    return status, headers, await reader.readexactly(int(headers.get("content-length") or 0))
+
+
+def fetch(*requests):
+    """在同一条长连接上依次发送 (方法, 地址) 请求，返回响应列表"""
+    async def main():
+        server = await asyncio.start_server(api.handle_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            responses = []
+            for method, target in requests:
+                writer.write(f"{method} {target} HTTP/1.1\r\nHost: test\r\n\r\n".encode())
+                responses.append(await asyncio.wait_for(read_response(reader, method), 30))
+            writer.close()
+            await writer.wait_closed()
+        return responses
+
+    return asyncio.run(main())
+
+
+def test_products_and_percent_encoded_paths(fresh_data):
+    (status, _, body), (missing, _, _), (encoded, _, product) = fetch(
+        ("GET", "/api/products?category=%E7%89%B9%E8%89%B2%E5%B9%B2%E6%9E%9C"),
+        ("GET", "/api/products/NOPE"),
+        ("GET", "/api/products/P%30%301"),
+    )
+    items = json.loads(body)["items"]
+    assert status == 200 and items and all(p["category"] == "特色干果" for p in items)
+    assert missing == 404
+    assert encoded == 200 and json.loads(product)["id"] == "P001"
+
+
+def test_bad_order_status_is_a_400_for_json_and_ndjson(fresh_data):
+    (json_status, _, _), (ndjson_status, headers, body), (after, _, _) = fetch(
+        ("GET", "/api/orders?status=bogus"),
+        ("GET", "/api/orders.ndjson?status=bogus"),
+        ("GET", "/healthz"),
+    )
+    assert json_status == 400
+    assert ndjson_status == 400 and "error" in json.loads(body)
+    assert "transfer-encoding" not in headers
+    assert after == 200
+
+
+def test_ndjson_streams_every_matching_order(fresh_data):
+    (_, _, page), (status, _, body) = fetch(
+        ("GET", "/api/orders?status=pending&limit=1"),
+        ("GET", "/api/orders.ndjson?status=pending"),
+    )
+    rows = [json.loads(line) for line in body.decode().splitlines()]
+    assert status == 200
+    assert len(rows) == json.loads(page)["total"]
+    assert all(row["status"] == "pending" for row in rows)
+
+
+def test_head_of_a_chunked_response_has_no_body(fresh_data):
+    (status, headers, _), (after, _, body) = fetch(
+        ("HEAD", "/api/orders.ndjson"),
+        ("GET", "/healthz"),
+    )
+    assert status == 200 and headers["transfer-encoding"] == "chunked"
+    # 同一连接上的下一个响应必须从状态行开始
+    assert after == 200 and json.loads(body)["status"] == "ok"
+
+
+def test_etag_returns_304_until_the_orders_change(fresh_data):
+    (_, headers, _), = fetch(("GET", "/api/orders?limit=5"))
+    etag = headers["etag"]
+
+    async def conditional():
+        server = await asyncio.start_server(api.handle_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(f"GET /api/orders?limit=5 HTTP/1.1\r\nHost: test\r\nIf-None-Match: {etag}\r\n\r\n".encode())
+            response = await read_response(reader, "GET")
+            writer.close()
+            await writer.wait_closed()
+        return response
+
+    assert asyncio.run(conditional())[0] == 304
+    fresh_data.place_order("P001", 1, customer_id=1)
+    assert asyncio.run(conditional())[0] == 200
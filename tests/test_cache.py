@@ -0,0 +1,79 @@
+# 数据缓存测试：会话作用域在真实的 Streamlit 脚本运行环境（AppTest）中按会话隔离
+
+import os
+import sys
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from cache import SESSION_STATE_KEY, cached  # noqa: E402
+
+
+def session_counter_script():
+    import streamlit as st
+
+    from cache import cached
+
+    @cached(scope="session", name="tests.session_counter")
+    def counter(key):
+        st.session_state.computed = st.session_state.get("computed", 0) + 1
+        return key * 2
+
+    st.write(counter(1), counter(1), counter(2))
+
+
+def search_products_script():
+    import streamlit as st
+
+    from cache import cache_stats
+    from data import search_products
+
+    first = search_products("大枣", None, "sales", True, 0, 10)
+    second = search_products("大枣", None, "sales", True, 0, 10)
+    st.session_state.same = first is second
+    st.session_state.stats = next(s for s in cache_stats() if s["name"] == "data.search_products")
+
+
+def run(script):
+    app = AppTest.from_function(script, default_timeout=60)
+    app.run()
+    assert not app.exception, [e.value for e in app.exception]
+    return app
+
+
+def test_session_scope_reuses_results_within_a_session():
+    app = run(session_counter_script)
+    assert app.session_state["computed"] == 2
+    # 重新运行脚本（同一会话）时直接命中缓存
+    app.run()
+    assert not app.exception
+    assert app.session_state["computed"] == 2
+    assert "tests.session_counter" in app.session_state[SESSION_STATE_KEY]
+
+
+def test_session_scope_is_isolated_between_sessions():
+    run(session_counter_script)
+    # 新会话有自己的缓存，函数重新执行
+    assert run(session_counter_script).session_state["computed"] == 2
+
+
+def test_search_products_is_cached_per_session():
+    app = run(search_products_script)
+    assert app.session_state["same"]
+    stats = app.session_state["stats"]
+    assert stats["scope"] == "session"
+    assert (stats["size"], stats["hits"], stats["misses"]) == (1, 1, 1)
+
+
+def test_session_scope_falls_back_to_global_outside_streamlit():
+    calls = []
+
+    @cached(scope="session", name="tests.outside_streamlit")
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    assert square(3) == 9 and square(3) == 9
+    assert calls == [3]
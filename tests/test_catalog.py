@@ -0,0 +1,95 @@
+# 产品表与产品目录测试：按编号更新、全文检索（CSR 索引 + 增量缓冲区）、筛选排序分页
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import catalog as catalog_module  # noqa: E402
+from catalog import ProductCatalog  # noqa: E402
+from data import PRODUCTS_DATA  # noqa: E402
+from records import ProductTable  # noqa: E402
+
+
+def make_catalog():
+    return ProductCatalog(PRODUCTS_DATA)
+
+
+def test_update_fields_with_unknown_id_raises_and_changes_nothing():
+    catalog = make_catalog()
+    stock = catalog.column("stock").copy()
+    with pytest.raises(KeyError):
+        catalog.update_fields("NOPE", stock=0)
+    assert np.array_equal(catalog.column("stock"), stock)
+
+
+def test_table_rejects_missing_or_out_of_range_positions():
+    table = ProductTable(PRODUCTS_DATA)
+    stock = table.column("stock").copy()
+    for position in (None, -1, len(table)):
+        with pytest.raises(IndexError):
+            table.update(position, stock=0)
+        with pytest.raises(IndexError):
+            table.record(position)
+    assert np.array_equal(table.column("stock"), stock)
+
+
+def test_update_fields_changes_one_product():
+    catalog = make_catalog()
+    catalog.update_fields("P002", stock=7)
+    assert catalog.get("P002")["stock"] == 7
+    assert catalog.get("P001")["stock"] == PRODUCTS_DATA[0]["stock"]
+
+
+def test_upsert_existing_product_keeps_position_and_id():
+    catalog = make_catalog()
+    product = dict(catalog.get("P001"), name="阜平红枣")
+    assert catalog.upsert(product) == 0
+    assert len(catalog) == len(PRODUCTS_DATA)
+    assert catalog.get("P001")["name"] == "阜平红枣"
+
+
+def test_text_search_prefers_name_matches_and_requires_all_terms():
+    catalog = make_catalog()
+    products, total = catalog.query("大枣")
+    assert total >= 1 and products[0]["name"] == "阜平大枣"
+    assert catalog.query("大枣 不存在的词")[1] == 0
+
+
+def test_text_search_sees_products_added_after_the_index_was_built():
+    catalog = make_catalog()
+    assert catalog.query("黑木耳")[1] == 0
+    catalog.upsert(dict(PRODUCTS_DATA[0], id="P900", name="阜平黑木耳", description="山区椴木黑木耳"))
+    products, total = catalog.query("黑木耳")
+    assert total == 1 and products[0]["id"] == "P900"
+    # 修改后旧名称不再命中
+    catalog.upsert(dict(catalog.get("P900"), name="阜平香菇", description="山区香菇"))
+    assert catalog.query("黑木耳")[1] == 0
+    assert catalog.query("香菇")[0][0]["id"] == "P900"
+
+
+def test_text_search_rebuilds_after_the_delta_buffer_overflows(monkeypatch):
+    monkeypatch.setattr(catalog_module, "TEXT_DELTA_LIMIT", 2)
+    catalog = make_catalog()
+    catalog.query("大枣")
+    for i in range(5):
+        catalog.upsert(dict(PRODUCTS_DATA[0], id=f"P9{i:02d}", name=f"测试灵芝{i}", description="灵芝切片"))
+    assert catalog._text is None
+    assert catalog.query("灵芝")[1] == 5
+    assert catalog.query("灵芝切片")[1] == 5
+
+
+def test_query_filters_sorts_and_pages():
+    catalog = make_catalog()
+    products, total = catalog.query(category="特色干果", sort_by="current_price", descending=False)
+    prices = [p["current_price"] for p in products]
+    assert total == len(products) == sum(p["category"] == "特色干果" for p in PRODUCTS_DATA)
+    assert prices == sorted(prices)
+    page, total = catalog.query(sort_by="sales", offset=1, limit=2)
+    all_products, _ = catalog.query(sort_by="sales")
+    assert total == len(PRODUCTS_DATA)
+    assert [p["id"] for p in page] == [p["id"] for p in all_products[1:3]]
@@ -0,0 +1,60 @@
+# 时间序列降采样测试：输出点数不超过上限、保留首尾点和极值，上限低于算法下限时退化为等间隔取点
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from downsample import downsample, lttb_indices, minmax_indices, time_slice  # noqa: E402
+
+N = 35_064
+
+
+@pytest.fixture
+def series():
+    x = np.datetime64("2022-01-01T00:00", "h") + np.arange(N)
+    y = np.sin(np.arange(N) / 500.0) + np.random.default_rng(5).normal(0, 0.1, N)
+    return x, y
+
+
+@pytest.mark.parametrize("method", ["minmax", "lttb"])
+@pytest.mark.parametrize("max_points", [1, 2, 3, 4, 5, 100, 1000])
+def test_never_exceeds_max_points(series, method, max_points):
+    x, y = series
+    xs, ys = downsample(x, y, max_points, method=method)
+    assert 0 < len(xs) <= max_points
+    assert len(xs) == len(ys)
+    assert np.all(np.diff(xs.astype(np.int64)) > 0)
+    if max_points >= 2:
+        assert xs[0] == x[0] and xs[-1] == x[-1]
+
+
+def test_minmax_keeps_extremes(series):
+    _, y = series
+    index = minmax_indices(y, 200)
+    assert y.argmin() in index and y.argmax() in index
+    assert index[0] == 0 and index[-1] == N - 1
+
+
+def test_lttb_returns_requested_count(series):
+    x, y = series
+    index = lttb_indices(x, y, 500)
+    assert len(index) == 500
+    assert np.all(np.diff(index) > 0)
+
+
+def test_short_series_is_unchanged(series):
+    x, y = series
+    xs, ys = downsample(x[:50], y[:50], 100)
+    assert np.array_equal(xs, x[:50]) and np.array_equal(ys, y[:50])
+
+
+def test_time_slice(series):
+    x, _ = series
+    part = time_slice(x, "2022-01-02", "2022-01-03")
+    assert part.stop - part.start == 25
+    assert x[part.start] == np.datetime64("2022-01-02T00", "h")
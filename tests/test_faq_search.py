@@ -0,0 +1,43 @@
+# FAQ 检索测试：分词、BM25 排序、问题字段权重、增量新增和最低分过滤
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from data import FAQ_DATA  # noqa: E402
+from faq_search import FAQIndex, tokenize  # noqa: E402
+
+
+def test_tokenize_bigrams_and_short_segments():
+    assert tokenize("大枣，保质期?") == ["大枣", "保质", "质期"]
+    assert tokenize("A 蜂蜜") == ["a", "蜂蜜"]
+    assert tokenize("！？") == []
+
+
+def test_search_ranks_the_matching_question_first():
+    index = FAQIndex(FAQ_DATA)
+    assert index.search("大枣能放多久，保质期多长")[0].question == "阜平大枣的保质期是多久？"
+    assert index.search("怎么退换货")[0].category == "售后服务"
+    assert index.search("多久能送到，配送时间")[0].question == "配送范围和时间？"
+
+
+def test_question_field_outweighs_answer():
+    index = FAQIndex([
+        {"question": "快递说明", "answer": "核桃核桃核桃", "category": "a"},
+        {"question": "核桃怎么吃", "answer": "直接吃", "category": "b"},
+    ])
+    assert [m.category for m in index.search("核桃")] == ["b", "a"]
+
+
+def test_incremental_add_and_filters():
+    index = FAQIndex(FAQ_DATA)
+    assert all(m.question != "小米怎么煮粥？" for m in index.search("小米煮粥"))
+    doc_id = index.add({"question": "小米怎么煮粥？", "answer": "小米和水按 1:10 熬煮。", "category": "产品咨询"})
+    assert doc_id == len(index) - 1
+    best = index.search("小米煮粥", top_k=1)
+    assert len(best) == 1 and best[0].doc_id == doc_id
+    assert index.search("小米煮粥", min_score=best[0].score + 1) == []
+    assert index.search("量子计算") == []
+    assert FAQIndex().search("大枣") == []
@@ -0,0 +1,80 @@
+# 库存引擎测试：预留 / 提交 / 释放、过期回收、低库存索引、并发下单不超卖
+
+import os
+import sys
+import threading
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from inventory import InsufficientStockError, InventoryEngine  # noqa: E402
+
+
+def make_inventory(on_hand=10, threshold=3, ttl=900):
+    inventory = InventoryEngine(default_threshold=threshold, reservation_ttl=ttl)
+    inventory.add_product("P1", on_hand)
+    return inventory
+
+
+def test_reserve_commit_and_release():
+    inventory = make_inventory()
+    first = inventory.reserve("P1", 4)
+    second = inventory.reserve("P1", 5)
+    assert (inventory.on_hand("P1"), inventory.reserved("P1"), inventory.available("P1")) == (10, 9, 1)
+    with pytest.raises(InsufficientStockError):
+        inventory.reserve("P1", 2)
+    inventory.commit(first.id)
+    assert (inventory.on_hand("P1"), inventory.available("P1")) == (6, 1)
+    inventory.release(second.id)
+    assert (inventory.on_hand("P1"), inventory.available("P1")) == (6, 6)
+    # 已释放的预留再次释放被忽略
+    assert inventory.release(second.id) is None
+
+
+def test_expired_reservations_are_released_before_the_next_reserve():
+    inventory = make_inventory(ttl=0)
+    inventory.reserve("P1", 10)
+    inventory.reserve("P1", 10)
+    assert inventory.reserved("P1") == 10
+
+
+def test_release_expired_skips_committed_and_live_reservations():
+    inventory = make_inventory()
+    committed = inventory.reserve("P1", 2, ttl=10)
+    inventory.commit(committed.id)
+    expiring = inventory.reserve("P1", 3, ttl=10)
+    live = inventory.reserve("P1", 1, ttl=100)
+    assert inventory.release_expired(now=expiring.expires_at) == 1
+    assert inventory.reserved("P1") == live.quantity
+
+
+def test_low_stock_index_follows_available_stock():
+    inventory = make_inventory(on_hand=5, threshold=3)
+    inventory.add_products(["P2", "P3"], [1, 50], [10, 10])
+    assert [item[0] for item in inventory.low_stock()] == ["P2"]
+    reservation = inventory.reserve("P1", 4)
+    assert [item[0] for item in inventory.low_stock()] == ["P2", "P1"]
+    inventory.release(reservation.id)
+    inventory.restock("P2", 20)
+    assert inventory.low_stock_count() == 0
+
+
+def test_listeners_receive_the_quantities_of_their_own_change():
+    inventory = make_inventory(on_hand=1000)
+    seen = []
+    inventory.subscribe(lambda product_id, on_hand, available, reason: seen.append((reason, on_hand)))
+
+    def buy():
+        for _ in range(50):
+            inventory.commit(inventory.reserve("P1", 1).id)
+
+    threads = [threading.Thread(target=buy) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    commits = [on_hand for reason, on_hand in seen if reason == "commit"]
+    assert commits == list(range(999, 799, -1))
+    assert inventory.on_hand("P1") == 800 and inventory.reserved("P1") == 0
@@ -0,0 +1,52 @@
+# 直播数据环形缓冲区测试：窗口读取、回绕，以及并发写入时时间轴与数据保持一致
+
+import os
+import sys
+import threading
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from live_metrics import LiveMetricsHub, RoomSeries  # noqa: E402
+
+
+def test_recent_after_wraparound():
+    series = RoomSeries("r1", capacity=5)
+    times, window = series.recent()
+    assert len(times) == 0 and window.shape == (3, 0)
+    for t in range(1, 13):
+        series.append(t, t * 10, 1, 2.5)
+    times, window = series.recent()
+    assert times.tolist() == [8, 9, 10, 11, 12]
+    assert window[0].tolist() == [80, 90, 100, 110, 120]
+    times, window = series.recent(2)
+    assert times.tolist() == [11, 12] and window[0].tolist() == [110, 120]
+    assert not window.flags.writeable
+    assert series.total_orders == 12 and series.latest()["viewers"] == 120
+
+
+def test_times_and_values_match_under_concurrent_writes():
+    hub = LiveMetricsHub(capacity=64)
+    series = hub.room("r1")
+    stop = threading.Event()
+
+    def writer():
+        t = 0
+        # 缓冲区为 float32，时间不超过 2**24 时可精确表示
+        while not stop.is_set() and t < 1 << 22:
+            t += 1
+            # 观众数写入时间本身，读取时可直接核对两者是否来自同一时刻
+            hub.ingest(t, ["r1"], [t], [0], [0.0])
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        for _ in range(5_000):
+            times, window = series.recent(32, copy=True)
+            assert len(times) == window.shape[1]
+            assert np.array_equal(times, window[0].astype(np.int64))
+    finally:
+        stop.set()
+        thread.join()
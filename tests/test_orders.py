@@ -0,0 +1,158 @@
+# 订单存储与订单索引测试：列式追加和重新打开、状态更新、组合查询（总数、游标翻页、订单号前缀）
+
+import os
+import subprocess
+import sys
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from data import PRODUCTS_DATA, generate_order_columns  # noqa: E402
+from order_query import OrderIndex  # noqa: E402
+from order_store import STATUS_KEYS, OrderStore, format_order_id, to_timestamp  # noqa: E402
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = OrderStore(str(tmp_path / "orders"))
+    for product in PRODUCTS_DATA:
+        store.encode("product", product["name"], create=True)
+    store.append_columns(generate_order_columns(10_000, seed=7))
+    return store
+
+
+def expected_rows(store, statuses=None, start=None, end=None, prefix=None):
+    """逐行筛选，按下单时间（同一时间按行号）倒序"""
+    dates = store.column("order_date")
+    keep = np.ones(len(store), dtype=bool)
+    if statuses:
+        keep &= np.isin(store.column("status"), [STATUS_KEYS.index(s) for s in statuses])
+    if start:
+        keep &= dates >= to_timestamp(datetime.combine(start, datetime.min.time()))
+    if end:
+        keep &= dates < to_timestamp(datetime.combine(end + timedelta(days=1), datetime.min.time()))
+    if prefix:
+        keep &= np.array([format_order_id(no).startswith(prefix) for no in store.column("order_no")])
+    rows = np.flatnonzero(keep)
+    return rows[np.lexsort((rows, dates[rows]))[::-1]]
+
+
+def all_pages(index, **filters):
+    rows, cursor = [], None
+    while True:
+        page = index.query(cursor=cursor, limit=700, **filters)
+        rows.extend(page.rows.tolist())
+        cursor = page.next_cursor
+        if cursor is None:
+            return rows, page.total
+
+
+def test_store_reopens_with_the_same_rows_and_money_in_cents(store, tmp_path):
+    reopened = OrderStore(str(tmp_path / "orders"))
+    assert len(reopened) == 10_000
+    assert np.array_equal(reopened.column("total_amount"), store.column("total_amount"))
+    assert reopened.column("total_amount").dtype == np.int64
+    record, = reopened.records([0])
+    assert record["order_id"] == "ORD000001"
+    assert record["total_amount"] == pytest.approx(record["unit_price"] * record["quantity"])
+
+
+def test_update_status_counts_duplicate_rows_once(store):
+    index = OrderIndex(store)
+    before = index.status_count("completed")
+    rows = np.flatnonzero(store.column("status") != STATUS_KEYS.index("completed"))[:10]
+    store.update_status(np.concatenate([rows, rows]), "completed")
+    assert index.status_count("completed") == before + 10
+    assert index.query(statuses="completed").total == before + 10
+
+
+@pytest.mark.parametrize("filters", [
+    {},
+    {"statuses": ["pending"]},
+    {"statuses": ["pending", "shipped"]},
+    {"start": date.today() - timedelta(days=10), "end": date.today() - timedelta(days=3)},
+    {"statuses": ["completed"], "start": date.today() - timedelta(days=20)},
+])
+def test_cursor_pages_cover_every_matching_order_once(store, filters):
+    rows, total = all_pages(OrderIndex(store), **filters)
+    expected = expected_rows(store, **filters)
+    assert total == len(expected)
+    assert rows == expected.tolist()
+
+
+def test_order_number_prefix(store):
+    index = OrderIndex(store)
+    rows, total = all_pages(index, id_prefix="ORD00001")
+    expected = expected_rows(store, prefix="ORD00001")
+    assert total == len(expected) and rows == expected.tolist()
+    # 省略 "ORD" 的纯数字同时精确匹配该编号
+    assert 41 in index.query(id_prefix="42", limit=1000).rows.tolist()
+    assert index.query(id_prefix="ORD").total == len(store)
+    assert index.query(id_prefix="abc").total == 0
+
+
+@pytest.mark.parametrize("statuses", [None, ["pending"]])
+def test_inverted_date_range_is_empty(store, statuses):
+    page = OrderIndex(store).query(
+        statuses=statuses, start=date.today(), end=date.today() - timedelta(days=5)
+    )
+    assert page.total == 0
+    assert len(page.rows) == 0 and page.next_cursor is None
+
+
+def test_appends_are_indexed(store):
+    index = OrderIndex(store)
+    total = index.query().total
+    store.append_columns(generate_order_columns(100, seed=8, start_no=len(store) + 1))
+    rows, count = all_pages(index)
+    assert count == total + 100
+    assert rows == expected_rows(store).tolist()
+
+
+APPEND_SCRIPT = """
+import sys
+sys.path.insert(0, sys.argv[1])
+from data import generate_order_columns
+from order_store import OrderStore
+store = OrderStore(sys.argv[2])
+start_no = int(sys.argv[3])
+for i in range(20):
+    store.append_columns(generate_order_columns(3, seed=i, start_no=start_no + 3 * i))
+"""
+
+
+def test_writers_in_several_processes_do_not_overwrite_each_other(store):
+    processes = [
+        subprocess.Popen([sys.executable, "-c", APPEND_SCRIPT, ROOT, store.path, str(100_000 * (i + 1))])
+        for i in range(2)
+    ]
+    for process in processes:
+        assert process.wait(60) == 0
+    reopened = OrderStore(store.path)
+    assert len(reopened) == 10_000 + 2 * 20 * 3
+    assert len(np.unique(reopened.column("order_no"))) == len(reopened)
+
+
+def test_index_is_rebuilt_after_another_writer_appended(store):
+    other = OrderStore(store.path)
+    index = OrderIndex(store)
+    other.append_columns(generate_order_columns(50, seed=9, start_no=20_001))
+    store.append_columns(generate_order_columns(5, seed=10, start_no=30_001))
+    assert len(store) == 10_055
+    rows, total = all_pages(index)
+    assert total == 10_055 and rows == expected_rows(store).tolist()
+
+
+def test_attached_replica_versions_follow_the_data_they_read(fresh_data, tmp_path, monkeypatch):
+    monkeypatch.setitem(fresh_data.DATASET_HOST, "path", str(tmp_path / "snapshots"))
+    fresh_data.publish_snapshot()
+    monkeypatch.setitem(fresh_data.DATASET_HOST, "attach", True)
+    orders, columns = fresh_data.data_version("orders"), fresh_data.data_version("order_columns")
+    fresh_data.place_order("P001", 1, customer_id=1)
+    # 订单索引和汇总读取本进程的订单存储，版本随本地下单变化；快照未重新发布前订单列版本不变
+    assert fresh_data.data_version("orders") != orders
+    assert fresh_data.data_version("order_columns") == columns
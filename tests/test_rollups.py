@@ -0,0 +1,68 @@
+# 订单汇总测试：增量维护的订单数和金额与直接扫描订单存储的结果一致，反复改状态后金额仍精确
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from data import PRODUCTS_DATA, generate_order_columns  # noqa: E402
+from order_store import STATUS_KEYS, OrderStore  # noqa: E402
+from records import from_cents  # noqa: E402
+from rollups import OrderRollups, period_of, period_start  # noqa: E402
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = OrderStore(str(tmp_path / "orders"))
+    for product in PRODUCTS_DATA:
+        store.encode("product", product["name"], create=True)
+    columns = generate_order_columns(5_000, seed=11)
+    # 生成的金额都是整元，换成带角分的金额才能暴露浮点累加误差
+    columns["total_amount"] = np.random.default_rng(11).integers(1, 100_000, size=5_000)
+    store.append_columns(columns)
+    return store
+
+
+def scanned_by_status(store):
+    statuses = store.column("status")
+    cents = store.column("total_amount").astype(np.int64)
+    values = store.dictionary("status")
+    return {
+        values[code]: (int((statuses == code).sum()), from_cents(int(cents[statuses == code].sum())))
+        for code in np.unique(statuses).tolist()
+    }
+
+
+def test_totals_stay_exact_after_many_status_moves(store):
+    rollups = OrderRollups(store)
+    rng = np.random.default_rng(3)
+    for _ in range(500):
+        rows = rng.choice(len(store), size=int(rng.integers(1, 20)), replace=False)
+        store.update_status(rows, STATUS_KEYS[rng.integers(len(STATUS_KEYS))])
+    cents = store.column("total_amount").astype(np.int64)
+    assert rollups.totals() == (len(store), from_cents(int(cents.sum())))
+    assert rollups.breakdown("status") == scanned_by_status(store)
+
+
+def test_append_is_counted_incrementally(store):
+    rollups = OrderRollups(store)
+    store.append_columns(generate_order_columns(1_000, seed=12, start_no=len(store) + 1))
+    rebuilt = OrderRollups(store)
+    assert rollups.totals() == rebuilt.totals()
+    assert rollups.breakdown("product") == rebuilt.breakdown("product")
+
+
+def test_series_matches_daily_sums(store):
+    rollups = OrderRollups(store)
+    starts, counts, amounts = rollups.series("day")
+    days = period_of("day", store.column("order_date"))
+    cents = store.column("total_amount").astype(np.int64)
+    for start, count, amount in zip(starts, counts.tolist(), amounts.tolist()):
+        day = [d for d in np.unique(days).tolist() if period_start("day", d) == start][0]
+        assert count == int((days == day).sum())
+        assert amount == from_cents(int(cents[days == day].sum()))
+    assert counts.sum() == len(store)
@@ -0,0 +1,36 @@
+# 系统设置页面测试：性能监控面板只对管理员角色显示
+
+import os
+import sys
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def settings_script():
+    from views.settings import render_system_settings
+
+    render_system_settings()
+
+
+def tab_labels(role=None):
+    app = AppTest.from_function(settings_script, default_timeout=60)
+    if role is not None:
+        app.session_state["current_role"] = role
+    app.run()
+    assert not app.exception, [e.value for e in app.exception]
+    return [tab.label for tab in app.tabs]
+
+
+def test_monitoring_tab_is_hidden_without_a_login():
+    assert "性能监控" not in tab_labels()
+
+
+def test_monitoring_tab_is_hidden_for_non_admin_roles():
+    assert "性能监控" not in tab_labels("客服人员")
+
+
+def test_monitoring_tab_is_shown_to_admins():
+    assert "性能监控" in tab_labels("管理员")
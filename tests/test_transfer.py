@@ -0,0 +1,90 @@
+# 批量导入导出测试：逐行校验和行号、分块导入、部分列重新导入只更新给出的列、订单流式导出
+
+import io
+import os
+import sys
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import data  # noqa: E402
+from transfer import PRODUCT_DEFAULTS, export_orders, import_products, validate_products  # noqa: E402
+
+HEADER = "产品编号,产品名称,产品分类,产品描述,产地,原价,现价,库存,产品特色\n"
+
+
+def csv_source(text):
+    return io.BytesIO(text.encode("utf-8"))
+
+
+def test_validate_reports_each_bad_row_with_file_line_numbers():
+    frame = pd.read_csv(io.StringIO(
+        HEADER
+        + "X1,好枣,特色干果,甜,阜平,30,25,10,个大、肉厚\n"
+        + "X2,,特色干果,,,30,25,10,\n"
+        + "X3,坏价,特色干果,,,20,25,10,\n"
+        + "X4,负库存,特色干果,,,30,25,-1,\n"
+        + "X5,小数库存,特色干果,,,30,25,1.5,\n"
+        + "X6,未知分类,电子产品,,,30,25,1,\n"
+        + "X7,非数字,特色干果,,,abc,25,1,\n"
+    ), dtype=str, keep_default_na=False)
+    products, errors = validate_products(frame, first_row=10)
+    assert [p["id"] for p in products] == ["X1"]
+    assert products[0]["features"] == ["个大", "肉厚"]
+    assert products[0]["stock"] == 10 and products[0]["current_price"] == 25.0
+    assert [line for line, _ in errors] == [11, 12, 13, 14, 15, 16]
+    reasons = dict(errors)
+    assert "name" in reasons[11] and "现价" in reasons[12] and "负数" in reasons[13]
+    assert "整数" in reasons[14] and "分类" in reasons[15] and "有效数字" in reasons[16]
+
+
+def test_import_in_chunks_counts_rows_and_errors():
+    rows = "".join(f"T{i},产品{i},特色干果,,,30,25,{i},\n" for i in range(25))
+    rows += "TBAD,坏,特色干果,,,30,25,-5,\n"
+    batches, progress = [], []
+    result = import_products(
+        csv_source(HEADER + rows), "products.csv",
+        lambda products, defaults: batches.append((len(products), defaults)),
+        chunk_size=10, progress=progress.append,
+    )
+    assert (result.rows, result.imported, result.error_count) == (26, 25, 1)
+    assert result.errors[0][0] == 27
+    assert [n for n, _ in batches] == [10, 10, 5]
+    assert all(defaults is PRODUCT_DEFAULTS for _, defaults in batches)
+    assert progress == [10, 20, 26]
+
+
+def test_reimport_with_fewer_columns_keeps_the_others(fresh_data):
+    first = import_products(
+        csv_source(HEADER + "N1,新枣,特色干果,原描述,阜平县城南庄,30,25,10,个大\n"),
+        "products.csv", data.upsert_products,
+    )
+    assert first.imported == 1
+    catalog = data.get_product_catalog()
+    assert catalog.get("N1")["description"] == "原描述"
+
+    second = import_products(
+        csv_source("产品编号,产品名称,产品分类,原价,现价,库存\nN1,新枣,特色干果,32,28,40\n"),
+        "products.csv", data.upsert_products,
+    )
+    assert second.imported == 1
+    product = data.get_product_catalog().get("N1")
+    assert product["current_price"] == 28.0 and product["stock"] == 40
+    assert product["description"] == "原描述"
+    assert product["origin"] == "阜平县城南庄"
+    assert list(product["features"]) == ["个大"]
+    assert data.get_inventory().available("N1") == 40
+
+
+def test_export_orders_streams_filtered_rows(fresh_data, tmp_path):
+    data.get_order_index()
+    for _ in range(3):
+        data.place_order("P001", 1, customer_id=1)
+    path = str(tmp_path / "orders.csv")
+    count = export_orders(path, data.get_order_index(), data.get_order_store(), chunk_size=2, statuses=["pending"])
+    frame = pd.read_csv(path, encoding="utf-8-sig")
+    assert count == len(frame)
+    assert set(frame["状态"]) == {"待确认"}
+    assert frame["下单时间"].is_monotonic_decreasing
@@ -0,0 +1,266 @@
+# 智播农链销售平台批量导入导出
+#
+# 导入：按块流式读取 CSV / Excel / Parquet 产品表，每块按 PRODUCTS_DATA 的字段结构和
+# PRODUCT_CATEGORIES 向量化校验，合格的行按批次写入（upsert），不合格的行记录行号和原因。
+# 导出：按筛选条件用订单索引的游标逐页读取订单，逐块生成 CSV 文本，不一次性加载全部结果。
+# Excel 需要 openpyxl，Parquet 需要 pyarrow，未安装时给出提示。
+
+import csv
+import io
+import os
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from config import ORDER_STATUS, PRODUCT_CATEGORIES, TRANSFER
+from order_store import STATUS_KEYS
+from records import from_cents
+
+# 产品字段：字段名 -> (类型, 是否必填, 默认值)
+PRODUCT_SCHEMA = {
+    "id": ("str", False, ""),
+    "name": ("str", True, None),
+    "category": ("str", True, None),
+    "description": ("str", False, ""),
+    "origin": ("str", False, "河北保定阜平"),
+    "specification": ("str", False, ""),
+    "original_price": ("float", True, None),
+    "current_price": ("float", True, None),
+    "stock": ("int", True, None),
+    "sales": ("int", False, 0),
+    "rating": ("float", False, 5.0),
+    "image": ("str", False, "📦"),
+    "features": ("list", False, ""),
+    "nutrition": ("str", False, ""),
+}
+
+# 新产品缺少的可选列取这些默认值；已存在的产品只更新文件中给出的列
+PRODUCT_DEFAULTS = {name: default for name, (_, required, default) in PRODUCT_SCHEMA.items() if not required}
+
+# 表头别名（合作社常用的中文表头）
+COLUMN_ALIASES = {
+    "产品编号": "id",
+    "产品名称": "name",
+    "产品分类": "category",
+    "分类": "category",
+    "产品描述": "description",
+    "描述": "description",
+    "产地": "origin",
+    "规格": "specification",
+    "原价": "original_price",
+    "现价": "current_price",
+    "库存": "stock",
+    "库存数量": "stock",
+    "销量": "sales",
+    "评分": "rating",
+    "产品图标": "image",
+    "图标": "image",
+    "产品特色": "features",
+    "特色": "features",
+    "营养价值": "nutrition",
+}
+
+FORMATS = {".csv": "csv", ".xlsx": "excel", ".xlsm": "excel", ".parquet": "parquet"}
+
+# 订单导出表头
+EXPORT_COLUMNS = ["订单号", "客户", "电话", "商品", "数量", "单价", "总额", "状态", "地址", "下单时间"]
+
+
+@dataclass
+class ImportResult:
+    """导入结果"""
+
+    rows: int = 0
+    imported: int = 0
+    errors: list = field(default_factory=list)  # [(行号, 原因)]，最多 TRANSFER["max_errors"] 条
+    error_count: int = 0
+
+    def add_errors(self, errors):
+        self.error_count += len(errors)
+        room = TRANSFER["max_errors"] - len(self.errors)
+        if room > 0:
+            self.errors.extend(errors[:room])
+
+
+def detect_format(filename):
+    fmt = FORMATS.get(os.path.splitext(filename or "")[1].lower())
+    if fmt is None:
+        raise ValueError(f"不支持的文件格式: {filename}（支持 {', '.join(FORMATS)}）")
+    return fmt
+
+
+def read_chunks(source, filename, chunk_size=None):
+    """按块读取表格文件，逐块产出 DataFrame（所有列为字符串）"""
+    chunk_size = chunk_size or TRANSFER["chunk_size"]
+    fmt = detect_format(filename)
+    if fmt == "csv":
+        yield from pd.read_csv(source, chunksize=chunk_size, dtype=str, keep_default_na=False,
+                               encoding="utf-8-sig")
+    elif fmt == "excel":
+        try:
+            import openpyxl
+        except ImportError:
+            raise ImportError("读取 Excel 文件需要安装 openpyxl") from None
+        workbook = openpyxl.load_workbook(source, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = [str(name).strip() if name is not None else "" for name in next(rows, ())]
+            block = []
+            for row in rows:
+                block.append(["" if value is None else str(value) for value in row])
+                if len(block) >= chunk_size:
+                    yield pd.DataFrame(block, columns=header)
+                    block = []
+            if block:
+                yield pd.DataFrame(block, columns=header)
+        finally:
+            workbook.close()
+    else:
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("读取 Parquet 文件需要安装 pyarrow") from None
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas().astype(str).replace({"None": "", "nan": ""})
+
+
+def normalize_columns(frame):
+    """统一表头：去除空白，中文别名转为字段名"""
+    frame = frame.rename(columns=lambda name: COLUMN_ALIASES.get(str(name).strip(), str(name).strip()))
+    missing = [name for name, (_, required, _) in PRODUCT_SCHEMA.items() if required and name not in frame]
+    if missing:
+        raise ValueError(f"缺少必填列: {', '.join(missing)}")
+    return frame
+
+
+def validate_products(frame, first_row=2):
+    """校验一块产品数据，返回 (合格产品字典列表, [(行号, 原因)])
+
+    产品字典只包含文件中给出的列（缺少的可选列按默认值参与校验）；
+    first_row 为该块第一行在文件中的行号（表头为第 1 行）。
+    """
+    frame = normalize_columns(frame)
+    provided = [name for name in PRODUCT_SCHEMA if name in frame]
+    n = len(frame)
+    reasons = np.full(n, "", dtype=object)
+
+    def reject(mask, reason):
+        mask = np.asarray(mask) & (reasons == "")
+        reasons[mask] = reason
+
+    values = {}
+    for name, (kind, required, default) in PRODUCT_SCHEMA.items():
+        if name in frame:
+            column = frame[name].fillna("").astype(str).str.strip()
+        else:
+            column = pd.Series([""] * n, index=frame.index)
+        blank = (column == "").to_numpy()
+        if required:
+            reject(blank, f"{name} 不能为空")
+        if kind in ("float", "int"):
+            number = pd.to_numeric(column.where(~blank, None), errors="coerce")
+            if default is not None:
+                number = number.where(~blank, default)
+            reject(number.isna().to_numpy(), f"{name} 不是有效数字")
+            reject((number < 0).to_numpy(), f"{name} 不能为负数")
+            if kind == "int":
+                reject((number.fillna(0) % 1 != 0).to_numpy(), f"{name} 必须为整数")
+            values[name] = number.to_numpy()
+        elif kind == "list":
+            values[name] = column.str.split(r"[,，、]").to_numpy()
+        else:
+            values[name] = column.where(~blank, default).to_numpy()
+
+    reject(~frame["category"].astype(str).str.strip().isin(PRODUCT_CATEGORIES).to_numpy(),
+           f"分类不在 {'/'.join(PRODUCT_CATEGORIES)} 中")
+    reject(values["current_price"] > values["original_price"], "现价不能高于原价")
+    reject(values["rating"] > 5, "评分不能超过 5")
+
+    products = []
+    for i in np.flatnonzero(reasons == ""):
+        product = {name: values[name][i] for name in provided}
+        if "features" in product:
+            product["features"] = [f.strip() for f in product["features"] if f.strip()]
+        for name in provided:
+            kind = PRODUCT_SCHEMA[name][0]
+            if kind == "int":
+                product[name] = int(product[name])
+            elif kind == "float":
+                product[name] = float(product[name])
+        products.append(product)
+    errors = [(first_row + int(i), reasons[i]) for i in np.flatnonzero(reasons != "")]
+    return products, errors
+
+
+def import_products(source, filename, upsert, chunk_size=None, progress=None):
+    """流式导入产品文件
+
+    upsert(产品列表, 新产品默认值) 负责批量写入；progress(已处理行数) 在每块处理后调用。
+    """
+    result = ImportResult()
+    for chunk in read_chunks(source, filename, chunk_size):
+        products, errors = validate_products(chunk, first_row=result.rows + 2)
+        if products:
+            upsert(products, PRODUCT_DEFAULTS)
+        result.rows += len(chunk)
+        result.imported += len(products)
+        result.add_errors(errors)
+        if progress is not None:
+            progress(result.rows)
+    return result
+
+
+def order_frame(store, rows):
+    """指定行的订单导出表（按列向量化构建，不逐行生成字典）"""
+    rows = np.asarray(rows, dtype=np.int64)
+
+    def column(name):
+        return store.column(name)[rows]
+
+    statuses = np.asarray([ORDER_STATUS[key] for key in STATUS_KEYS], dtype=object)
+    townships = np.asarray(store.dictionary("township"), dtype=object)
+    return pd.DataFrame({
+        "订单号": "ORD" + pd.Series(column("order_no")).astype(str).str.zfill(6),
+        "客户": "客户" + pd.Series(column("customer_id")).astype(str),
+        "电话": "138****" + pd.Series(column("phone")).astype(str),
+        "商品": store.decode("product", column("product")),
+        "数量": column("quantity"),
+        "单价": from_cents(column("unit_price")),
+        "总额": from_cents(column("total_amount")),
+        "状态": statuses[column("status")],
+        "地址": "保定市阜平县" + pd.Series(townships[column("township")]),
+        "下单时间": pd.to_datetime(column("order_date"), unit="s").strftime("%Y-%m-%d %H:%M:%S"),
+    }, columns=EXPORT_COLUMNS)
+
+
+def iter_orders_csv(index, store, chunk_size=None, **filters):
+    """按筛选条件逐块产出订单 CSV 文本（第一块带 BOM 和表头，按下单时间倒序）
+
+    filters 与 OrderIndex.query 的参数相同（statuses/start/end/id_prefix）。
+    """
+    chunk_size = chunk_size or TRANSFER["chunk_size"]
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(EXPORT_COLUMNS)
+    yield "\ufeff" + buffer.getvalue()
+    cursor = None
+    while True:
+        page = index.query(cursor=cursor, limit=chunk_size, **filters)
+        if len(page.rows):
+            yield order_frame(store, page.rows).to_csv(index=False, header=False)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+
+def export_orders(path, index, store, chunk_size=None, **filters):
+    """把筛选后的订单流式写入 CSV 文件，返回写入的订单数"""
+    count = 0
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+        for i, text in enumerate(iter_orders_csv(index, store, chunk_size, **filters)):
+            f.write(text)
+            if i:
+                count += text.count("\n")
+    os.replace(tmp_path, path)
+    return count
@@ -0,0 +1,48 @@
+# 智播农链销售平台页面模块
+#
+# 每个导航页面是 views 包中的一个模块，按 NAVIGATION_MENU 的页面名登记在 PAGE_MODULES 中。
+# 页面模块及其依赖（绘图库、分析模块、批量导入导出等）在首次打开该页面时才导入，
+# 启动时只加载侧边栏和默认页面用到的部分。首次导入耗时记录在 import_times 中，
+# 同时作为 "import/页面名" 区段写入性能剖析注册表。
+
+import importlib
+import sys
+import threading
+import time
+
+from profiling import registry
+
+# 页面名 -> (模块, 渲染函数)，键与 NAVIGATION_MENU 一致
+PAGE_MODULES = {
+    "首页仪表板": ("views.dashboard", "render_dashboard"),
+    "数字人直播": ("views.live_streaming", "render_live_streaming"),
+    "产品管理": ("views.products", "render_product_management"),
+    "AI客服": ("views.customer_service", "render_ai_customer_service"),
+    "订单管理": ("views.orders", "render_order_management"),
+    "数据分析": ("views.analysis", "render_data_analysis"),
+    "系统设置": ("views.settings", "render_system_settings"),
+}
+
+# 页面名 -> 页面模块首次导入耗时（秒）
+import_times = {}
+
+_import_lock = threading.Lock()
+
+
+def page_renderer(page):
+    """页面名 -> 渲染函数（页面模块在首次调用时导入）"""
+    try:
+        module_name, func_name = PAGE_MODULES[page]
+    except KeyError:
+        raise KeyError(f"未登记页面模块的页面: {page}") from None
+    module = sys.modules.get(module_name)
+    if module is None:
+        with _import_lock:
+            module = sys.modules.get(module_name)
+            if module is None:
+                wall_start, cpu_start = time.perf_counter(), time.thread_time()
+                module = importlib.import_module(module_name)
+                wall, cpu = time.perf_counter() - wall_start, time.thread_time() - cpu_start
+                import_times[page] = wall
+                registry.record(f"import/{page}", wall, cpu)
+    return getattr(module, func_name)
@@ -0,0 +1,233 @@
+# 智播农链销售平台数据分析页面
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from charts import cached_figure
+from config import CATALOG, CUSTOMER_ANALYTICS, FORECAST, SALES_RANGE_OPTIONS
+from customer_analytics import RFM_SEGMENTS, cohort_retention, rfm_scores, spend_distribution
+from data import (data_version, get_customer_summary, get_forecast_engine, get_order_columns, get_product_catalog,
+                  get_sales_forecast, get_sales_rollup, get_sales_trend)
+from profiling import profile_section, profiled
+from records import records_frame
+
+# 数据分析中心
+@profiled()
+def render_data_analysis():
+    st.header("📊 数据分析中心")
+    
+    tab1, tab2, tab3, tab4 = st.tabs(["销售分析", "产品分析", "客户分析", "趋势预测"])
+    
+    with tab1, profile_section("render_data_analysis/销售分析"):
+        st.subheader("💰 销售数据分析")
+        
+        # 销售趋势（服务端降采样，任意时间范围发送到浏览器的点数都有上限）
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            range_label = st.radio("时间范围", list(SALES_RANGE_OPTIONS), index=2, horizontal=True)
+        with col2:
+            metric_label = st.selectbox("指标", ["销售额", "订单数", "客户数"])
+        days = SALES_RANGE_OPTIONS[range_label]
+        metric = {"销售额": "sales_amount", "订单数": "orders", "客户数": "customers"}[metric_label]
+        
+        def build_sales_trend():
+            dates, values, total_points = get_sales_trend(days, metric)
+            return px.line(
+                x=dates,
+                y=values,
+                title=f"{range_label}{metric_label}趋势（逐小时，显示 {len(values):,}/{total_points:,} 个点）",
+                labels={'x': '时间', 'y': metric_label}
+            )
+        
+        fig1 = cached_figure(
+            "analysis/sales_trend", (data_version('sales'), days, metric), build_sales_trend
+        )
+        st.plotly_chart(fig1, use_container_width=True)
+        
+        # 销售指标（读取前缀和）
+        sales_rollup = get_sales_rollup()
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("月度销售额", f"¥{sales_rollup.total('sales_amount', 30):,.0f}")
+        with col2:
+            st.metric("月度订单数", f"{sales_rollup.total('orders', 30):,.0f}")
+        with col3:
+            st.metric("月度客户数", f"{sales_rollup.total('customers', 30):,.0f}")
+        with col4:
+            st.metric("平均客单价", f"¥{sales_rollup.mean('avg_order_value', 30):.2f}")
+    
+    with tab2, profile_section("render_data_analysis/产品分析"):
+        st.subheader("📦 产品销售分析")
+        
+        # 产品销售排行（只在产品变化后重新构建；产品较多时只取销量前 CATALOG['chart_products'] 个）
+        def products_frame():
+            products, _ = get_product_catalog().query(
+                sort_by='sales', descending=True, limit=CATALOG['chart_products']
+            )
+            return records_frame(products, ('name', 'category', 'current_price', 'rating', 'sales'))
+        
+        version = data_version('products')
+        fig2 = cached_figure("analysis/product_sales", version, lambda: px.bar(
+            products_frame(),
+            x='name',
+            y='sales',
+            title='产品销售排行',
+            color='sales',
+            color_continuous_scale='viridis'
+        ))
+        st.plotly_chart(fig2, use_container_width=True)
+        
+        # 产品评分分析
+        fig3 = cached_figure("analysis/price_rating", version, lambda: px.scatter(
+            products_frame(),
+            x='current_price',
+            y='rating',
+            size='sales',
+            color='category',
+            title='产品价格vs评分关系',
+            hover_data=['name']
+        ))
+        st.plotly_chart(fig3, use_container_width=True)
+    
+    with tab3, profile_section("render_data_analysis/客户分析"):
+        st.subheader("👥 客户行为分析")
+        
+        # 模拟客户数据（只在订单变化后重新统计）
+        version = data_version('order_columns')
+        
+        # 客户地区分布
+        def build_regions():
+            orders, dictionaries = get_order_columns(['township'])
+            townships = dictionaries['township']
+            region_counts = pd.Series(
+                np.bincount(orders['township'], minlength=len(townships)), index=townships
+            )
+            region_counts = region_counts[region_counts > 0].sort_values(ascending=False)
+            return px.pie(
+                values=region_counts.values,
+                names=region_counts.index,
+                title='客户地区分布'
+            )
+        
+        fig4 = cached_figure("customers/regions", version, build_regions)
+        st.plotly_chart(fig4, use_container_width=True)
+        
+        # 客户购买力分析（区间边界见 CUSTOMER_ANALYTICS['spend_bins']）
+        summary = get_customer_summary()
+        spend_bins = CUSTOMER_ANALYTICS['spend_bins']
+        
+        def build_spending():
+            distribution = spend_distribution(summary['monetary'].to_numpy(), spend_bins)
+            return px.bar(
+                x=distribution.index,
+                y=distribution.values,
+                title='客户消费水平分布',
+                labels={'x': '消费金额区间(元)', 'y': '客户数量'}
+            )
+        
+        fig5 = cached_figure("customers/spending", (version, tuple(spend_bins)), build_spending)
+        st.plotly_chart(fig5, use_container_width=True)
+        
+        # RFM 客户分群
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("客户数", f"{len(summary):,}")
+        with col2:
+            repeat_rate = (summary['orders'] > 1).mean() if len(summary) else 0
+            st.metric("复购率", f"{repeat_rate:.1%}")
+        with col3:
+            st.metric("人均消费", f"¥{summary['monetary'].mean() if len(summary) else 0:,.2f}")
+        
+        def build_rfm():
+            rfm = rfm_scores(summary, quantiles=CUSTOMER_ANALYTICS['rfm_quantiles'])
+            segments = rfm['segment'].value_counts().reindex(RFM_SEGMENTS[::-1], fill_value=0)
+            return px.bar(
+                x=segments.index,
+                y=segments.values,
+                title='RFM 客户分群',
+                labels={'x': '客户分群', 'y': '客户数量'}
+            )
+        
+        fig6 = cached_figure("customers/rfm", version, build_rfm)
+        st.plotly_chart(fig6, use_container_width=True)
+        
+        # 复购队列（按首购月份）
+        cohort_months = CUSTOMER_ANALYTICS['cohort_months']
+        
+        def build_cohorts():
+            orders, _ = get_order_columns(['customer_id', 'order_date'])
+            cohorts = cohort_retention(orders['customer_id'], orders['order_date'], months=cohort_months)
+            return px.imshow(
+                cohorts[list(range(cohort_months))],
+                labels={'x': '首购后第几个月', 'y': '首购月份', 'color': '复购比例'},
+                title='复购队列留存',
+                text_auto='.0%',
+                aspect='auto',
+                color_continuous_scale='Greens'
+            )
+        
+        fig7 = cached_figure("customers/cohorts", (version, cohort_months), build_cohorts)
+        st.plotly_chart(fig7, use_container_width=True)
+    
+    with tab4, profile_section("render_data_analysis/趋势预测"):
+        st.subheader("🔮 销售趋势预测")
+        
+        # 产品×乡镇 逐日销售额的 Holt-Winters 预测（模型按天增量更新）
+        col1, col2 = st.columns(2)
+        with col1:
+            horizon = st.selectbox("预测天数", FORECAST['horizon_options'], format_func=lambda d: f"未来 {d} 天")
+        labels, start_day, history, predicted = get_sales_forecast(horizon)
+        engine = get_forecast_engine()
+        
+        if predicted is None or not labels:
+            st.info("暂无足够的历史订单用于预测")
+            return
+        
+        product_names = list(dict.fromkeys(product for product, _ in labels))
+        with col2:
+            product = st.selectbox("产品", ["全部产品", *product_names])
+        rows = np.arange(len(labels)) if product == "全部产品" else np.array(
+            [i for i, (name, _) in enumerate(labels) if name == product]
+        )
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("预测序列数", f"{len(rows):,}")
+        with col2:
+            st.metric(f"未来{horizon}天预测销售额", f"¥{predicted[rows].sum():,.0f}")
+        with col3:
+            st.metric("近7天实际销售额", f"¥{history[rows, -7:].sum():,.0f}")
+        st.caption(f"模型已拟合 {engine.days} 天数据 · 参数拟合 {engine.stats['fits']} 次 · "
+                   f"增量更新 {engine.stats['updates']} 次")
+        
+        def build_forecast():
+            days = history.shape[1]
+            shown = min(days, FORECAST['history_days'])
+            dates = np.datetime64(start_day, 'D') + np.arange(days - shown, days + horizon)
+            if product == "全部产品":
+                series = {"合计": (history[:, -shown:].sum(axis=0), predicted.sum(axis=0))}
+            else:
+                series = {labels[i][1]: (history[i, -shown:], predicted[i]) for i in rows}
+            fig = go.Figure()
+            for name, (actual, future) in series.items():
+                fig.add_trace(go.Scatter(x=dates[:shown], y=actual, mode='lines', name=f"{name} 实际"))
+                fig.add_trace(go.Scatter(x=dates[shown:], y=future, mode='lines', name=f"{name} 预测",
+                                         line={'dash': 'dash'}))
+            fig.update_layout(title=f"{product}逐日销售额预测", xaxis_title='日期', yaxis_title='销售额 (元)')
+            return fig
+        
+        fig8 = cached_figure("analysis/forecast", (engine.version, horizon, product), build_forecast)
+        st.plotly_chart(fig8, use_container_width=True)
+        
+        # 预测销售额最高的 产品×乡镇
+        totals = predicted[rows].sum(axis=1)
+        top = rows[np.argsort(totals)[::-1][:10]]
+        st.dataframe(pd.DataFrame({
+            "产品": [labels[i][0] for i in top],
+            "乡镇": [labels[i][1] for i in top],
+            f"未来{horizon}天预测(元)": predicted[top].sum(axis=1).round(2),
+            "近7天实际(元)": history[top, -7:].sum(axis=1).round(2),
+        }), use_container_width=True, hide_index=True)
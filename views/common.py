@@ -0,0 +1,15 @@
+# 智播农链销售平台页面公共组件
+
+import streamlit as st
+
+from config import EVENT_BUS
+
+# 局部刷新：支持 fragment 的 Streamlit 版本中，被装饰的区域按 EVENT_BUS['refresh_seconds']
+# 单独重跑（不重跑整个页面），数据由 refresh_on 按事件主题版本缓存；旧版本中随页面一起刷新
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+
+def auto_refresh(func):
+    if _fragment is None:
+        return func
+    return _fragment(run_every=EVENT_BUS['refresh_seconds'])(func)
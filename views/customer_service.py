@@ -0,0 +1,169 @@
+# 智播农链销售平台AI客服页面
+
+import html
+from datetime import date, datetime, time, timedelta
+
+import streamlit as st
+
+from chat_store import ChatSession
+from config import CHAT_STORE, FAQ_SEARCH
+from data import add_faq, get_chat_store, get_faq_data, get_faq_index
+from fragments import CHAT_MESSAGE, emit
+from list_view import paginate
+from profiling import profile_section, profiled
+
+GREETING = {"role": "assistant", "content": "您好！我是智播农链的AI客服小助手，很高兴为您服务！请问有什么可以帮助您的吗？"}
+
+
+def chat_session():
+    """当前浏览器会话的对话窗口"""
+    if 'chat_session' not in st.session_state:
+        st.session_state.chat_session = ChatSession(
+            get_chat_store(), "访客", CHAT_STORE['window'], CHAT_STORE['max_chars']
+        )
+    return st.session_state.chat_session
+
+
+def render_messages(messages):
+    """把一组消息合并为一个 HTML 元素输出"""
+    emit("\n".join(CHAT_MESSAGE[m["role"]].render_one(m) for m in messages))
+
+
+# AI客服系统
+@profiled()
+def render_ai_customer_service():
+    st.header("🤖 AI客服系统")
+    
+    tab1, tab2, tab3 = st.tabs(["智能客服", "问答库管理", "对话记录"])
+    
+    with tab1, profile_section("render_ai_customer_service/智能客服"):
+        st.subheader("💬 智能客服对话")
+        
+        # 会话内存只保留最近的消息窗口，完整记录写入对话记录库
+        session = chat_session()
+        customer = st.text_input("客户称呼", value=session.customer)
+        if customer and customer != session.customer:
+            session.restart(customer)
+        
+        # 更早的消息按需分页读取
+        if session.dropped and st.checkbox(f"查看更早的 {session.dropped} 条消息"):
+            store = get_chat_store()
+            
+            def fetch_older(offset, limit):
+                rows, _ = store.history(session.conversation_id, offset + len(session.messages), limit)
+                return rows[::-1], session.dropped
+            
+            older, _ = paginate("chat_older", fetch_older, session.conversation_id, CHAT_STORE['page_size'])
+            render_messages(older)
+        
+        # 显示聊天窗口（整段合并为一个元素输出）
+        render_messages(([GREETING] if session.dropped == 0 else []) + list(session.messages))
+        
+        # 用户输入
+        user_input = st.text_input("请输入您的问题:", placeholder="例如：阜平大枣的保质期是多久？")
+        
+        if st.button("发送") and user_input:
+            # 检索问答库
+            matches = get_faq_index().search(
+                user_input,
+                top_k=FAQ_SEARCH['top_k'],
+                min_score=FAQ_SEARCH['min_score']
+            )
+            response = "抱歉，我没有找到相关信息。您可以联系人工客服获得更详细的帮助。"
+            if matches:
+                response = matches[0].answer
+                if len(matches) > 1:
+                    related = "、".join(html.escape(m.question) for m in matches[1:])
+                    response += f"<br><small>相关问题：{related}</small>"
+            
+            session.add({"role": "user", "content": user_input}, {"role": "assistant", "content": response})
+            st.rerun()
+        
+        # 快速问题按钮
+        st.subheader("🔍 常见问题快速咨询")
+        faq_data = get_faq_data()
+        
+        col1, col2 = st.columns(2)
+        for i, faq in enumerate(faq_data):
+            with col1 if i % 2 == 0 else col2:
+                if st.button(faq["question"], key=f"faq_{i}"):
+                    session.add({"role": "user", "content": faq["question"]},
+                                {"role": "assistant", "content": faq["answer"]})
+                    st.rerun()
+    
+    with tab2, profile_section("render_ai_customer_service/问答库管理"):
+        st.subheader("📚 问答库管理")
+        
+        faq_data = get_faq_data()
+        
+        # 按分类显示FAQ
+        categories = list(set([faq["category"] for faq in faq_data]))
+        
+        for category in categories:
+            st.markdown(f"### {category}")
+            category_faqs = [faq for faq in faq_data if faq["category"] == category]
+            
+            for faq in category_faqs:
+                with st.expander(faq["question"]):
+                    st.write(faq["answer"])
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        if st.button("编辑", key=f"edit_faq_{faq['question'][:10]}"):
+                            st.info("编辑功能开发中...")
+                    with col2:
+                        if st.button("删除", key=f"delete_faq_{faq['question'][:10]}"):
+                            st.warning("删除功能开发中...")
+        
+        # 添加新问答
+        st.markdown("### ➕ 添加新问答")
+        with st.form("add_faq_form"):
+            new_question = st.text_input("问题")
+            new_answer = st.text_area("答案")
+            new_category = st.selectbox("分类", categories + ["新分类"])
+            
+            if new_category == "新分类":
+                new_category = st.text_input("输入新分类名称")
+            
+            if st.form_submit_button("添加问答"):
+                if new_question and new_answer and new_category:
+                    add_faq(new_question, new_answer, new_category)
+                    st.success("问答添加成功！")
+                else:
+                    st.error("请填写所有字段")
+    
+    with tab3, profile_section("render_ai_customer_service/对话记录"):
+        st.subheader("🗂️ 历史对话查询")
+        
+        store = get_chat_store()
+        col1, col2 = st.columns(2)
+        with col1:
+            customer = st.text_input("按客户查询", placeholder="客户称呼，留空为全部客户").strip()
+        with col2:
+            days = st.date_input("日期范围", value=(date.today() - timedelta(days=30), date.today()))
+        start = end = None
+        if isinstance(days, (tuple, list)) and days:
+            start = datetime.combine(days[0], time.min).timestamp()
+            end = datetime.combine(days[-1] + timedelta(days=1), time.min).timestamp()
+        
+        conversations, total = paginate(
+            "chat_search",
+            lambda offset, limit: store.search(customer or None, start, end, offset, limit),
+            (customer, start, end),
+            CHAT_STORE['page_size']
+        )
+        if not conversations:
+            st.info("没有符合条件的对话")
+            return
+        
+        def describe(conversation):
+            started = datetime.fromtimestamp(conversation["started_at"]).strftime("%Y-%m-%d %H:%M")
+            return f"{started} · {conversation['customer']} · {conversation['messages']} 条消息"
+        
+        selected = st.selectbox("查看对话", conversations, format_func=describe)
+        transcript, _ = paginate(
+            "chat_transcript",
+            lambda offset, limit: store.history(selected["id"], offset, limit),
+            selected["id"],
+            CHAT_STORE['page_size']
+        )
+        render_messages(transcript[::-1])
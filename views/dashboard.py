@@ -0,0 +1,96 @@
+# 智播农链销售平台首页仪表板页面
+
+from datetime import datetime, timedelta
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from charts import cached_figure
+from config import PLATFORM_INFO
+from data import (data_version, get_announcements, get_live_rooms, get_order_rollups, get_product_catalog,
+                  get_quick_stats)
+from fragments import ANNOUNCEMENT_CARD, LIVE_ROOM_CARD, PRODUCT_RANK_CARD, cached_fragment, emit
+from profiling import profiled
+from views.common import auto_refresh
+
+HEADER = f"""
+    <div class="header-title">{PLATFORM_INFO['name']}</div>
+    <div class="header-subtitle">{PLATFORM_INFO['subtitle']}</div>
+    """
+
+# 首页仪表板
+@auto_refresh
+@profiled()
+def render_dashboard_metrics():
+    # 读取订单汇总
+    stats = get_quick_stats()
+    rollups = get_order_rollups()
+    now = datetime.now()
+    today_sales = stats['today_sales']
+    _, yesterday_sales = rollups.cell('day', now - timedelta(days=1))
+    _, month_sales = rollups.cell('month', now)
+    _, last_month_sales = rollups.cell('month', now.replace(day=1) - timedelta(days=1))
+    
+    def growth(current, previous):
+        return f"{(current - previous) / previous:+.1%}" if previous else None
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("今日销售额", f"¥{today_sales:,.0f}", growth(today_sales, yesterday_sales))
+    with col2:
+        st.metric("本月销售额", f"¥{month_sales:,.0f}", growth(month_sales, last_month_sales))
+    with col3:
+        st.metric("在线直播间", stats['rooms'])
+    with col4:
+        st.metric("总观看人数", f"{stats['viewers']:,}")
+
+@profiled()
+def render_dashboard():
+    emit(HEADER)
+    
+    # 核心指标（局部刷新）
+    render_dashboard_metrics()
+    
+    live_rooms = get_live_rooms()
+    rollups = get_order_rollups()
+    now = datetime.now()
+    
+    # 销售趋势图
+    st.subheader("📈 销售趋势分析")
+    
+    # 最近30天的每日订单销售额（读取订单汇总）
+    def build_sales_trend():
+        dates, _, amounts = rollups.series('day', last=30)
+        # 直接用 graph_objects 构建：plotly.express 会先把数据转成 pandas DataFrame，首屏不必加载 pandas
+        fig = go.Figure(go.Scatter(x=dates, y=amounts, mode='lines'))
+        fig.update_layout(title="最近30天销售趋势", xaxis_title='日期', yaxis_title='销售额 (元)')
+        return fig
+    
+    fig = cached_figure("dashboard/sales_trend", (data_version('orders'), now.date()), build_sales_trend)
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # 产品销售排行
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("🏆 热销产品排行")
+        
+        def build_top_products():
+            top_products, _ = get_product_catalog().query(sort_by='sales', descending=True, limit=5)
+            return PRODUCT_RANK_CARD.render(top_products, rank=range(1, len(top_products) + 1))
+        
+        emit(cached_fragment("dashboard/top_products", data_version('products'), build_top_products))
+    
+    with col2:
+        st.subheader("🎭 直播间状态")
+        # 观众数和销售额实时变化，直接以卡片上显示的值作为版本
+        rooms_version = tuple((room['id'], room['viewers'], room['sales']) for room in live_rooms)
+        emit(cached_fragment("dashboard/live_rooms", rooms_version, lambda: LIVE_ROOM_CARD.render(live_rooms)))
+    
+    # 公告滚动
+    st.subheader("📢 平台公告")
+    emit(cached_fragment(
+        "dashboard/announcements", data_version('announcements'),
+        lambda: ANNOUNCEMENT_CARD.render(get_announcements())
+    ))
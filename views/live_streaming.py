@@ -0,0 +1,146 @@
+# 智播农链销售平台数字人直播页面
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from charts import cached_figure
+from config import DIGITAL_AVATARS, LIVE_METRICS
+from data import get_live_metrics, get_live_rooms, get_product_catalog
+from fragments import LIVE_ROOM_STATUS_CARD, emit
+from profiling import profile_section, profiled
+from script_engine import render_batch, render_script, room_product_jobs
+
+# 数字人直播管理
+@profiled()
+def render_live_streaming():
+    st.header("🎭 数字人直播管理")
+    
+    tab1, tab2, tab3 = st.tabs(["直播间管理", "数字人设置", "直播数据"])
+    
+    with tab1, profile_section("render_live_streaming/直播间管理"):
+        st.subheader("📺 直播间列表")
+        live_rooms = get_live_rooms()
+        
+        for room in live_rooms:
+            col1, col2, col3 = st.columns([2, 1, 1])
+            
+            with col1:
+                emit(LIVE_ROOM_STATUS_CARD.render_one(room))
+            
+            with col2:
+                if st.button(f"进入直播间", key=f"enter_{room['id']}"):
+                    st.success(f"正在进入{room['title']}...")
+            
+            with col3:
+                if st.button(f"管理设置", key=f"manage_{room['id']}"):
+                    st.info(f"正在打开{room['title']}设置...")
+    
+    with tab2, profile_section("render_live_streaming/数字人设置"):
+        st.subheader("🤖 数字人形象设置")
+        
+        selected_avatar = st.selectbox(
+            "选择数字人形象",
+            list(DIGITAL_AVATARS.keys()),
+            format_func=lambda x: f"{DIGITAL_AVATARS[x]['name']} ({DIGITAL_AVATARS[x]['gender']})"
+        )
+        
+        avatar_info = DIGITAL_AVATARS[selected_avatar]
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown(f"""
+            **基本信息:**
+            - 姓名: {avatar_info['name']}
+            - 性别: {avatar_info['gender']}
+            - 年龄: {avatar_info['age']}
+            - 专长: {avatar_info['speciality']}
+            - 语音: {avatar_info['voice']}
+            """)
+            
+            st.markdown(f"""
+            **形象描述:**
+            {avatar_info['description']}
+            """)
+        
+        with col2:
+            st.markdown("**直播脚本生成**")
+            product_name = st.text_input("产品名称", "阜平大枣")
+            script_style = st.selectbox("脚本风格", ["亲切自然", "专业权威", "幽默风趣"])
+            
+            if st.button("生成直播脚本"):
+                product = get_product_catalog().find_name(product_name) or {"name": product_name}
+                script = render_script(selected_avatar, product, script_style)
+                st.text_area("生成的直播脚本", script, height=150)
+            
+            if st.button("批量生成全部直播间脚本"):
+                catalog = get_product_catalog()
+                jobs = room_product_jobs(get_live_rooms(), catalog.products(range(len(catalog))), script_style)
+                scripts, stats = render_batch(jobs)
+                st.success(
+                    f"共 {stats['total']} 个脚本，新生成 {stats['rendered']} 个，"
+                    f"缓存命中 {stats['cached']} 个"
+                )
+                st.dataframe(
+                    pd.DataFrame(
+                        [(room_id, product_id, len(script)) for (room_id, product_id), script in scripts.items()],
+                        columns=['直播间', '产品', '脚本字数']
+                    ),
+                    use_container_width=True
+                )
+    
+    with tab3, profile_section("render_live_streaming/直播数据"):
+        st.subheader("📊 直播数据分析")
+        
+        # 直播数据图表
+        rooms = live_rooms
+        room_names = [room['title'] for room in rooms]
+        viewers = [room['viewers'] for room in rooms]
+        sales = [room['sales'] for room in rooms]
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            fig1 = cached_figure("live/viewers", (tuple(room_names), tuple(viewers)), lambda: px.bar(
+                x=room_names,
+                y=viewers,
+                title="各直播间观众数量",
+                labels={'x': '直播间', 'y': '观众数量'}
+            ))
+            st.plotly_chart(fig1, use_container_width=True)
+        
+        with col2:
+            fig2 = cached_figure("live/sales_share", (tuple(room_names), tuple(sales)), lambda: px.pie(
+                values=sales,
+                names=room_names,
+                title="各直播间销售额占比"
+            ))
+            st.plotly_chart(fig2, use_container_width=True)
+        
+        # 实时时间线（直接读取环形缓冲区视图）
+        minutes = st.slider("时间范围（分钟）", 1, LIVE_METRICS['window_seconds'] // 60, 10)
+        metric = st.radio("指标", ["观众数", "订单数", "成交额"], horizontal=True)
+        metric_index = ["观众数", "订单数", "成交额"].index(metric)
+        hub = get_live_metrics()
+        
+        def build_timeline():
+            fig = go.Figure()
+            for room in rooms:
+                times, window = hub.room(room['id']).recent(minutes * 60)
+                fig.add_trace(go.Scatter(
+                    x=pd.to_datetime(times, unit='s'),
+                    y=window[metric_index],
+                    mode='lines',
+                    name=room['title']
+                ))
+            return fig
+        
+        # 同一秒内的所有会话共用一次构建结果
+        last_times = tuple(hub.room(room['id']).last_time for room in rooms)
+        fig3 = cached_figure(
+            "live/timeline", (minutes, metric, last_times), build_timeline,
+            title=f"最近{minutes}分钟{metric}走势"
+        )
+        st.plotly_chart(fig3, use_container_width=True)
@@ -0,0 +1,153 @@
+# 智播农链销售平台订单管理页面
+
+import os
+from datetime import datetime, timedelta
+
+import plotly.express as px
+import streamlit as st
+
+from charts import cached_figure
+from config import ORDER_STATUS, PAGINATION, TRANSFER
+from data import data_version, get_order_index, get_order_rollups, get_order_store, query_orders
+from list_view import pager_controls
+from profiling import profile_section, profiled
+from transfer import export_orders, order_frame
+
+# 订单管理系统
+@profiled()
+def render_order_management():
+    st.header("📋 订单管理系统")
+    
+    tab1, tab2 = st.tabs(["订单列表", "订单统计"])
+    
+    with tab1, profile_section("render_order_management/订单列表"):
+        st.subheader("📝 订单列表")
+        
+        store = get_order_store()
+        
+        # 筛选选项
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            status_filter = st.selectbox("订单状态", ["全部"] + list(ORDER_STATUS.values()))
+        with col2:
+            date_filter = st.date_input("起始日期", datetime.now() - timedelta(days=30))
+        with col3:
+            search_order = st.text_input("搜索订单号")
+        
+        # 订单查询（状态 + 日期范围 + 订单号前缀，游标分页）
+        status_keys = None
+        if status_filter != "全部":
+            status_keys = tuple(k for k, v in ORDER_STATUS.items() if v == status_filter)
+        filters = (status_filter, date_filter, search_order)
+        if st.session_state.get('order_filters') != filters:
+            st.session_state.order_filters = filters
+            st.session_state.order_cursors = [None]
+        
+        cursors = st.session_state.order_cursors
+        
+        # 导出筛选后的订单（流式写入文件）
+        if st.button("导出筛选结果"):
+            os.makedirs(TRANSFER['export_dir'], exist_ok=True)
+            path = os.path.join(TRANSFER['export_dir'], f"orders-{datetime.now():%Y%m%d%H%M%S}.csv")
+            count = export_orders(
+                path, get_order_index(), store,
+                statuses=status_keys, start=date_filter, end=datetime.now(), id_prefix=search_order
+            )
+            st.session_state.order_export = (path, count)
+        export = st.session_state.get('order_export')
+        if export and os.path.exists(export[0]):
+            with open(export[0], "rb") as f:
+                st.download_button(f"下载导出文件（{export[1]:,} 个订单）", f,
+                                   file_name=os.path.basename(export[0]), mime="text/csv")
+        page = query_orders(
+            statuses=status_keys,
+            start=date_filter,
+            id_prefix=search_order,
+            cursor=cursors[-1],
+            limit=PAGINATION['page_size']
+        )
+        
+        step = pager_controls(
+            "order_page",
+            f"共 {page.total} 个订单 · 第 {len(cursors)} 页",
+            len(cursors) > 1,
+            page.next_cursor is not None and len(cursors) < PAGINATION['max_pages']
+        )
+        if step < 0:
+            cursors.pop()
+            st.rerun()
+        elif step > 0:
+            cursors.append(page.next_cursor)
+            st.rerun()
+        
+        # 显示订单（当前页合并为一个表格）
+        orders = order_frame(store, page.rows)
+        if len(orders):
+            st.dataframe(
+                orders[["订单号", "状态", "客户", "电话", "商品", "数量", "单价", "总额", "下单时间", "地址"]],
+                use_container_width=True, hide_index=True
+            )
+            
+            # 操作按钮（对选中的订单）
+            col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
+            with col1:
+                i = st.selectbox("选择订单", range(len(orders)), format_func=lambda i: orders['订单号'].iat[i])
+            order_id = orders['订单号'].iat[i]
+            with col2:
+                if st.button("查看详情", key="view_order"):
+                    st.info(f"查看订单 {order_id} 详情...")
+            with col3:
+                if st.button("更新状态", key="update_order"):
+                    st.info(f"更新订单 {order_id} 状态...")
+            with col4:
+                if st.button("联系客户", key="contact_order"):
+                    st.info(f"联系客户 {orders['客户'].iat[i]}...")
+        else:
+            st.info("没有符合条件的订单")
+    
+    with tab2, profile_section("render_order_management/订单统计"):
+        st.subheader("📊 订单统计分析")
+        
+        rollups = get_order_rollups()
+        
+        # 订单状态统计
+        status_counts = {
+            ORDER_STATUS[key]: count
+            for key, (count, _) in rollups.breakdown('status').items() if count > 0
+        }
+        
+        version = data_version('orders')
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            fig1 = cached_figure("orders/status", version, lambda: px.pie(
+                values=list(status_counts.values()),
+                names=list(status_counts.keys()),
+                title="订单状态分布"
+            ))
+            st.plotly_chart(fig1, use_container_width=True)
+        
+        with col2:
+            # 每日订单统计
+            def build_order_trend():
+                dates, counts, _ = rollups.series('day', last=30)  # 最近30天
+                return px.line(
+                    x=dates,
+                    y=counts,
+                    title="最近30天订单趋势"
+                )
+            
+            fig2 = cached_figure("orders/trend", (version, datetime.now().date()), build_order_trend)
+            st.plotly_chart(fig2, use_container_width=True)
+        
+        # 核心指标
+        total_orders, total_amount = rollups.totals()
+        avg_order_value = total_amount / total_orders if total_orders > 0 else 0
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("总订单数", total_orders)
+        with col2:
+            st.metric("总销售额", f"¥{total_amount:,.2f}")
+        with col3:
+            st.metric("平均订单价值", f"¥{avg_order_value:.2f}")
@@ -0,0 +1,184 @@
+# 智播农链销售平台产品管理页面
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from charts import cached_figure
+from config import CATALOG, INVENTORY, PAGINATION, PRODUCT_CATEGORIES, PRODUCT_SORT_OPTIONS
+from data import data_version, get_inventory, get_product_catalog, search_products, upsert_products
+from fragments import LOW_STOCK_ALERT, PRODUCT_CARD, emit
+from list_view import paginate, render_cards
+from profiling import profile_section, profiled
+from transfer import PRODUCT_DEFAULTS, import_products, validate_products
+
+# 产品管理系统
+@profiled()
+def render_product_management():
+    st.header("📦 产品管理系统")
+    
+    tab1, tab2, tab3 = st.tabs(["产品列表", "添加产品", "库存管理"])
+    
+    with tab1, profile_section("render_product_management/产品列表"):
+        st.subheader("📋 产品列表")
+        
+        # 搜索和筛选
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            search_term = st.text_input("搜索产品", placeholder="输入名称、描述、特色或营养...")
+        with col2:
+            category_filter = st.selectbox("筛选分类", ["全部"] + PRODUCT_CATEGORIES)
+        with col3:
+            sort_option = st.selectbox("排序方式", list(PRODUCT_SORT_OPTIONS))
+        
+        sort_by, descending = PRODUCT_SORT_OPTIONS[sort_option]
+        products, total = paginate(
+            "product_page",
+            lambda offset, limit: search_products(search_term, category_filter, sort_by, descending, offset, limit),
+            (search_term, category_filter, sort_option)
+        )
+        
+        # 产品展示（当前页合并为一个元素）
+        render_cards(products, PRODUCT_CARD)
+        
+        if products:
+            col1, col2, col3 = st.columns([2, 1, 1])
+            with col1:
+                selected = st.selectbox("选择产品", products, format_func=lambda p: f"{p['id']} {p['name']}")
+            with col2:
+                if st.button("编辑", key="edit_product"):
+                    st.info(f"正在编辑{selected['name']}...")
+            with col3:
+                if st.button("删除", key="delete_product"):
+                    st.warning(f"确认删除{selected['name']}？")
+    
+    with tab2, profile_section("render_product_management/添加产品"):
+        st.subheader("➕ 添加新产品")
+        
+        with st.form("add_product_form"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                product_name = st.text_input("产品名称*")
+                category = st.selectbox("产品分类*", PRODUCT_CATEGORIES)
+                origin = st.text_input("产地*", value="河北保定阜平")
+                specification = st.text_input("规格*", placeholder="如：500g/袋")
+            
+            with col2:
+                original_price = st.number_input("原价*", min_value=0.0, step=0.1)
+                current_price = st.number_input("现价*", min_value=0.0, step=0.1)
+                stock = st.number_input("库存数量*", min_value=0, step=1)
+                image_emoji = st.text_input("产品图标", placeholder="输入emoji，如：🍎")
+            
+            description = st.text_area("产品描述*", height=100)
+            nutrition = st.text_area("营养价值", height=80)
+            features = st.text_input("产品特色", placeholder="用逗号分隔，如：有机种植,无添加,传统工艺")
+            
+            submitted = st.form_submit_button("添加产品")
+            
+            if submitted:
+                if product_name and category and original_price and current_price:
+                    products, errors = validate_products(pd.DataFrame([{
+                        "name": product_name,
+                        "category": category,
+                        "origin": origin,
+                        "specification": specification,
+                        "original_price": original_price,
+                        "current_price": current_price,
+                        "stock": stock,
+                        "image": image_emoji,
+                        "description": description,
+                        "nutrition": nutrition,
+                        "features": features
+                    }]))
+                    if errors:
+                        st.error(errors[0][1])
+                    else:
+                        product_id, = upsert_products(products, PRODUCT_DEFAULTS)
+                        st.success(f"产品 '{product_name}' 添加成功！编号：{product_id}")
+                        st.balloons()
+                else:
+                    st.error("请填写所有必填项（标*的字段）")
+        
+        # 批量导入（CSV / Excel / Parquet，按块校验和写入）
+        st.subheader("📥 批量导入产品")
+        st.caption(f"表头可用字段名或中文名（如 产品名称、分类、原价、现价、库存），分类须为：{'、'.join(PRODUCT_CATEGORIES)}；"
+                   "已存在的产品编号只更新文件中给出的列")
+        uploaded = st.file_uploader("选择产品文件", type=["csv", "xlsx", "parquet"])
+        if uploaded is not None and st.button("开始导入"):
+            progress = st.empty()
+            try:
+                result = import_products(
+                    uploaded, uploaded.name, upsert_products,
+                    progress=lambda rows: progress.caption(f"已处理 {rows:,} 行...")
+                )
+            except (ImportError, ValueError) as e:
+                st.error(f"导入失败：{e}")
+            else:
+                st.success(f"共 {result.rows:,} 行，成功导入 {result.imported:,} 个产品，{result.error_count:,} 行未通过校验")
+                if result.errors:
+                    st.dataframe(pd.DataFrame(result.errors, columns=["行号", "原因"]), hide_index=True)
+    
+    with tab3, profile_section("render_product_management/库存管理"):
+        st.subheader("📊 库存管理")
+        
+        catalog = get_product_catalog()
+        inventory = get_inventory()
+        
+        # 库存预警（读取低库存索引，按缺口从大到小）
+        low_count = inventory.low_stock_count()
+        if low_count:
+            st.warning(f"⚠️ 有 {low_count} 个产品可售库存低于补货阈值，请及时补货！")
+            
+            product_ids, available, thresholds = zip(*inventory.low_stock(PAGINATION['page_size']))
+            emit(LOW_STOCK_ALERT.render_columns({
+                'name': [catalog.get(product_id)['name'] for product_id in product_ids],
+                'available': available,
+                'threshold': thresholds,
+            }))
+            if low_count > PAGINATION['page_size']:
+                st.caption(f"仅显示缺口最大的 {PAGINATION['page_size']} 个产品")
+        
+        # 补货与阈值设置
+        low_items = inventory.low_stock(1)
+        default_id = low_items[0][0] if low_items else (str(catalog.column('id')[0]) if len(catalog) else "")
+        col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
+        with col1:
+            product_id = st.text_input("产品编号", value=default_id)
+        product = catalog.get(product_id.strip())
+        with col2:
+            restock_quantity = st.number_input("补货数量", min_value=0, step=10)
+        with col3:
+            threshold = st.number_input(
+                "补货阈值", min_value=0, step=10,
+                value=inventory.threshold(product['id']) if product else INVENTORY['default_threshold'],
+                key=f"threshold_{product_id}"
+            )
+        with col4:
+            save = st.button("保存库存设置", disabled=product is None)
+        if product is None:
+            st.caption("未找到该产品编号")
+        else:
+            st.caption(f"{product['name']}：在库 {inventory.on_hand(product['id'])} 件，"
+                       f"已预留 {inventory.reserved(product['id'])} 件，可售 {inventory.available(product['id'])} 件")
+            if save:
+                if restock_quantity:
+                    inventory.restock(product['id'], restock_quantity)
+                inventory.set_threshold(product['id'], threshold)
+                st.rerun()
+        
+        # 库存统计图表（产品较多时只显示库存最少的 CATALOG['chart_products'] 个）
+        def build_stock():
+            products, total = catalog.query(sort_by='stock', descending=False, limit=CATALOG['chart_products'])
+            stock_levels = [p['stock'] for p in products]
+            return px.bar(
+                x=[p['name'] for p in products],
+                y=stock_levels,
+                title="产品库存水平" if total <= len(products) else f"库存最少的 {len(products)} 个产品",
+                labels={'x': '产品', 'y': '库存数量'},
+                color=stock_levels,
+                color_continuous_scale='RdYlGn'
+            )
+        
+        fig = cached_figure("products/stock", data_version('products'), build_stock)
+        st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,258 @@
+# 智播农链销售平台系统设置页面
+
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from charts import figure_cache_stats
+from config import EVENT_BUS, PAGINATION, PLATFORM_INFO, PROFILING, REFRESH_INTERVAL
+from data import start_load_simulator
+from events import bus
+from fragments import fragment_cache_stats
+from profiling import profile_section, profiled, registry
+from views import import_times
+
+# 系统设置
+@profiled()
+def render_system_settings():
+    st.header("⚙️ 系统设置")
+    
+    tab_names = ["基本设置", "用户管理", "帮助文档"]
+    # 性能监控仅对管理员显示（current_role 由登录流程写入会话，未登录按 default_role 处理）
+    is_admin = st.session_state.get('current_role', PROFILING['default_role']) in PROFILING['admin_roles']
+    if is_admin and PROFILING['enabled']:
+        tab_names.append("性能监控")
+    tabs = st.tabs(tab_names)
+    tab1, tab2, tab3 = tabs[:3]
+    
+    with tab1, profile_section("render_system_settings/基本设置"):
+        st.subheader("🔧 基本设置")
+        
+        with st.form("basic_settings"):
+            st.markdown("**平台信息设置**")
+            platform_name = st.text_input("平台名称", value=PLATFORM_INFO['name'])
+            platform_location = st.text_input("服务地区", value=PLATFORM_INFO['location'])
+            
+            st.markdown("**系统参数设置**")
+            refresh_interval = st.slider("数据刷新间隔(秒)", 10, 300, REFRESH_INTERVAL)
+            page_size = st.slider("每页显示条数", 5, 50, PAGINATION['page_size'])
+            
+            st.markdown("**通知设置**")
+            email_notifications = st.checkbox("启用邮件通知", value=True)
+            sms_notifications = st.checkbox("启用短信通知", value=True)
+            
+            if st.form_submit_button("保存设置"):
+                st.success("设置已保存！")
+    
+    with tab2, profile_section("render_system_settings/用户管理"):
+        st.subheader("👤 用户权限管理")
+        
+        # 模拟用户数据
+        users = [
+            {"username": "admin", "role": "管理员", "status": "活跃", "last_login": "2024-01-01 10:00"},
+            {"username": "operator1", "role": "运营人员", "status": "活跃", "last_login": "2024-01-01 09:30"},
+            {"username": "service1", "role": "客服人员", "status": "活跃", "last_login": "2024-01-01 08:45"},
+        ]
+        
+        for user in users:
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.write(f"**{user['username']}**")
+            with col2:
+                st.write(user['role'])
+            with col3:
+                st.write(user['status'])
+            with col4:
+                if st.button(f"管理", key=f"manage_user_{user['username']}"):
+                    st.info(f"管理用户 {user['username']}")
+        
+        st.markdown("---")
+        st.subheader("➕ 添加新用户")
+        with st.form("add_user"):
+            col1, col2 = st.columns(2)
+            with col1:
+                new_username = st.text_input("用户名")
+                new_role = st.selectbox("角色", ["管理员", "运营人员", "客服人员"])
+            with col2:
+                new_password = st.text_input("密码", type="password")
+                new_email = st.text_input("邮箱")
+            
+            if st.form_submit_button("添加用户"):
+                if new_username and new_password:
+                    st.success(f"用户 {new_username} 添加成功！")
+                else:
+                    st.error("请填写用户名和密码")
+    
+    with tab3, profile_section("render_system_settings/帮助文档"):
+        st.subheader("📖 帮助文档")
+        
+        help_sections = [
+            {
+                "title": "🏠 首页仪表板使用指南",
+                "content": """
+                首页仪表板是平台的核心控制中心，提供以下功能：
+                - 实时查看销售数据和关键指标
+                - 监控直播间状态和观众数据
+                - 查看热销产品排行榜
+                - 浏览平台最新公告和活动信息
+                """
+            },
+            {
+                "title": "🎭 数字人直播管理",
+                "content": """
+                数字人直播功能帮助农户轻松开展直播带货：
+                - 选择合适的数字人形象和语音
+                - 自动生成产品介绍脚本
+                - 设置直播间背景和商品展示
+                - 实时监控直播数据和销售情况
+                """
+            },
+            {
+                "title": "📦 产品管理系统",
+                "content": """
+                产品管理系统提供完整的商品管理功能：
+                - 添加、编辑、删除产品信息
+                - 管理产品图片和详细描述
+                - 设置价格策略和库存管理
+                - 查看产品销售数据和用户评价
+                """
+            },
+            {
+                "title": "🤖 AI客服系统",
+                "content": """
+                AI客服系统提供24小时智能客服支持：
+                - 自动回答常见问题
+                - 支持多轮对话和上下文理解
+                - 管理问答知识库
+                - 无法解答时转接人工客服
+                """
+            }
+        ]
+        
+        for section in help_sections:
+            with st.expander(section["title"]):
+                st.markdown(section["content"])
+        
+        st.markdown("---")
+        st.markdown(f"""
+        **技术支持联系方式:**
+        - 客服热线: 400-123-4567
+        - 邮箱: support@zhibonongchain.com
+        - 工作时间: 9:00-18:00 (周一至周五)
+        
+        **平台版本:** {PLATFORM_INFO['version']}
+        """)
+    
+    if len(tabs) > 3:
+        with tabs[3], profile_section("render_system_settings/性能监控"):
+            render_profiling_panel()
+
+# 性能监控面板
+def render_profiling_panel():
+    st.subheader("⏱️ 性能监控")
+    
+    # 冷启动与页面模块首次导入耗时
+    startup = registry.startup()
+    if startup is not None:
+        st.caption(
+            f"冷启动（首次打开{startup['page']}）: 共 {startup['wall'] * 1000:,.0f} ms，"
+            f"其中模块导入 {startup['imports'] * 1000:,.0f} ms"
+        )
+    if import_times:
+        st.caption("页面模块首次导入: " + " · ".join(
+            f"{page} {seconds * 1000:,.0f} ms" for page, seconds in import_times.items()
+        ))
+    
+    reruns = registry.recent_reruns()
+    st.caption(f"最近 {len(reruns)} 次页面运行中平均耗时最长的区段")
+    
+    rows = registry.slowest_sections()
+    if rows:
+        st.dataframe(
+            pd.DataFrame(rows).rename(columns={
+                'section': '区段',
+                'calls': '调用次数',
+                'wall_ms_total': '总耗时(ms)',
+                'wall_ms_mean': '平均耗时(ms)',
+                'wall_ms_max': '最长耗时(ms)',
+                'cpu_ms_total': 'CPU时间(ms)'
+            }).round(2),
+            use_container_width=True
+        )
+    else:
+        st.info("暂无性能数据")
+    
+    if reruns:
+        st.markdown("**最近页面运行**")
+        st.dataframe(
+            pd.DataFrame([
+                {
+                    "时间": datetime.fromtimestamp(rerun['started_at']).strftime('%H:%M:%S'),
+                    "页面": rerun['page'],
+                    "耗时(ms)": round(rerun['wall'] * 1000, 2)
+                }
+                for rerun in reversed(reruns)
+            ]),
+            use_container_width=True
+        )
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            "导出 Prometheus 指标",
+            registry.to_prometheus(),
+            file_name="metrics.prom",
+            mime="text/plain"
+        )
+    with col2:
+        if st.button("清空统计"):
+            registry.reset()
+            st.rerun()
+    
+    # 事件总线与负载模拟
+    st.markdown("**事件总线**")
+    counts = bus.counts()
+    cols = st.columns(len(counts))
+    for col, (topic, count) in zip(cols, counts.items()):
+        with col:
+            st.metric(topic, f"{count:,}")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        load_rate = st.number_input("模拟写入速率（次/秒）", min_value=1, max_value=5000,
+                                    value=EVENT_BUS['load_orders_per_second'])
+    with col2:
+        load_seconds = st.number_input("模拟时长（秒）", min_value=1, max_value=600, value=30)
+    with col3:
+        simulation = st.session_state.get('load_simulation')
+        running = simulation is not None and not simulation.done()
+        if st.button("启动负载模拟", disabled=running):
+            st.session_state.load_simulation = start_load_simulator(load_rate, load_seconds)
+            st.rerun()
+    if running:
+        st.caption("负载模拟运行中...")
+    elif simulation is not None:
+        st.caption(f"上次负载模拟共执行 {simulation.result():,} 次写入")
+    
+    events = bus.recent(10)
+    if events:
+        st.dataframe(
+            pd.DataFrame([
+                {
+                    "时间": datetime.fromtimestamp(event.time).strftime('%H:%M:%S'),
+                    "主题": event.topic,
+                    "内容": ", ".join(f"{k}={v}" for k, v in event.payload.items())
+                }
+                for event in events
+            ]),
+            use_container_width=True
+        )
+    
+    figures = figure_cache_stats()
+    st.caption(f"图表缓存: {figures['size']} 个图表 · 命中 {figures['hits']} 次 · 未命中 {figures['misses']} 次")
+    fragments = fragment_cache_stats()
+    st.caption(f"片段缓存: {fragments['size']} 个片段 · 命中 {fragments['hits']} 次 · 未命中 {fragments['misses']} 次")
+    
+    if PROFILING['metrics_port']:
+        st.caption(f"Prometheus 抓取地址: http://<服务器地址>:{PROFILING['metrics_port']}/metrics")